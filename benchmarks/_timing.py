@@ -0,0 +1,44 @@
+"""
+Small timing helpers shared by the benchmark scripts in this directory.
+
+The scripts are run directly (e.g. `python benchmarks/bench_lookup_tables.py`)
+with the package installed (`pip install -e .`), so this module is importable
+as a sibling of the script.
+"""
+
+import timeit
+
+from typing import Callable
+
+
+def per_call_ns(func: Callable[[], object], number: int=100_000, repeat: int=5) -> float:
+    """
+    Returns the best per-call time of `func` in nanoseconds.
+
+    Args:
+        func (Callable[[], object]):
+            A zero argument callable to time.
+        number (int):
+            How many calls make up a single timing run.
+        repeat (int):
+            How many timing runs to make, the fastest is kept.
+
+    Returns:
+        float:
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return best / number * 1e9
+
+
+def print_comparison(rows: list[tuple[str, float, float]]) -> None:
+    """
+    Prints a before/after table of per-call timings.
+
+    Args:
+        rows (list[tuple[str, float, float]]):
+            (label, before ns, after ns) for each benchmark.
+    """
+    print(f"{'benchmark':<32}{'before (ns)':>14}{'after (ns)':>14}{'speedup':>10}")
+
+    for label, before, after in rows:
+        print(f"{label:<32}{before:>14.1f}{after:>14.1f}{before / after:>9.1f}x")
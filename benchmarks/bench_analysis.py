@@ -0,0 +1,72 @@
+"""
+Benchmark for the process-pool corpus analyzer.
+
+Writes a synthetic collection of songs (chord charts and note lists as text,
+and melodies as a binary corpus), then analyses it with 1 worker (in
+process) and with process pools of 2, 4, ... up to every core, reporting
+the speedup and scaling efficiency of each, and checking every run gives
+the same statistics.
+
+Usage:
+    python benchmarks/bench_analysis.py [songs] [shard_kb]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from music_theory.analysis import analyze
+from music_theory.corpus import write_corpus
+from music_theory.key_detection import KEYS
+
+def _write_songs(directory: str, songs: int, rng: random.Random) -> list[str]:
+    charts = os.path.join(directory, "charts.txt")
+    melodies = os.path.join(directory, "melodies.txt")
+    corpus = os.path.join(directory, "melodies.mtc")
+
+    with open(charts, "w", encoding="utf-8") as f:
+        for _ in range(songs):
+            key = rng.choice(KEYS)
+            pool = list(key.chords().values()) + list(key.dominant_chords().values())[:2]
+            f.write(" ".join(str(rng.choice(pool)) for _ in range(rng.randint(4, 32))) + "\n")
+
+    scales = [key.pitch_classes.to_notes() for key in KEYS]
+
+    with open(melodies, "w", encoding="utf-8") as f:
+        for _ in range(songs):
+            notes = rng.choice(scales)
+            f.write(" ".join(rng.choice(notes).name for _ in range(rng.randint(50, 300))) + "\n")
+
+    write_corpus(corpus, (rng.choices(rng.choice(scales), k=rng.randint(50, 300)) for _ in range(songs)))
+    return [charts, melodies, corpus]
+
+def main(songs: int=20_000, shard_kb: int=256):
+    rng = random.Random(0)
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, *(2 ** i for i in range(1, cores.bit_length() + 1) if 2 ** i <= cores), cores})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_songs(tmp, songs, rng)
+        size = sum(os.path.getsize(p) for p in paths)
+        print(f"{3 * songs:,} songs, {size / 1e6:.1f} MB, {cores} cores")
+        print(f"{'workers':>8}{'time (s)':>10}{'songs/s':>12}{'speedup':>9}{'efficiency':>12}")
+
+        baseline, expected = None, None
+
+        for workers in counts:
+            start = time.perf_counter()
+            stats = analyze(paths, workers, shard_kb * 1024)
+            elapsed = time.perf_counter() - start
+
+            baseline = baseline or elapsed
+            expected = expected or stats
+            assert stats == expected
+
+            speedup = baseline / elapsed
+            print(f"{workers:>8}{elapsed:>10.2f}{stats.songs / elapsed:>12,.0f}{speedup:>8.2f}x{speedup / workers:>11.0%}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""
+Throughput benchmark for the `music_theory.batch` module.
+
+Times transposition, interval distances and note parsing over a long
+synthetic melody, comparing a loop over the scalar functions against a
+single batch call. Reports notes processed per second for each.
+
+Usage:
+    python benchmarks/bench_batch.py [num_notes]
+"""
+
+import random
+import sys
+import time
+
+from music_theory import batch
+from music_theory.intervals import Interval, interval_distance
+from music_theory.notes import Note, transpose
+
+
+def throughput(func, num_notes: int, repeat: int=3) -> float:
+    """
+    Returns the best notes per second of `func` over `repeat` runs.
+    """
+    best = min(_elapsed(func) for _ in range(repeat))
+    return num_notes / best
+
+def _elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main(num_notes: int=500_000):
+    rng = random.Random(0)
+    melody = [rng.choice(list(Note)) for _ in range(num_notes)]
+    shifted = melody[1:] + melody[:1]
+    tokens = [rng.choice(["C", "c#", "Eb", "f##", "Gbb", "A", "bb"]) for _ in range(num_notes)]
+
+    pcs, shifted_pcs = batch.from_notes(melody), batch.from_notes(shifted)
+
+    rows = [
+        ("transpose",
+            throughput(lambda: [transpose(n, Interval.P4, "down") for n in melody], num_notes),
+            throughput(lambda: batch.transpose(pcs, Interval.P4, "down"), num_notes)),
+        ("interval_distance",
+            throughput(lambda: [interval_distance(a, b) for a, b in zip(melody, shifted)], num_notes),
+            throughput(lambda: batch.interval_distance(pcs, shifted_pcs), num_notes)),
+        ("parse notes",
+            throughput(lambda: [Note.from_string(t) for t in tokens], num_notes),
+            throughput(lambda: batch.parse_notes(tokens), num_notes)),
+    ]
+
+    backend = "numpy" if batch.HAS_NUMPY else "array('B')"
+    print(f"{num_notes:,} notes, batch backend: {backend}")
+    print(f"{'operation':<20}{'scalar notes/s':>18}{'batch notes/s':>18}{'speedup':>10}")
+
+    for label, scalar, bulk in rows:
+        print(f"{label:<20}{scalar:>18,.0f}{bulk:>18,.0f}{bulk / scalar:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,82 @@
+"""
+Benchmark for the binary melody corpus.
+
+Writes a synthetic corpus as text (one song of note names per line) and in
+the binary format, then detects the key of every song from each: by parsing
+each line with `notes_from_string` and calling `detect_key`, and by counting
+notes straight from the memory-mapped corpus.
+
+Usage:
+    python benchmarks/bench_corpus.py [songs] [notes_per_song]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from music_theory.corpus import Corpus, write_corpus
+from music_theory.key_detection import detect_key
+from music_theory.note_sequence import NoteSequence
+from music_theory.notes import NOTES, notes_from_string
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def _text_keys(path):
+    with open(path, encoding="utf-8") as f:
+        return [detect_key(notes_from_string(line)) for line in f]
+
+def _corpus_keys(path):
+    with Corpus(path) as corpus:
+        return list(corpus.detect_keys())
+
+def main(songs: int=20_000, notes_per_song: int=500):
+    rng = random.Random(0)
+    melodies = [bytes(rng.choice((0, 2, 4, 5, 7, 9, 11)) for _ in range(notes_per_song)) for _ in range(songs)]
+    total = songs * notes_per_song
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "songs.txt")
+        corpus_path = os.path.join(tmp, "songs.mtc")
+
+        with open(text_path, "w", encoding="utf-8") as f:
+            for melody in melodies:
+                f.write(" ".join(NOTES[v].name for v in melody) + "\n")
+
+        _, write_time = _timed(lambda: write_corpus(corpus_path, (NoteSequence.from_bytes(m) for m in melodies)))
+
+        print(f"{songs:,} songs, {total:,} notes")
+        print(f"text file      {os.path.getsize(text_path) / 1e6:>8.1f} MB")
+        print(f"corpus file    {os.path.getsize(corpus_path) / 1e6:>8.1f} MB  (written at {total / write_time / 1e6:.1f}M notes/s)")
+        print()
+
+        _, open_time = _timed(lambda: Corpus(corpus_path).close())
+        print(f"open + validate  {open_time * 1e3:>8.1f} ms")
+
+        text_keys, text_time = _timed(lambda: _text_keys(text_path))
+        corpus_keys, corpus_time = _timed(lambda: _corpus_keys(corpus_path))
+        assert text_keys == corpus_keys
+
+        print(f"keys from text   {text_time:>8.2f} s  ({total / text_time / 1e6:.1f}M notes/s)")
+        print(f"keys from corpus {corpus_time:>8.2f} s  ({total / corpus_time / 1e6:.1f}M notes/s, {text_time / corpus_time:.1f}x)")
+
+        with Corpus(corpus_path) as corpus:
+            _, histogram_time = _timed(corpus.histogram)
+            print(f"corpus histogram {histogram_time * 1e3:>8.1f} ms  ({total / histogram_time / 1e6:.0f}M notes/s)")
+
+            tracemalloc.start()
+            for index in range(len(corpus)):
+                corpus.detect_key(index)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print(f"peak memory while analysing the corpus: {peak / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
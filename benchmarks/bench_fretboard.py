@@ -0,0 +1,63 @@
+"""
+Micro-benchmark for the precomputed fretboard.
+
+Compares computing a note from the tuning on every call (the previous
+`note_at_fret`) and scanning every string and fret for a note, against the
+`Fretboard` matrix and reverse position index.
+
+Usage:
+    python benchmarks/bench_fretboard.py
+"""
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory.chords import Chord
+from music_theory.instrument_creator import create_standard_guitar
+from music_theory.notes import Note
+
+FRETS = 24
+
+#region Previous implementations
+
+def _legacy_note_at_fret(instrument, string_index, fret):
+    if string_index < 0 or string_index >= instrument.num_strings:
+        raise ValueError(f"String index out of range for tuning: {string_index}")
+
+    if fret < 0:
+        raise ValueError(f"Frets can't be negative: {fret}")
+
+    return Note.from_index(instrument.tuning[string_index].value + fret)
+
+def _scan_positions(instrument, notes):
+    return [
+        (s, f) for s in range(instrument.num_strings) for f in range(FRETS + 1)
+        if _legacy_note_at_fret(instrument, s, f) in notes
+    ]
+
+#endregion
+
+def main():
+    guitar = create_standard_guitar()
+    board = guitar.fretboard
+    chord = Chord(Note.C)
+
+    rows = [
+        ("note at fret",
+            per_call_ns(lambda: _legacy_note_at_fret(guitar, 4, 17)),
+            per_call_ns(lambda: guitar.note_at_fret(4, 17))),
+        ("note at fret (unchecked)",
+            per_call_ns(lambda: _legacy_note_at_fret(guitar, 4, 17)),
+            per_call_ns(lambda: board.notes[4][17])),
+        ("positions of note",
+            per_call_ns(lambda: _scan_positions(guitar, (Note.Eb,)), number=2_000),
+            per_call_ns(lambda: guitar.positions_of(Note.Eb))),
+        ("positions of chord",
+            per_call_ns(lambda: _scan_positions(guitar, chord.notes), number=2_000),
+            per_call_ns(lambda: guitar.positions_of(chord.pitch_classes))),
+    ]
+
+    print_comparison(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Micro-benchmark for `chords.identify_chord`.
+
+Compares scanning every chord and inversion for a match against the
+precomputed (pitch class mask, bass) index, and reports the memory
+allocated per identification.
+
+Usage:
+    python benchmarks/bench_identify_chord.py
+"""
+
+import tracemalloc
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory.chord_type import ChordType
+from music_theory.chords import Chord, identify_chord
+from music_theory.notes import Note
+
+#region Previous implementations
+
+def _scan_identify(notes):
+    target, bass = set(notes), notes[0]
+    matches = []
+
+    for root in Note:
+        for chord_type in ChordType:
+            chord = Chord(root, chord_type)
+
+            for inversion, voicing in enumerate([list(chord.notes), *chord.inversions()]):
+                if voicing[0] == bass and set(voicing) == target:
+                    matches.append((chord, inversion))
+
+    return matches
+
+#endregion
+
+def allocated_bytes(func, calls: int=10_000) -> float:
+    tracemalloc.start()
+    func()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for _ in range(calls):
+        func()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / calls
+
+def main():
+    notes = [Note.E, Note.G, Note.C]
+    seventh = [Note.G, Note.A, Note.C, Note.E]
+
+    rows = [
+        ("identify triad",
+            per_call_ns(lambda: _scan_identify(notes), number=200),
+            per_call_ns(lambda: identify_chord(notes))),
+        ("identify seventh",
+            per_call_ns(lambda: _scan_identify(seventh), number=200),
+            per_call_ns(lambda: identify_chord(seventh))),
+    ]
+
+    print_comparison(rows)
+    print(f"bytes retained per identify_chord call: {allocated_bytes(lambda: identify_chord(notes)):.1f}")
+
+
+if __name__ == "__main__":
+    main()
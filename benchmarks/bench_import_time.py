@@ -0,0 +1,80 @@
+"""
+Benchmark for the time it takes to import the package.
+
+Runs each import statement in a fresh interpreter with `-X importtime` and
+adds up the cumulative time of every `music_theory` module imported at the
+top level (including the standard library modules they pull in), keeping
+the fastest of several runs. Importing every submodule, as the package used
+to on `import music_theory`, is shown for comparison.
+
+Exits with an error if a statement goes over its budget, so a change that
+makes the package import something eagerly again shows up.
+
+Usage:
+    python benchmarks/bench_import_time.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+# Import statements and their budgets in milliseconds, generous enough for a
+# slow machine but well under the cost of importing every submodule.
+BUDGETS_MS = {
+    "import music_theory": 10,
+    "from music_theory import Note": 30,
+    "from music_theory import Key, Scale, Chord": 50,
+    "from music_theory.instrument_creator import E_STANDARD_GUITAR": 60,
+}
+
+EAGER = "import " + ", ".join(f"music_theory.{m}" for m in (
+    "batch", "corpus", "instrument_creator", "key_detection", "note_parser",
+    "rendering", "tab_parser", "utils", "voicings", "progressions",
+    "scale_diatonic", "string_instrument",
+))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_ms(statement: str) -> float:
+    """
+    Returns the time spent importing music_theory modules for a statement,
+    in milliseconds, from a fresh interpreter.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+    )
+    total_us = 0
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("| package"):
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        # Top level modules are not indented.
+        if name.startswith(" music_theory"):
+            total_us += int(cumulative)
+
+    return total_us / 1000
+
+def main(runs: int=7):
+    over_budget = []
+
+    print(f"{'statement':<64}{'import (ms)':>12}{'budget (ms)':>12}")
+
+    for statement, budget in [*BUDGETS_MS.items(), (EAGER, None)]:
+        best = min(import_ms(statement) for _ in range(runs))
+        label = "every submodule (eager)" if budget is None else statement
+        print(f"{label:<64}{best:>12.1f}{'' if budget is None else budget:>12}")
+
+        if budget is not None and best > budget:
+            over_budget.append(statement)
+
+    if over_budget:
+        sys.exit(f"over budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,51 @@
+"""
+Benchmark for the cost of the instrumentation counters.
+
+Times a few hot entry points with instrumentation disabled (the original
+functions, as instrumentation is off by default) and with it enabled, and
+checks that disabling it puts the originals back, so it costs nothing when
+it isn't used.
+
+Usage:
+    python benchmarks/bench_instrumentation.py [number]
+"""
+
+import sys
+
+from _timing import per_call_ns
+
+from music_theory import instrumentation, notes
+from music_theory.intervals import Interval
+from music_theory.keys import Key
+from music_theory.notes import Note
+from music_theory.scale_type import ScaleType
+from music_theory.scales import Scale
+
+CASES = [
+    ("notes.transpose", lambda: notes.transpose(Note.E, Interval.P5, "d")),
+    ("Note.from_string", lambda: Note.from_string("F#")),
+    ("Scale(...)", lambda: Scale(Note.A, ScaleType.Dorian)),
+    ("Key.chords", lambda: Key(Note.G).chords()),
+]
+
+def main(number: int=200_000):
+    original = notes.transpose
+
+    disabled = [per_call_ns(func, number) for _, func in CASES]
+
+    with instrumentation.instrumented():
+        enabled = [per_call_ns(func, number) for _, func in CASES]
+
+    assert notes.transpose is original
+
+    print(f"{'entry point':<24}{'disabled (ns)':>15}{'enabled (ns)':>15}{'overhead (ns)':>15}")
+
+    for (label, _), off, on in zip(CASES, disabled, enabled):
+        print(f"{label:<24}{off:>15.1f}{on:>15.1f}{on - off:>15.1f}")
+
+    print()
+    print("counted calls:", sum(stats.calls for stats in instrumentation.snapshot().values()))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
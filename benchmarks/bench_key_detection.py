@@ -0,0 +1,99 @@
+"""
+Throughput benchmark for `music_theory.key_detection`.
+
+Compares re-correlating the window against all 24 key profiles after every
+note with the incremental `KeyDetector`, over a long synthetic note stream.
+Then compares checking every key's chords for each chord of a long
+progression with the chord -> keys index used by `rank_keys_for_chords`.
+
+Usage:
+    python benchmarks/bench_key_detection.py [num_notes] [window] [num_chords]
+"""
+
+import random
+import sys
+import time
+from collections import deque
+
+from music_theory.key_detection import KEYS, KEY_PROFILES, HAS_NUMPY, KeyDetector, rank_keys_for_chords
+from music_theory.keys import Key
+from music_theory.notes import Note
+from music_theory.progressions import chords_from_progression
+from music_theory.scales import Scale
+
+#region Previous implementations
+
+def _pearson(xs, ys):
+    mx, my = sum(xs) / 12, sum(ys) / 12
+    cov = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    vx = sum((x - mx) ** 2 for x in xs)
+    vy = sum((y - my) ** 2 for y in ys)
+    return cov / (vx * vy) ** 0.5 if vx else 0.0
+
+def _recompute_stream(notes, window):
+    recent = deque(maxlen=window)
+    profiles = [
+        [KEY_PROFILES[k.type][(pc - k.root.value) % 12] for pc in range(12)] for k in KEYS
+    ]
+
+    for note in notes:
+        recent.append(note.value)
+        histogram = [0] * 12
+
+        for pc in recent:
+            histogram[pc] += 1
+
+        max(range(24), key=lambda k: _pearson(histogram, profiles[k]))
+
+def _scan_keys_for_chords(chords):
+    scores = []
+
+    for key in KEYS:
+        diatonic, parallel = key.chords().values(), key.parallel_chords().values()
+        tonic = list(diatonic)[0]
+        score = sum(1 if c in diatonic else 0.5 if c in parallel else 0 for c in chords)
+        scores.append((key, (score + 0.5 * chords.count(tonic)) / len(chords)))
+
+    return sorted(scores, key=lambda ks: -ks[1])
+
+#endregion
+
+def _incremental_stream(notes, window):
+    detector = KeyDetector(window)
+
+    for note in notes:
+        detector.add(note)
+        detector.best()
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main(num_notes: int=100_000, window: int=64, num_chords: int=5_000):
+    rng = random.Random(0)
+    scales = [Scale(root) for root in Note]
+    notes = [note for _ in range(num_notes // 32) for note in rng.choices(rng.choice(scales).notes, k=32)]
+
+    slow_count = min(len(notes), 5_000)
+    slow = elapsed(lambda: _recompute_stream(notes[:slow_count], window)) / slow_count
+    fast = elapsed(lambda: _incremental_stream(notes, window)) / len(notes)
+
+    backend = "numpy" if HAS_NUMPY else "lists"
+    print(f"{len(notes):,} notes, window {window}, backend: {backend}")
+    print(f"recompute per note:   {slow * 1e6:8.2f} us")
+    print(f"incremental per note: {fast * 1e6:8.2f} us  ({slow / fast:.0f}x, {1 / fast:,.0f} notes/s)")
+
+    numerals = ["I", "ii", "iii", "IV", "V", "vi", "bVII", "iv"]
+    chords = chords_from_progression(Key(Note.A), rng.choices(numerals, k=num_chords))
+
+    slow = elapsed(lambda: _scan_keys_for_chords(chords))
+    fast = elapsed(lambda: rank_keys_for_chords(chords))
+
+    print(f"{num_chords:,} chord progression")
+    print(f"scan every key's chords: {slow * 1e3:8.2f} ms")
+    print(f"chord -> keys index:     {fast * 1e3:8.2f} ms  ({slow / fast:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark for the precomputed enum lookup tables.
+
+Compares the per-call cost of the previous implementations (rebuilding the
+enum list through `items()` and normalising indices with `index_to_range`)
+against the table backed versions in `notes` and `intervals`.
+
+Usage:
+    python benchmarks/bench_lookup_tables.py
+"""
+
+import random
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory.intervals import Interval, interval_distance
+from music_theory.notes import Note, transpose, chromatic_notes
+from music_theory.utils import index_to_range, UP_DIRECTIONS, DOWN_DIRECTIONS
+
+#region Previous implementations
+
+def _legacy_note_from_index(index):
+    return [n for n in Note][index_to_range(index)]
+
+def _legacy_interval_from_index(index):
+    return [i for i in Interval][index_to_range(index)]
+
+def _legacy_transpose(note, interval, direction="u"):
+    direction = direction.lower()
+
+    if direction in UP_DIRECTIONS:
+        return _legacy_note_from_index(note.value + interval.value)
+
+    elif direction in DOWN_DIRECTIONS:
+        return _legacy_note_from_index(note.value - interval.value)
+
+    raise ValueError(f'direction not recognized({direction})')
+
+def _legacy_interval_distance(first_note, second_note, direction="u"):
+    if first_note == second_note:
+        return Interval.Unison
+
+    direction = direction.lower()
+    dif = abs(first_note.value - second_note.value)
+
+    if direction in UP_DIRECTIONS:
+        if first_note.value > second_note.value:
+            return _legacy_interval_from_index(12 - dif)
+        return _legacy_interval_from_index(dif)
+
+    if first_note.value > second_note.value:
+        return _legacy_interval_from_index(dif)
+    return _legacy_interval_from_index(12 - dif)
+
+def _legacy_chromatic_notes(note, direction="u"):
+    notes = [note]
+
+    for _ in range(11):
+        if direction.lower() in UP_DIRECTIONS:
+            note = _legacy_note_from_index(note.value + 1)
+        else:
+            note = _legacy_note_from_index(note.value - 1)
+        notes.append(note)
+
+    return notes
+
+#endregion
+
+def main():
+    rng = random.Random(0)
+    n, m, i = rng.choice(list(Note)), rng.choice(list(Note)), rng.choice(list(Interval))
+
+    rows = [
+        ("Note.from_index",
+            per_call_ns(lambda: _legacy_note_from_index(-27)), per_call_ns(lambda: Note.from_index(-27))),
+        ("Interval.from_index",
+            per_call_ns(lambda: _legacy_interval_from_index(13)), per_call_ns(lambda: Interval.from_index(13))),
+        ("Note.random",
+            per_call_ns(lambda: rng.choice([x for x in Note])), per_call_ns(Note.random)),
+        ("transpose (down)",
+            per_call_ns(lambda: _legacy_transpose(n, i, "down")), per_call_ns(lambda: transpose(n, i, "down"))),
+        ("interval_distance (up)",
+            per_call_ns(lambda: _legacy_interval_distance(n, m, "u")), per_call_ns(lambda: interval_distance(n, m, "u"))),
+        ("chromatic_notes (down)",
+            per_call_ns(lambda: _legacy_chromatic_notes(n, "d"), number=20_000), per_call_ns(lambda: chromatic_notes(n, "d"), number=20_000)),
+    ]
+
+    print_comparison(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Memory benchmark for the value objects.
+
+Reports the size of one instance and the memory used by one million
+instances (traced allocations and growth of the process RSS) for `Scale`,
+`DiatonicScale`, `Chord`, `Key`, `Progression` and `StringInstrument`.
+Progressions and instruments are also compared against the previous
+dict-backed layouts. Scales, chords and keys are interned, so a million of
+them are a million references to a few hundred shared objects.
+
+Usage:
+    python benchmarks/bench_memory.py [count]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+from music_theory.chord_type import ChordType
+from music_theory.chords import Chord
+from music_theory.key_type import KeyType
+from music_theory.keys import Key
+from music_theory.notes import Note
+from music_theory.progressions import Progression, chords_from_progression
+from music_theory.scale_diatonic import DiatonicScale
+from music_theory.scale_type import ScaleType
+from music_theory.scales import Scale
+from music_theory.string_instrument import StringInstrument
+
+NOTES = list(Note)
+SCALE_TYPES = list(ScaleType)
+DIATONIC_TYPES = DiatonicScale.valid_scale_types()
+CHORD_TYPES = list(ChordType)
+KEYS = [Key(root, key_type) for root in NOTES for key_type in KeyType]
+STANDARD = [Note.E, Note.A, Note.D, Note.G, Note.B, Note.E]
+
+#region Previous implementations
+
+class _DictProgression:
+    def __init__(self, key, numeral_progression, error='X'):
+        self.key = key
+        self.numerals = numeral_progression
+        self.error = error
+        self.chords = chords_from_progression(key, self.numerals, error)
+
+class _DictStringInstrument:
+    def __init__(self, tuning):
+        self.num_strings = len(tuning)
+        self.tuning = tuning
+        self._fretboard = None
+
+#endregion
+
+FACTORIES = [
+    ("Scale", lambda i: Scale(NOTES[i % 12], SCALE_TYPES[i % len(SCALE_TYPES)])),
+    ("DiatonicScale", lambda i: DiatonicScale(NOTES[i % 12], DIATONIC_TYPES[i % len(DIATONIC_TYPES)])),
+    ("Chord", lambda i: Chord(NOTES[i % 12], CHORD_TYPES[i % len(CHORD_TYPES)])),
+    ("Key", lambda i: Key(NOTES[i % 12], KeyType.Minor if i & 1 else KeyType.Major)),
+    ("Progression (dict)", lambda i: _DictProgression(KEYS[i % 24], ["I", "V", "vi", "IV"])),
+    ("Progression", lambda i: Progression(KEYS[i % 24], ["I", "V", "vi", "IV"])),
+    ("StringInstrument (dict)", lambda i: _DictStringInstrument(list(STANDARD))),
+    ("StringInstrument", lambda i: StringInstrument(list(STANDARD))),
+]
+
+def _rss() -> int | None:
+    """
+    Returns the resident set size of this process in bytes, or None where
+    /proc isn't available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _instance_size(obj) -> int:
+    """
+    Returns the size of an object and its attribute dict, if it has one.
+    """
+    size = sys.getsizeof(obj)
+
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+
+    return size
+
+def main(count: int=1_000_000):
+    print(f"{'type':<26}{'instance (B)':>14}{'traced (MB)':>14}{'RSS (MB)':>12}")
+
+    for label, factory in FACTORIES:
+        size = _instance_size(factory(0))
+
+        # RSS is measured without tracing, tracemalloc's own bookkeeping
+        # would be counted otherwise
+        gc.collect()
+        rss_before = _rss()
+        objects = [factory(i) for i in range(count)]
+        rss_after = _rss()
+        del objects
+
+        gc.collect()
+        tracemalloc.start()
+        objects = [factory(i) for i in range(count)]
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objects
+
+        rss = "n/a" if rss_before is None else f"{(rss_after - rss_before) / 1e6:.1f}"
+        print(f"{label:<26}{size:>14}{traced / 1e6:>14.1f}{rss:>12}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,65 @@
+"""
+Throughput benchmark for `music_theory.note_parser`.
+
+Parses a large synthetic block of note text with the original per-token
+regex validation and with the table driven parser, reporting tokens per
+second for each.
+
+Usage:
+    python benchmarks/bench_note_parser.py [num_tokens]
+"""
+
+import random
+import sys
+import time
+
+from music_theory.intervals import Interval
+from music_theory.note_parser import parse_notes
+from music_theory.notes import Note
+from music_theory.utils import is_valid_note_str
+
+
+def legacy_from_string(note_str: str) -> Note | None:
+    """
+    The original `Note.from_string`, validating each token with a regex
+    before transposing the letter.
+    """
+    if not is_valid_note_str(note_str):
+        return None
+
+    note = Note[note_str[0].upper()]
+
+    if len(note_str) == 1:
+        return note
+
+    direction = 'u' if (note_str[1] == '#') else 'd'
+    return note.transpose(Interval.m2 if len(note_str) == 2 else Interval.M2, direction)
+
+def best_of(func, repeat: int=3) -> float:
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+def main(num_tokens: int=1_000_000):
+    rng = random.Random(0)
+    spellings = ["C", "c#", "Eb", "f##", "Gbb", "A", "bb"]
+    words = [rng.choice(spellings) for _ in range(num_tokens)]
+    text = "\n".join(" ".join(words[i:i + 16]) for i in range(0, num_tokens, 16))
+
+    legacy = best_of(lambda: [legacy_from_string(t) for t in text.split()])
+    table = best_of(lambda: list(parse_notes(text)))
+
+    print(f"{num_tokens:,} tokens")
+    print(f"{'parser':<20}{'tokens/s':>16}")
+    print(f"{'regex + transpose':<20}{num_tokens / legacy:>16,.0f}")
+    print(f"{'note_parser':<20}{num_tokens / table:>16,.0f}")
+    print(f"speedup: {legacy / table:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,70 @@
+"""
+Benchmark for NoteSequence against a plain `list[Note]` melody.
+
+Reports the memory of a long melody held as a list of Notes and as a
+NoteSequence, then compares transposing, slicing and formatting it. Packing
+is compared against `batch.from_notes`, the previous way to get an array of
+pitch classes from a list of Notes.
+
+Usage:
+    python benchmarks/bench_note_sequence.py [notes]
+"""
+
+import random
+import sys
+import tracemalloc
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory import batch
+from music_theory.intervals import Interval
+from music_theory.notes import NOTES, notes_to_string, transpose
+from music_theory.note_sequence import NoteSequence
+
+def _traced_bytes(build) -> int:
+    """
+    Returns the memory still allocated by whatever `build` returns.
+    """
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+def main(count: int=1_000_000):
+    rng = random.Random(0)
+    values = [rng.randrange(12) for _ in range(count)]
+
+    list_bytes = _traced_bytes(lambda: [NOTES[v] for v in values])
+    sequence_bytes = _traced_bytes(lambda: NoteSequence.from_bytes(bytes(values)))
+
+    print(f"{count:,} notes")
+    print(f"list[Note]    {list_bytes / 1e6:>8.2f} MB")
+    print(f"NoteSequence  {sequence_bytes / 1e6:>8.2f} MB  ({list_bytes / sequence_bytes:.1f}x smaller)")
+    print()
+
+    melody = [NOTES[v] for v in values]
+    sequence = NoteSequence(melody)
+    half = count // 2
+
+    rows = [
+        ("transpose",
+            per_call_ns(lambda: [transpose(n, Interval.P4, "d") for n in melody], number=1, repeat=3),
+            per_call_ns(lambda: sequence.transpose(Interval.P4, "d"), number=20)),
+        ("slice half",
+            per_call_ns(lambda: melody[half:], number=20),
+            per_call_ns(lambda: sequence[half:], number=20)),
+        ("pack notes",
+            per_call_ns(lambda: batch.from_notes(melody), number=5),
+            per_call_ns(lambda: NoteSequence(melody), number=5)),
+        ("to string",
+            per_call_ns(lambda: notes_to_string(melody), number=5),
+            per_call_ns(lambda: str(sequence), number=5)),
+    ]
+
+    print_comparison(rows)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
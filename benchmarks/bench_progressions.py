@@ -0,0 +1,62 @@
+"""
+Benchmark of progression resolution.
+
+Compares the previous `chords_from_progression` (rebuilding the shorthand map
+and merging `key.chords() | key.parallel_chords()` on every call) against a
+`ProgressionCompiler` compiled once and resolved per key, and against
+`resolve_all` for all 24 keys at once.
+
+Usage:
+    python benchmarks/bench_progressions.py
+"""
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory.keys import Key
+from music_theory.key_type import KeyType
+from music_theory.notes import Note
+from music_theory.progressions import ProgressionCompiler, NumeralProgressions
+
+ALL_KEYS = [Key(n, kt) for kt in KeyType for n in Note]
+
+def _legacy_chords_from_progression(key, progression, error='X'):
+    shorthand_map = {
+        'viidim': 'vii°',
+        'vii': 'vii°', 
+        'iidim': 'ii°',
+        'ii': 'ii',
+    }
+
+    progression = [
+        shorthand_map.get(numeral.lower(), numeral)
+        if isinstance(numeral, str) else numeral
+        for numeral in progression
+    ]
+
+    chord_dict = key.chords() | key.parallel_chords()
+
+    return [chord_dict.get(numeral, error) for numeral in progression]
+
+def main():
+    progression = NumeralProgressions.doo_wop_alt * 4 + ["VII", "iidim", "bVII"]
+    key = Key(Note.Eb, KeyType.Minor)
+    compiled = ProgressionCompiler(progression)
+
+    rows = [
+        ("one key",
+            per_call_ns(lambda: _legacy_chords_from_progression(key, progression), number=20_000),
+            per_call_ns(lambda: compiled.resolve(key), number=20_000)),
+        ("one key (incl. compile)",
+            per_call_ns(lambda: _legacy_chords_from_progression(key, progression), number=20_000),
+            per_call_ns(lambda: ProgressionCompiler(progression).resolve(key), number=20_000)),
+        ("all 24 keys",
+            per_call_ns(lambda: [_legacy_chords_from_progression(k, progression) for k in ALL_KEYS], number=1_000),
+            per_call_ns(compiled.resolve_all, number=1_000)),
+    ]
+
+    print(f"{len(progression)} numeral progression")
+    print_comparison(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Throughput benchmark for the rendering layer.
+
+Compares building a key's table as a list of lines and joining it (the
+previous `to_string_array` / `pretty_print`) against `render`, which writes
+the cached text straight to a file-like object. Then renders all 24 keys
+with every combination of options (96 tables) in each format, repeatedly,
+and reports tables per second.
+
+Usage:
+    python benchmarks/bench_rendering.py [passes]
+"""
+
+import sys
+import time
+from io import StringIO
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory.key_type import KeyType
+from music_theory.keys import Key
+from music_theory.notes import Note
+from music_theory.rendering import FORMATS, render, render_keys
+
+#region Previous implementations
+
+def _legacy_to_string_array(key, dominant=False, parallel=False):
+    data = [f"Chords of {key.root} {key.type}:"]
+
+    chords = key.chords()
+    table_data = [
+        [str(chord) for chord in chords.values()],
+        list(chords.keys()),
+    ]
+
+    if dominant:
+        dominant_chords = key.dominant_chords()
+        table_data += [
+            ["", "", "", "", "", "", "",],
+            [str(chord) for chord in dominant_chords.values()],
+            list(dominant_chords.keys()),
+        ]
+
+    if parallel:
+        parallel_chords = key.parallel_chords()
+        table_data += [
+            ["", "", "", "", "", "", "",],
+            [str(chord) for chord in parallel_chords.values()],
+            list(parallel_chords.keys()),
+        ]
+
+    for row in table_data:
+        data.append(("{: >10}" * 7).format(*row))
+
+    return data
+
+def _legacy_render_keys(out):
+    for root in Note:
+        for key_type in KeyType:
+            for dominant in (False, True):
+                for parallel in (False, True):
+                    for line in _legacy_to_string_array(Key(root, key_type), dominant, parallel):
+                        out.write(line + "\n")
+
+#endregion
+
+def main(passes: int=200):
+    key = Key(Note.Eb, KeyType.Minor)
+    out = StringIO()
+
+    rows = [
+        ("key table",
+            per_call_ns(lambda: "\n".join(_legacy_to_string_array(key, True, True)), number=20_000),
+            per_call_ns(lambda: render(key, out, dominant=True, parallel=True), number=20_000)),
+        ("all keys x options (ascii)",
+            per_call_ns(lambda: _legacy_render_keys(StringIO()), number=100),
+            per_call_ns(lambda: render_keys(StringIO()), number=100)),
+    ]
+
+    print_comparison(rows)
+    print()
+
+    for fmt in FORMATS:
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            out = StringIO()
+            render_keys(out, fmt)
+
+        elapsed = time.perf_counter() - start
+        size = len(out.getvalue())
+        print(f"{fmt:<10}{passes * 96 / elapsed:>14,.0f} tables/s{passes * size / elapsed / 1e6:>10.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""
+Benchmark for `scales.scales_containing`.
+
+Compares scanning the notes of all 168 scales against the pitch class ->
+scales bitmap index, then times one million random queries of two to five
+notes through the index.
+
+Usage:
+    python benchmarks/bench_scale_index.py [num_queries]
+"""
+
+import random
+import sys
+import time
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory.notes import Note
+from music_theory.scale_type import ScaleType
+from music_theory.scales import Scale, scales_containing, _scales_containing_cache
+
+#region Previous implementations
+
+def _scan_scales(notes):
+    matches = [
+        Scale(root, scale_type) for scale_type in ScaleType for root in Note
+        if all(n in Scale(root, scale_type).notes for n in notes)
+    ]
+    return sorted(matches, key=lambda s: len(s.notes))
+
+#endregion
+
+def main(num_queries: int=1_000_000):
+    rng = random.Random(0)
+    notes = Note.items()
+    queries = [rng.sample(notes, rng.randint(2, 5)) for _ in range(num_queries)]
+    query = [Note.C, Note.E, Note.A]
+
+    rows = [
+        ("scales containing (C, E, A)",
+            per_call_ns(lambda: _scan_scales(query), number=2_000),
+            per_call_ns(lambda: scales_containing(query))),
+    ]
+
+    print_comparison(rows)
+
+    _scales_containing_cache.clear()
+    start = time.perf_counter()
+
+    for q in queries:
+        scales_containing(q)
+
+    elapsed = time.perf_counter() - start
+    print(f"{num_queries:,} random queries: {elapsed:.2f}s ({num_queries / elapsed:,.0f} queries/s)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark for Scale construction.
+
+Compares the previous eager `Scale._construct`, which built every formula,
+the notes and the pitch classes up front, against the lazy attributes that
+are only computed when first read. Scales are interned, so the cold rows
+clear the intern table before every call to time a first construction.
+
+Usage:
+    python benchmarks/bench_scales.py
+"""
+
+from _timing import per_call_ns, print_comparison
+
+from music_theory.notes import Note
+from music_theory.pitch_class_set import PitchClassSet
+from music_theory.scale_type import ScaleType
+from music_theory.scales import (Scale, _interned_scales, _intervals_from_numerics, _intervals_from_steps,
+                                 _notes_from_intervals, formula_interval_dict, formula_numeric_dict,
+                                 formula_step_dict, modes_from_note)
+
+#region Previous implementations
+
+_legacy_interned = {}
+
+class _EagerScale:
+    __slots__ = ('root', 'type', 'creation_formula', 'interval_formula',
+                 'notes', 'numeric_formula', 'pitch_classes')
+
+    def __new__(cls, root, scale_type=ScaleType.Major):
+        key = (cls, root, scale_type)
+
+        try:
+            return _legacy_interned[key]
+        except KeyError:
+            pass
+
+        self = super().__new__(cls)
+        self.root = root
+        self.type = scale_type
+        self._construct()
+
+        return _legacy_interned.setdefault(key, self)
+
+    def _construct(self):
+        if self.type in formula_interval_dict:
+            creation_formula = formula_interval_dict[self.type]
+            interval_formula = creation_formula
+        elif self.type in formula_step_dict:
+            creation_formula = formula_step_dict[self.type]
+            interval_formula = _intervals_from_steps(creation_formula)
+        elif self.type in formula_numeric_dict:
+            creation_formula = formula_numeric_dict[self.type]
+            interval_formula = _intervals_from_numerics(creation_formula)
+        else:
+            raise ValueError(f'Scale is not in either formula dictionary ({repr(self.type)})')
+
+        notes = tuple(_notes_from_intervals(self.root, interval_formula))
+
+        self.creation_formula = tuple(creation_formula)
+        self.interval_formula = tuple(interval_formula)
+        self.notes = notes
+        self.numeric_formula = tuple(i.to_numeric() for i in interval_formula)
+        self.pitch_classes = PitchClassSet(notes)
+
+    @property
+    def name(self):
+        return f"{self.root} {self.type}"
+
+def _legacy_modes_from_note(note):
+    s = _EagerScale(note, ScaleType.Ionian)
+
+    return [
+        s,
+        _EagerScale(s.notes[1], ScaleType.Dorian),
+        _EagerScale(s.notes[2], ScaleType.Phrygian),
+        _EagerScale(s.notes[3], ScaleType.Lydian),
+        _EagerScale(s.notes[4], ScaleType.Mixolydian),
+        _EagerScale(s.notes[5], ScaleType.Aeolian),
+        _EagerScale(s.notes[6], ScaleType.Locrian),
+    ]
+
+#endregion
+
+def _cold(func, table):
+    def run():
+        table.clear()
+        return func()
+
+    return run
+
+def main():
+    rows = [
+        ("construct (cold)",
+            per_call_ns(_cold(lambda: _EagerScale(Note.Eb, ScaleType.Dorian), _legacy_interned), number=20_000),
+            per_call_ns(_cold(lambda: Scale(Note.Eb, ScaleType.Dorian), _interned_scales), number=20_000)),
+        ("construct + name (cold)",
+            per_call_ns(_cold(lambda: _EagerScale(Note.Eb, ScaleType.Dorian).name, _legacy_interned), number=20_000),
+            per_call_ns(_cold(lambda: Scale(Note.Eb, ScaleType.Dorian).name, _interned_scales), number=20_000)),
+        ("construct + notes (cold)",
+            per_call_ns(_cold(lambda: _EagerScale(Note.Eb, ScaleType.Dorian).notes, _legacy_interned), number=20_000),
+            per_call_ns(_cold(lambda: Scale(Note.Eb, ScaleType.Dorian).notes, _interned_scales), number=20_000)),
+        ("modes_from_note (cold)",
+            per_call_ns(_cold(lambda: _legacy_modes_from_note(Note.Eb), _legacy_interned), number=5_000),
+            per_call_ns(_cold(lambda: modes_from_note(Note.Eb), _interned_scales), number=5_000)),
+        ("construct (interned)",
+            per_call_ns(lambda: _EagerScale(Note.Eb, ScaleType.Dorian)),
+            per_call_ns(lambda: Scale(Note.Eb, ScaleType.Dorian))),
+        ("modes_from_note (interned)",
+            per_call_ns(lambda: _legacy_modes_from_note(Note.Eb), number=20_000),
+            per_call_ns(lambda: modes_from_note(Note.Eb), number=20_000)),
+    ]
+
+    print_comparison(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Load test for the JSON-RPC theory server.
+
+Starts `python -m music_theory.server` on a free port, then opens several
+connections that each keep a number of requests in flight (pipelined), with
+a mix of scale, chord, key, progression, key detection and instrument
+queries. Reports requests per second and the latency percentiles, for
+single requests and for batches (the latency of a whole batch), next to
+the cost of spawning Python for every call (what the server replaces).
+
+Usage:
+    python benchmarks/bench_server.py [requests] [connections] [depth] [batch_size]
+"""
+
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+
+from music_theory.server import Client
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROOTS = ["C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B"]
+
+SPAWN_CALL = "from music_theory.keys import Key; from music_theory.notes import Note; print(Key(Note.A).chords())"
+
+def _query(rng: random.Random) -> tuple[str, dict]:
+    """
+    Returns a random (method, params) call, weighted towards the common
+    queries.
+    """
+    root = rng.choice(ROOTS)
+    kind = rng.random()
+
+    if kind < 0.25:
+        return "key", {"root": root, "type": rng.choice(["Major", "Minor"])}
+    if kind < 0.45:
+        return "progression", {"root": root, "numerals": rng.sample(["I", "ii", "iii", "IV", "V", "vi", "V7/V"], 4)}
+    if kind < 0.60:
+        return "chord", {"root": root, "type": rng.choice(["Major", "Minor", "Dominant7", "Minor7"])}
+    if kind < 0.75:
+        return "scale", {"root": root, "type": rng.choice(["Major", "Dorian", "Lydian", "HarmonicMinor"])}
+    if kind < 0.85:
+        return "detect_key", {"notes": [rng.choice(ROOTS) for _ in range(8)]}
+    if kind < 0.95:
+        return "identify_chord", {"notes": rng.sample(ROOTS, 3)}
+    return "chord_voicings", {"root": root, "limit": 5}
+
+def _percentile(values: list[float], p: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+def _report(label: str, requests: int, seconds: float, latencies: list[float]) -> None:
+    latencies.sort()
+    percentiles = "".join(f"{_percentile(latencies, p) * 1000:>9.2f}" for p in (0.5, 0.9, 0.99, 0.999))
+    print(f"{label:<24}{requests / seconds:>12,.0f}{percentiles}{latencies[-1] * 1000:>9.2f}")
+
+async def _connection(port: int, calls: list[tuple[str, dict]], depth: int, batch_size: int, latencies: list[float]) -> None:
+    async with await Client.connect(port=port) as client:
+        async def worker(chunks):
+            for chunk in chunks:
+                start = time.perf_counter()
+
+                if batch_size == 1:
+                    await client.call(chunk[0][0], **chunk[0][1])
+                else:
+                    await client.batch(chunk)
+
+                latencies.append(time.perf_counter() - start)
+
+        chunks = [calls[i:i + batch_size] for i in range(0, len(calls), batch_size)]
+        await asyncio.gather(*(worker(chunks[i::depth]) for i in range(depth)))
+
+async def _load(port: int, requests: int, connections: int, depth: int, batch_size: int, seed: int=0) -> tuple[float, list[float]]:
+    rng = random.Random(seed)
+    calls = [_query(rng) for _ in range(requests)]
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_connection(port, calls[i::connections], depth, batch_size, latencies) for i in range(connections)))
+    return time.perf_counter() - start, latencies
+
+def _spawn_per_call(runs: int) -> list[float]:
+    latencies = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", SPAWN_CALL], check=True, capture_output=True, cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT))
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+def main(requests: int=20_000, connections: int=8, depth: int=16, batch_size: int=32):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "music_theory.server", "--port", "0"],
+        stdout=subprocess.PIPE, text=True, cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT),
+    )
+
+    try:
+        port = int(server.stdout.readline().rsplit(":", 1)[1])
+
+        print(f"{requests:,} requests, {connections} connections, {depth} in flight per connection")
+        print(f"{'mode':<24}{'req/s':>12}{'p50 (ms)':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'max':>9}")
+
+        # A first pass fills the server's result cache, as a long running
+        # server would have.
+        for label, size in (("pipelined (cold)", 1), ("pipelined (warm)", 1), (f"batches of {batch_size}", batch_size)):
+            seconds, latencies = asyncio.run(_load(port, requests, connections, depth, size))
+            _report(label, requests, seconds, latencies)
+
+        latencies = _spawn_per_call(5)
+        _report("spawn python per call", len(latencies), sum(latencies), latencies)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,70 @@
+"""
+Throughput benchmark for `music_theory.tab_parser`.
+
+Writes a multi-megabyte synthetic guitar tab to a temporary file, then
+streams it through `parse_tab_file`, reporting megabytes and note events
+per second along with the peak memory used while parsing.
+
+Usage:
+    python benchmarks/bench_tab_parser.py [megabytes]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from music_theory.instrument_creator import create_standard_guitar
+from music_theory.tab_parser import parse_tab_file
+
+STRING_NAMES = ["e", "B", "G", "D", "A", "E"]
+TOKENS = ["-", "-", "-", "-", "3", "5", "7", "12", "15", "h7", "p5", "/9", "\\2", "x"]
+
+
+def write_synthetic_tab(path: str, megabytes: float, columns: int=64) -> None:
+    """
+    Writes staves of random frets and techniques until the file reaches
+    roughly the requested size.
+    """
+    rng = random.Random(0)
+    target = megabytes * 1024 * 1024
+    written = 0
+
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            staff = []
+
+            for name in STRING_NAMES:
+                cells = [rng.choice(TOKENS).ljust(3, "-") for _ in range(columns)]
+                staff.append(f"{name}|{''.join(cells)}|\n")
+
+            staff.append("\n")
+            written += f.write("".join(staff))
+
+def main(megabytes: float=8):
+    guitar = create_standard_guitar()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic_tab.txt")
+        write_synthetic_tab(path, megabytes)
+        size = os.path.getsize(path) / (1024 * 1024)
+
+        start = time.perf_counter()
+        events = sum(1 for _ in parse_tab_file(guitar, path))
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        for _ in parse_tab_file(guitar, path):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"{size:.1f} MB tab, {events:,} events in {elapsed:.2f}s")
+    print(f"{size / elapsed:.1f} MB/s, {events / elapsed:,.0f} events/s")
+    print(f"peak memory while streaming: {peak / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main(*(float(a) for a in sys.argv[1:]))
@@ -0,0 +1,76 @@
+"""
+Benchmark for the chord voicing search in `music_theory.voicings`.
+
+Times a brute force scan of every fret combination against the pruned
+search for one chord, then builds a full voicing library (every root and
+chord type) for every instrument in `instrument_creator`, first cold and
+then again from the per tuning cache.
+
+Usage:
+    python benchmarks/bench_voicings.py
+"""
+
+import itertools
+import time
+
+from music_theory import instrument_creator
+from music_theory.chords import Chord
+from music_theory.chord_type import ChordType
+from music_theory.notes import Note
+from music_theory.voicings import _search, find_voicings
+
+MAX_SPAN, MAX_FRET = 3, 12
+
+
+def brute_force(instrument, chord):
+    target = set(chord.notes)
+    options = list(range(MAX_FRET + 1)) + [None]
+    results = []
+
+    for voicing in itertools.product(options, repeat=instrument.num_strings):
+        fretted = [f for f in voicing if f]
+
+        if fretted and max(fretted) - min(fretted) > MAX_SPAN:
+            continue
+
+        if {instrument.note_at_fret(s, f) for s, f in enumerate(voicing) if f is not None} == target:
+            results.append(voicing)
+
+    return results
+
+def build_library(instruments):
+    return {
+        (name, chord): find_voicings(instrument, chord, MAX_SPAN, MAX_FRET)
+        for name, instrument in instruments.items()
+        for root in Note for chord_type in ChordType
+        for chord in (Chord(root, chord_type),)
+    }
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def main():
+    instruments = instrument_creator.presets()
+
+    ukulele = instrument_creator.create_ukulele()
+    chord = Chord(Note.C, ChordType.Major7)
+
+    _search.cache_clear()
+    _, brute = timed(lambda: brute_force(ukulele, chord))
+    _, pruned = timed(lambda: find_voicings(ukulele, chord, MAX_SPAN, MAX_FRET))
+    print(f"ukulele {chord}: brute force {brute * 1e3:.1f} ms, pruned search {pruned * 1e3:.2f} ms ({brute / pruned:.0f}x)")
+
+    _search.cache_clear()
+    library, cold = timed(lambda: build_library(instruments))
+    _, warm = timed(lambda: build_library(instruments))
+    total = sum(map(len, library.values()))
+
+    print(f"library for {len(instruments)} instruments x {len(library) // len(instruments)} chords: "
+          f"{total:,} voicings")
+    print(f"cold: {cold:.2f}s, cached: {warm * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,90 @@
-from . import instrument_creator
-from . import utils
-from music_theory.chord_type import ChordType
-from music_theory.chords import Chord, unique_notes_in_chords
-from music_theory.intervals import Interval
-from music_theory.key_type import KeyType
-from music_theory.keys import Key
-from music_theory.notes import Note
-from music_theory.progressions import Progression, NumeralProgressions, SongProgressions, NumeralCadences, chords_from_progression     
-from music_theory.scale_diatonic import DiatonicScale
-from music_theory.scale_type import ScaleType
-from music_theory.scales import Scale, modes_from_note
-from music_theory.string_instrument import StringInstrument
\ No newline at end of file
+"""
+The music_theory package.
+
+Description:
+    Submodules and the classes and functions re-exported here are imported
+    on first use (through the module level `__getattr__`), so
+    `import music_theory` itself imports nothing. `from music_theory import
+    Note` imports only the modules `Note` needs.
+"""
+
+import importlib
+import os
+
+# Not imported from typing, which is slow to import. Type checkers treat any
+# TYPE_CHECKING constant as true.
+TYPE_CHECKING = False
+
+# Submodules available as attributes of the package.
+_SUBMODULES = frozenset((
+    "analysis", "batch", "chord_type", "chords", "corpus", "fretboard", "instrument_creator",
+    "instrumentation", "intervals", "key_detection", "key_type", "keys",
+    "note_parser", "note_sequence", "notes", "pitch_class_set", "progressions",
+    "rendering", "scale_diatonic", "scale_type", "scales", "server", "string_instrument",
+    "tab_parser", "utils", "voicings",
+))
+
+# Classes and functions re-exported by the package, and the submodule each
+# one comes from.
+_EXPORTS: dict[str, str] = {
+    "ChordType": "chord_type",
+    "Chord": "chords",
+    "unique_notes_in_chords": "chords",
+    "identify_chord": "chords",
+    "Interval": "intervals",
+    "KeyType": "key_type",
+    "Key": "keys",
+    "Note": "notes",
+    "NoteSequence": "note_sequence",
+    "PitchClassSet": "pitch_class_set",
+    "Progression": "progressions",
+    "ProgressionCompiler": "progressions",
+    "NumeralProgressions": "progressions",
+    "SongProgressions": "progressions",
+    "NumeralCadences": "progressions",
+    "chords_from_progression": "progressions",
+    "DiatonicScale": "scale_diatonic",
+    "ScaleType": "scale_type",
+    "Scale": "scales",
+    "modes_from_note": "scales",
+    "scales_containing": "scales",
+    "StringInstrument": "string_instrument",
+}
+
+__all__ = sorted(_SUBMODULES | set(_EXPORTS))
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES | set(_EXPORTS))
+
+# The instrumentation module must wrap the entry points before any other
+# module imports them (see instrumentation.ENV_VAR).
+if os.environ.get("MUSIC_THEORY_INSTRUMENT", "") not in ("", "0"):
+    from . import instrumentation
+
+if TYPE_CHECKING: # pragma: no cover
+    from music_theory.chord_type import ChordType
+    from music_theory.chords import Chord, unique_notes_in_chords, identify_chord
+    from music_theory.intervals import Interval
+    from music_theory.key_type import KeyType
+    from music_theory.keys import Key
+    from music_theory.notes import Note
+    from music_theory.note_sequence import NoteSequence
+    from music_theory.pitch_class_set import PitchClassSet
+    from music_theory.progressions import Progression, ProgressionCompiler, NumeralProgressions, SongProgressions, NumeralCadences, chords_from_progression
+    from music_theory.scale_diatonic import DiatonicScale
+    from music_theory.scale_type import ScaleType
+    from music_theory.scales import Scale, modes_from_note, scales_containing
+    from music_theory.string_instrument import StringInstrument
@@ -0,0 +1,500 @@
+"""
+This module analyses large collections of songs for key, progression and
+chord statistics, sharding the input files across a process pool.
+
+Description:
+    Songs are read from text files, one song per line, and from binary
+    corpus files (see `corpus`). A text line is either a note list
+    (`C E G A`) or a chord chart written in the notation `str(Chord)` uses
+    (`CM Am FM G7`, with `dim`, `dim7`, `maj` and `maj7` also accepted). A
+    bare root is a major triad in a chord chart (`C Am F G`), but a line of
+    only bare note names is always a note list. Blank lines and lines
+    starting with `#` are skipped, other lines are counted as invalid.
+
+    The key of a note list is detected from its note histogram and the key
+    of a chord chart from its chords (see `key_detection`). The chords of a
+    chart are also counted by quality, by Roman numeral in the detected key
+    and by pairs of consecutive numerals, which gives progression
+    statistics that don't depend on the key.
+
+    Input files are split into shards of about `shard_bytes`: byte ranges of
+    text files (each line belongs to the shard it starts in) and ranges of
+    songs of corpus files. Each worker process warms the scale, chord and
+    key tables once, then analyses whole shards and returns a `CorpusStats`
+    of integer counts, which pickles to a few hundred bytes rather than a
+    list of Chords and Keys. Shards are merged in input order, and as every
+    aggregate is a count the result is the same for any number of workers.
+
+Classes:
+    Shard:
+        A named tuple describing a part of an input file.
+    CorpusStats:
+        Mergeable counts of keys, notes, chords and numerals.
+
+Functions:
+    make_shards(paths, shard_bytes=4_194_304) -> list[Shard]:
+        Splits input files into shards.
+    analyze_shard(shard) -> CorpusStats:
+        Analyses a single shard.
+    analyze(paths, workers=None, shard_bytes=4_194_304) -> CorpusStats:
+        Analyses every input file across a process pool.
+    main(argv=None) -> int:
+        The command line entry point.
+
+Example:
+    >>> stats = analyze(["songs.txt", "charts.txt", "melodies.mtc"], workers=4)
+    >>> stats.songs, stats.top_keys(2)
+    (250000, [(Key(C Major), 41250), (Key(G Major), 30110)])
+    $ python -m music_theory.analysis songs.txt charts.txt -j 4 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from os import PathLike
+from typing import Iterable, NamedTuple, Self
+
+from music_theory.chord_type import ChordType
+from music_theory.chords import Chord, CHORD_NOTATIONS
+from music_theory.corpus import MAGIC, Corpus
+from music_theory.key_detection import KEYS, rank_keys_for_chords, rank_keys_for_histogram
+from music_theory.keys import Key
+from music_theory.note_parser import NOTE_TOKENS
+from music_theory.notes import NOTES
+from music_theory.scale_type import ScaleType
+from music_theory.scales import Scale
+
+DEFAULT_SHARD_BYTES = 4 * 1024 * 1024
+
+# Spellings accepted in chord charts as well as CHORD_NOTATIONS. A bare root
+# is a major triad.
+CHORD_NOTATION_ALIASES: dict[ChordType, tuple[str, ...]] = {
+    ChordType.Major: ("maj", ""),
+    ChordType.Diminished: ("dim",),
+    ChordType.Major7: ("maj7",),
+    ChordType.Diminished7: ("dim7",),
+}
+
+# Every chord symbol accepted in a chart, mapped to its Chord.
+_CHORD_SYMBOLS: dict[str, Chord] = {
+    root_str + notation: Chord(root, chord_type)
+    for root_str, root in NOTE_TOKENS.items()
+    for chord_type in ChordType
+    for notation in (CHORD_NOTATIONS[chord_type], *CHORD_NOTATION_ALIASES.get(chord_type, ()))
+}
+
+_KEY_INDEX: dict[Key, int] = {key: index for index, key in enumerate(KEYS)}
+
+# _CHORD_NUMERALS[i] maps the chords, parallel chords and dominant chords of
+# KEYS[i] to their numerals, built by _warm_up.
+_CHORD_NUMERALS: list[dict[Chord, str]] = []
+
+# The numeral of a chord that isn't in the detected key.
+UNKNOWN_NUMERAL = "?"
+
+#region CorpusStats
+
+class CorpusStats:
+    """
+    Counts of keys, notes, chords and numerals over a set of songs. Only
+    holds ints, lists and dicts of ints, so it is cheap to pickle and two
+    stats merge exactly.
+
+    Attributes:
+        songs (int):
+            The number of songs analysed (note lists and chord charts).
+        note_songs (int):
+            The number of note lists.
+        chord_songs (int):
+            The number of chord charts.
+        invalid (int):
+            The number of lines that were neither.
+        keys (list[int]):
+            How many songs were detected in each key, in the order of
+            `key_detection.KEYS`.
+        pitch_classes (list[int]):
+            How often each note was heard in the note lists.
+        chord_types (list[int]):
+            How often each ChordType was used in the chord charts.
+        numerals (dict[str, int]):
+            How often each numeral was used, relative to the detected key.
+        transitions (dict[str, int]):
+            How often each pair of consecutive numerals was used, as
+            "I-V".
+
+    Methods:
+        merge(self, other):
+            Adds the counts of another CorpusStats to this one.
+        top_keys(self, n=5):
+            The most common keys and their counts.
+        to_dict(self):
+            The counts as a JSON compatible dict.
+    """
+    __slots__ = ('songs', 'note_songs', 'chord_songs', 'invalid', 'keys',
+                 'pitch_classes', 'chord_types', 'numerals', 'transitions')
+
+    def __init__(self) -> None:
+        self.songs = 0
+        self.note_songs = 0
+        self.chord_songs = 0
+        self.invalid = 0
+        self.keys = [0] * len(KEYS)
+        self.pitch_classes = [0] * len(NOTES)
+        self.chord_types = [0] * len(ChordType)
+        self.numerals: dict[str, int] = {}
+        self.transitions: dict[str, int] = {}
+
+    def add_notes(self, histogram: list[int]) -> None:
+        """
+        Counts a note list from its note histogram.
+        """
+        self.songs += 1
+        self.note_songs += 1
+        self.pitch_classes = [a + b for a, b in zip(self.pitch_classes, histogram)]
+
+        ranked = rank_keys_for_histogram(histogram)
+
+        if ranked[0][1]:
+            self.keys[_KEY_INDEX[ranked[0][0]]] += 1
+
+    def add_chords(self, chords: list[Chord]) -> None:
+        """
+        Counts a chord chart.
+        """
+        self.songs += 1
+        self.chord_songs += 1
+
+        for chord in chords:
+            self.chord_types[chord.chord_type._value_] += 1
+
+        key, score = rank_keys_for_chords(chords)[0]
+
+        if not score:
+            return
+
+        index = _KEY_INDEX[key]
+        self.keys[index] += 1
+
+        numerals = _CHORD_NUMERALS or _warm_up()
+        in_key = numerals[index]
+        song = [in_key.get(chord, UNKNOWN_NUMERAL) for chord in chords]
+
+        for numeral in song:
+            self.numerals[numeral] = self.numerals.get(numeral, 0) + 1
+
+        for pair in map("-".join, zip(song, song[1:])):
+            self.transitions[pair] = self.transitions.get(pair, 0) + 1
+
+    def merge(self, other: Self) -> None:
+        """
+        Adds the counts of another CorpusStats to this one.
+
+        Args:
+            other (CorpusStats):
+                The stats to add.
+        """
+        self.songs += other.songs
+        self.note_songs += other.note_songs
+        self.chord_songs += other.chord_songs
+        self.invalid += other.invalid
+        self.keys = [a + b for a, b in zip(self.keys, other.keys)]
+        self.pitch_classes = [a + b for a, b in zip(self.pitch_classes, other.pitch_classes)]
+        self.chord_types = [a + b for a, b in zip(self.chord_types, other.chord_types)]
+
+        for mine, theirs in ((self.numerals, other.numerals), (self.transitions, other.transitions)):
+            for name, count in theirs.items():
+                mine[name] = mine.get(name, 0) + count
+
+    def top_keys(self, n: int=5) -> list[tuple[Key, int]]:
+        """
+        Returns the n most common keys and how many songs are in each, most
+        common first (ties in the order of `key_detection.KEYS`).
+
+        Args:
+            n (int):
+                How many keys to return.
+
+        Returns:
+            list[tuple[Key, int]]:
+        """
+        ranked = sorted(zip(KEYS, self.keys), key=lambda kc: -kc[1])
+        return [(key, count) for key, count in ranked[:n] if count]
+
+    def to_dict(self) -> dict:
+        """
+        Returns the counts as a JSON compatible dict. Keys, notes and chord
+        types are named, and numerals and transitions are sorted by count
+        then name so equal stats always give the same dict.
+
+        Returns:
+            dict:
+        """
+        def by_count(counts):
+            return dict(sorted(counts.items(), key=lambda nc: (-nc[1], nc[0])))
+
+        return {
+            "songs": self.songs,
+            "note_songs": self.note_songs,
+            "chord_songs": self.chord_songs,
+            "invalid": self.invalid,
+            "keys": {key.name: count for key, count in zip(KEYS, self.keys) if count},
+            "pitch_classes": {note.name: count for note, count in zip(NOTES, self.pitch_classes)},
+            "chord_types": {chord_type.name: count for chord_type, count in zip(ChordType, self.chord_types)},
+            "numerals": by_count(self.numerals),
+            "transitions": by_count(self.transitions),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CorpusStats):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __reduce__(self):
+        return (_restore_stats, tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"CorpusStats({self.songs} songs, {self.invalid} invalid)"
+
+def _restore_stats(*values) -> CorpusStats:
+    stats = CorpusStats.__new__(CorpusStats)
+
+    for name, value in zip(CorpusStats.__slots__, values):
+        setattr(stats, name, value)
+
+    return stats
+
+#endregion
+
+#region Shards
+
+class Shard(NamedTuple):
+    """
+    A part of an input file: the byte range [start, stop) of a text file, or
+    the songs [start, stop) of a corpus file.
+    """
+    path: str
+    start: int
+    stop: int
+    binary: bool
+
+def _is_corpus(path: str | PathLike) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def make_shards(paths: Iterable[str | PathLike], shard_bytes: int=DEFAULT_SHARD_BYTES) -> list[Shard]:
+    """
+    Splits input files into shards of about `shard_bytes` each, in input
+    order. Corpus files are validated and split by songs, so a shard holds
+    about `shard_bytes` notes.
+
+    Example:
+        >>> make_shards(["songs.txt"], shard_bytes=1000)
+        [Shard(path='songs.txt', start=0, stop=1000, binary=False), Shard(path='songs.txt', start=1000, stop=1523, binary=False)]
+
+    Args:
+        paths (Iterable[str | PathLike]):
+            Text and corpus files.
+        shard_bytes (int):
+            The size of each shard.
+
+    Raises:
+        ValueError:
+            If shard_bytes is less than 1, or a corpus file isn't valid.
+
+    Returns:
+        list[Shard]:
+    """
+    if shard_bytes < 1:
+        raise ValueError(f"Shards must be at least 1 byte, not {shard_bytes}")
+
+    shards = []
+
+    for path in map(os.fspath, paths):
+        if _is_corpus(path):
+            with Corpus(path) as corpus:
+                count, notes = len(corpus), corpus.note_count
+
+            step = max(1, -(-count * shard_bytes // notes)) if notes else count or 1
+            shards.extend(Shard(path, start, min(start + step, count), True) for start in range(0, count, step))
+        else:
+            size = os.path.getsize(path)
+            shards.extend(Shard(path, start, min(start + shard_bytes, size), False) for start in range(0, size, shard_bytes))
+
+    return shards
+
+def _analyze_text(shard: Shard, stats: CorpusStats) -> None:
+    notes, symbols = NOTE_TOKENS, _CHORD_SYMBOLS
+
+    with open(shard.path, "rb") as f:
+        position = shard.start
+
+        # The line ending just before the shard belongs to the previous one.
+        if position:
+            f.seek(position - 1)
+            position += len(f.readline()) - 1
+
+        while position < shard.stop:
+            line = f.readline()
+
+            if not line:
+                break
+
+            position += len(line)
+            tokens = line.decode("utf-8", "replace").split()
+
+            if not tokens or tokens[0].startswith("#"):
+                continue
+
+            song = [notes.get(token) for token in tokens]
+
+            if None not in song:
+                histogram = [0] * 12
+
+                for note in song:
+                    histogram[note._value_] += 1
+
+                stats.add_notes(histogram)
+                continue
+
+            chords = [symbols.get(token) for token in tokens]
+
+            if None not in chords:
+                stats.add_chords(chords)
+            else:
+                stats.invalid += 1
+
+def _analyze_corpus(shard: Shard, stats: CorpusStats) -> None:
+    with Corpus(shard.path, validate=False) as corpus:
+        for index in range(shard.start, shard.stop):
+            stats.add_notes(corpus.song_histogram(index))
+
+def analyze_shard(shard: Shard) -> CorpusStats:
+    """
+    Analyses the songs of a single shard.
+
+    Args:
+        shard (Shard):
+            The part of an input file to analyse.
+
+    Returns:
+        CorpusStats:
+    """
+    stats = CorpusStats()
+
+    if shard.binary:
+        _analyze_corpus(shard, stats)
+    else:
+        _analyze_text(shard, stats)
+
+    return stats
+
+#endregion
+
+#region Driver
+
+def _warm_up() -> list[dict[Chord, str]]:
+    """
+    Builds the tables every song needs once per process: every Scale, the
+    chords of every key, the key detection indexes and the numeral of each
+    chord in each key.
+    """
+    for root in NOTES:
+        for scale_type in ScaleType:
+            Scale(root, scale_type)
+
+    rank_keys_for_histogram([1] * 12)
+    rank_keys_for_chords([Chord(NOTES[0])])
+
+    if not _CHORD_NUMERALS:
+        for key in KEYS:
+            numerals = {}
+
+            # Later tables win, so a diatonic chord keeps its own numeral
+            for chords in (key.dominant_chords(), key.parallel_chords(), key.chords()):
+                numerals.update({chord: numeral for numeral, chord in chords.items()})
+
+            _CHORD_NUMERALS.append(numerals)
+
+    return _CHORD_NUMERALS
+
+def analyze(paths: Iterable[str | PathLike], workers: int | None=None, shard_bytes: int=DEFAULT_SHARD_BYTES) -> CorpusStats:
+    """
+    Analyses every song of every input file, sharding the files across a
+    process pool.
+
+    Example:
+        >>> analyze(["charts.txt"], workers=2).top_keys(1)
+        [(Key(G Major), 1204)]
+
+    Args:
+        paths (Iterable[str | PathLike]):
+            Text and corpus files.
+        workers (int | None):
+            The number of worker processes, `os.cpu_count()` when None. With
+            1 the shards are analysed in this process, without a pool.
+        shard_bytes (int):
+            The size of each shard (see `make_shards`).
+
+    Raises:
+        ValueError:
+            If workers or shard_bytes is less than 1, or a corpus file isn't
+            valid.
+
+    Returns:
+        CorpusStats:
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"Analysis needs at least 1 worker, not {workers}")
+
+    shards = make_shards(paths, shard_bytes)
+    total = CorpusStats()
+
+    if workers == 1:
+        _warm_up()
+
+        for stats in map(analyze_shard, shards):
+            total.merge(stats)
+
+        return total
+
+    with ProcessPoolExecutor(workers, initializer=_warm_up) as pool:
+        for stats in pool.map(analyze_shard, shards):
+            total.merge(stats)
+
+    return total
+
+def main(argv: list[str] | None=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m music_theory.analysis", description="Analyses songs for key, progression and chord statistics.")
+    parser.add_argument("paths", nargs="+", metavar="path", help="text files (one song per line) or corpus files")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: every core)")
+    parser.add_argument("--shard-bytes", type=int, default=DEFAULT_SHARD_BYTES, help="shard size (default: %(default)s)")
+    parser.add_argument("--json", action="store_true", help="write the statistics as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        stats = analyze(args.paths, args.workers, args.shard_bytes)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.json:
+        json.dump(stats.to_dict(), sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return 0
+
+    document = stats.to_dict()
+    print(f"{stats.songs:,} songs ({stats.note_songs:,} note lists, {stats.chord_songs:,} chord charts), {stats.invalid:,} invalid lines")
+
+    for title, counts in (("keys", dict(sorted(document["keys"].items(), key=lambda kc: -kc[1]))),
+                          ("numerals", document["numerals"]), ("transitions", document["transitions"])):
+        top = ", ".join(f"{name} {count:,}" for name, count in list(counts.items())[:8])
+        print(f"{title:<12} {top}")
+
+    return 0
+
+#endregion
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+This module provides bulk versions of `transpose`, `interval_distance` and
+`Note.from_string` that work on whole arrays of pitch classes at once.
+
+Description:
+    A pitch class is the integer value of a `Note` (0 for C up to 11 for B).
+    Melodies are passed around as arrays of these integers rather than lists
+    of `Note` objects, and every function here processes the whole array in
+    one call.
+
+    When NumPy is installed the results are `numpy.ndarray`s of dtype uint8,
+    otherwise they are `array.array('B')`s. Either kind of array (or any
+    sequence of ints) is accepted as input.
+
+    Tokens that can't be parsed are stored as `INVALID`, and `INVALID`
+    entries pass through transposition and interval calculations unchanged.
+
+Functions:
+    from_notes(notes) -> array:
+        Converts an iterable of Notes into an array of pitch classes.
+    to_notes(pitch_classes, error=None) -> list[Note|Any]:
+        Converts an array of pitch classes back into a list of Notes.
+    transpose(pitch_classes, interval, direction="u") -> array:
+        Transposes every pitch class by an interval.
+    interval_distance(first, second, direction="u") -> array:
+        The interval (as an int) between each pair of pitch classes.
+    parse_notes(tokens) -> array:
+        Parses note strings (an iterable, or one whitespace separated string).
+
+Example:
+    >>> from music_theory import batch
+    >>> melody = batch.parse_notes("C E G Bb")
+    >>> batch.to_notes(batch.transpose(melody, Interval.M2))
+    [Note.D, Note.Gb, Note.A, Note.C]
+"""
+
+from array import array
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+from music_theory.intervals import Interval
+from music_theory.notes import Note, NOTES, NOTE_STRINGS
+from music_theory.utils import direction_sign
+
+INVALID = 0xFF
+
+HAS_NUMPY = np is not None
+
+#region Lookup Tables
+
+# _TRANSPOSE_TABLES[s] is a 256 byte translation table moving pitch classes
+# up by s semitones, every other byte (including INVALID) maps to itself.
+_TRANSPOSE_TABLES: tuple[bytes, ...] = tuple(
+    bytes((i + s) % 12 if i < 12 else i for i in range(256)) for s in range(12)
+)
+
+# Every string accepted by Note.from_string, mapped to its pitch class.
+_TOKEN_TABLE: dict[str, int] = {token: note.value for token, note in NOTE_STRINGS.items()}
+
+if HAS_NUMPY:
+    _NP_TRANSPOSE_TABLES = tuple(np.frombuffer(t, dtype=np.uint8) for t in _TRANSPOSE_TABLES)
+
+#endregion
+
+#region Functions
+
+def _as_array(values: Sequence[int]):
+    """
+    Returns the values as the active backend's array type, without copying if
+    they already are one.
+    """
+    if HAS_NUMPY:
+        return np.asarray(values, dtype=np.uint8)
+
+    if isinstance(values, array) and values.typecode == 'B':
+        return values
+
+    return array('B', values)
+
+def from_notes(notes: Iterable[Note]):
+    """
+    Converts an iterable of Notes into an array of pitch classes.
+
+    Example:
+        >>> from_notes([Note.C, Note.Bb])
+        array('B', [0, 10])
+
+    Args:
+        notes (Iterable[Note]):
+            The notes to convert.
+
+    Returns:
+        array:
+            A uint8 array of pitch classes.
+    """
+    return _as_array([n.value for n in notes])
+
+def to_notes(pitch_classes: Sequence[int], error: Any=None) -> list[Note|Any]:
+    """
+    Converts an array of pitch classes back into a list of Notes.
+
+    Example:
+        >>> to_notes(array('B', [0, 10, 255]), error='X')
+        [Note.C, Note.Bb, 'X']
+
+    Args:
+        pitch_classes (Sequence[int]):
+            The pitch classes to convert.
+        error (Any):
+            A fallback value for `INVALID` entries (default: `None`).
+
+    Returns:
+        list[Note|Any]:
+    """
+    lookup = NOTES + (error,) * (256 - len(NOTES))
+    return [lookup[pc] for pc in _as_array(pitch_classes)]
+
+def transpose(pitch_classes: Sequence[int], interval: Interval, direction: str="u"):
+    """
+    Transposes every pitch class in an array by the same interval. The
+    bulk equivalent of `notes.transpose`.
+
+    Example:
+        >>> transpose(array('B', [0, 4, 7]), Interval.P4, "down")
+        array('B', [7, 11, 2])
+
+    Args:
+        pitch_classes (Sequence[int]):
+            The pitch classes (0 to 11, or `INVALID`) to transpose.
+        interval (Interval):
+            The interval to transpose the notes.
+        direction (str):
+            Can either transpose up or down in pitch. acceptable values are
+            "u", "up", "above", "d", "down" or "below" in any case.
+
+    Raises:
+        ValueError:
+            If the direction string is not recognized.
+
+    Returns:
+        array:
+            A new uint8 array of transposed pitch classes.
+    """
+    semitones = (direction_sign(direction) * interval.value) % 12
+    pitch_classes = _as_array(pitch_classes)
+
+    if HAS_NUMPY:
+        return _NP_TRANSPOSE_TABLES[semitones][pitch_classes]
+
+    return array('B', pitch_classes.tobytes().translate(_TRANSPOSE_TABLES[semitones]))
+
+def interval_distance(first: Sequence[int], second: Sequence[int], direction: str="u"):
+    """
+    Calculates the interval between each pair of pitch classes from two
+    equally sized arrays. The bulk equivalent of `intervals.interval_distance`,
+    returning `Interval` values rather than `Interval` objects.
+
+    Example:
+        >>> interval_distance(array('B', [0, 9]), array('B', [7, 0]), "u")
+        array('B', [7, 3])
+
+    Args:
+        first (Sequence[int]):
+            The pitch classes to start measuring from.
+        second (Sequence[int]):
+            The pitch classes above or below the first.
+        direction (str):
+            Can either check distance up or down in pitch. acceptable values are
+            "u", "up", "above", "d", "down" or "below" in any case.
+
+    Raises:
+        ValueError:
+            - If the direction string is not recognized.
+            - If the arrays are different lengths.
+
+    Returns:
+        array:
+            A new uint8 array of interval values (0 to 11, or `INVALID`).
+    """
+    sign = direction_sign(direction)
+    first, second = _as_array(first), _as_array(second)
+
+    if len(first) != len(second):
+        raise ValueError(f"Arrays must be the same length: {len(first)} != {len(second)}")
+
+    if sign < 0:
+        first, second = second, first
+
+    if HAS_NUMPY:
+        distances = ((second.astype(np.int16) - first) % 12).astype(np.uint8)
+        distances[(first == INVALID) | (second == INVALID)] = INVALID
+        return distances
+
+    return array('B', [
+        (b - a) % 12 if a != INVALID and b != INVALID else INVALID
+        for a, b in zip(first, second)
+    ])
+
+def parse_notes(tokens: str | Iterable[str]):
+    """
+    Parses note strings into an array of pitch classes. The bulk equivalent of
+    `Note.from_string`, tokens that `Note.from_string` rejects become
+    `INVALID`.
+
+    Example:
+        >>> parse_notes("C c# Ebb H")
+        array('B', [0, 1, 2, 255])
+
+    Args:
+        tokens (str | Iterable[str]):
+            Either an iterable of note strings or a single string of note
+            names separated by whitespace.
+
+    Returns:
+        array:
+            A uint8 array with one pitch class per token.
+    """
+    if isinstance(tokens, str):
+        tokens = tokens.split()
+
+    get = _TOKEN_TABLE.get
+    return _as_array([get(t, INVALID) for t in tokens])
+
+#endregion
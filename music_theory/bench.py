@@ -0,0 +1,470 @@
+"""
+This module is the benchmark suite for the package, run with
+`python -m music_theory.bench`.
+
+Description:
+    Every benchmark case times one pass over a synthetic `Workload`, a seeded
+    set of random inputs (notes, note strings, scales, chords, keys, numeral
+    progressions and guitar chord shapes) so that results are repeatable
+    between runs and machines.
+
+    Each case is first run `warmup` times, which also fills the package's
+    caches (interned Scales, Chords and Keys, rendered tables) so the timed
+    runs measure the steady state. It is then run `runs` times, timing every
+    batch of BATCH_SIZE operations, and the per-operation latency of every
+    batch gives the p50 and p99 latencies.
+
+    Allocations are measured on one extra run with `tracemalloc` tracing:
+    the peak bytes allocated while the run was in progress, and the number
+    of memory blocks still allocated per operation once it finished. CPython
+    has no counter of individual allocations, so these two figures stand in
+    for one.
+
+    Results are printed as a table, or written as JSON with `--json`.
+
+Classes:
+    Workload:
+        The synthetic inputs shared by every benchmark case.
+    Result:
+        The measurements of a single benchmark case.
+
+Functions:
+    generate_workload(size=1000, seed=0) -> Workload:
+        Builds a workload of `size` random inputs of each kind.
+    run_case(name, workload, runs=30, warmup=3) -> Result:
+        Times a single benchmark case.
+    run_suite(names=None, size=1000, runs=30, warmup=3, seed=0) -> list[Result]:
+        Times every (or the named) benchmark cases.
+    main(argv=None) -> int:
+        The command line entry point.
+
+Example:
+    $ python -m music_theory.bench --size 500 --runs 20 transpose Scale
+    $ python -m music_theory.bench --json results.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from typing import Callable, NamedTuple, Sequence, TextIO
+
+from music_theory.chord_type import ChordType
+from music_theory.chords import Chord
+from music_theory.instrument_creator import E_STANDARD_GUITAR
+from music_theory.intervals import Interval, interval_distance
+from music_theory.key_type import KeyType
+from music_theory.keys import Key, KEY_CHORD_NUMERALS
+from music_theory.notes import Note, NOTES, NOTE_STRINGS, transpose
+from music_theory.progressions import chords_from_progression
+from music_theory.scale_diatonic import DiatonicScale
+from music_theory.scale_type import ScaleType
+from music_theory.scales import Scale, modes_from_note
+
+DEFAULT_SIZE = 1000
+DEFAULT_RUNS = 30
+DEFAULT_WARMUP = 3
+
+# Operations are timed in batches of this many, short enough for the
+# percentiles to show slow operations and long enough for the cost of
+# reading the clock to stay small.
+BATCH_SIZE = 8
+
+# Note strings Note.from_string rejects, mixed into the workload so the
+# failure path is timed as well.
+INVALID_NOTE_STRINGS = ("H", "C###", "Fbbb", "", "do")
+
+#region Workload
+
+class Workload(NamedTuple):
+    """
+    The synthetic inputs shared by every benchmark case. Each field holds
+    `size` inputs.
+    """
+    size: int
+    seed: int
+    notes: list[Note]
+    intervals: list[Interval]
+    directions: list[str]
+    note_strings: list[str]
+    scales: list[tuple[Note, ScaleType]]
+    chords: list[tuple[Note, ChordType]]
+    keys: list[Key]
+    key_options: list[tuple[bool, bool]]
+    progressions: list[tuple[Key, list[str]]]
+    chord_shapes: list[str]
+
+def _chord_shape(rng: random.Random, num_strings: int) -> str:
+    """
+    A random chord shape such as "x 3 2 0 1 0", muting about one string in 6.
+    """
+    base = rng.randrange(10)
+    return " ".join("x" if rng.random() < 0.15 else str(base + rng.randrange(4)) for _ in range(num_strings))
+
+def generate_workload(size: int=DEFAULT_SIZE, seed: int=0) -> Workload:
+    """
+    Builds a workload of `size` random inputs of each kind, the same inputs
+    for the same seed.
+
+    About 1 in 20 note strings can't be parsed and numeral progressions are
+    4 to 8 chords long, a few of which are borrowed from the parallel key.
+
+    Example:
+        >>> workload = generate_workload(100, seed=1)
+        >>> len(workload.notes)
+        100
+
+    Args:
+        size (int):
+            How many inputs of each kind to generate.
+        seed (int):
+            The seed for the random number generator.
+
+    Raises:
+        ValueError:
+            If size is less than 1.
+
+    Returns:
+        Workload:
+    """
+    if size < 1:
+        raise ValueError(f"Workloads must contain at least 1 input, not {size}")
+
+    rng = random.Random(seed)
+    valid_strings = list(NOTE_STRINGS)
+    numerals = KEY_CHORD_NUMERALS[KeyType.Major] + KEY_CHORD_NUMERALS[KeyType.Minor]
+    keys = [Key(note, key_type) for note in NOTES for key_type in KeyType]
+
+    def note_string():
+        if rng.random() < 0.05:
+            return rng.choice(INVALID_NOTE_STRINGS)
+        return rng.choice(valid_strings)
+
+    def progression():
+        key = rng.choice(keys)
+        own = KEY_CHORD_NUMERALS[key.type]
+        return key, [rng.choice(own) if rng.random() < 0.8 else rng.choice(numerals) for _ in range(rng.randint(4, 8))]
+
+    return Workload(
+        size=size,
+        seed=seed,
+        notes=[rng.choice(NOTES) for _ in range(size)],
+        intervals=[rng.choice(list(Interval)) for _ in range(size)],
+        directions=[rng.choice(("u", "d")) for _ in range(size)],
+        note_strings=[note_string() for _ in range(size)],
+        scales=[(rng.choice(NOTES), rng.choice(list(ScaleType))) for _ in range(size)],
+        chords=[(rng.choice(NOTES), rng.choice(list(ChordType))) for _ in range(size)],
+        keys=[rng.choice(keys) for _ in range(size)],
+        key_options=[(rng.random() < 0.5, rng.random() < 0.5) for _ in range(size)],
+        progressions=[progression() for _ in range(size)],
+        chord_shapes=[_chord_shape(rng, E_STANDARD_GUITAR.num_strings) for _ in range(size)],
+    )
+
+#endregion
+
+#region Benchmark cases
+
+# Each case takes the workload and returns its inputs, and a callable that
+# runs the operation once for every input in a slice of them and returns how
+# many operations it made.
+CASES: dict[str, Callable[[Workload], tuple[Sequence, Callable[[Sequence], int]]]] = {}
+
+def _case(name: str):
+    def register(make):
+        CASES[name] = make
+        return make
+    return register
+
+@_case("transpose")
+def _transpose(workload: Workload):
+    def run(args):
+        for note, interval, direction in args:
+            transpose(note, interval, direction)
+        return len(args)
+    return list(zip(workload.notes, workload.intervals, workload.directions)), run
+
+@_case("interval_distance")
+def _interval_distance(workload: Workload):
+    def run(args):
+        for first, second, direction in args:
+            interval_distance(first, second, direction)
+        return len(args)
+    return list(zip(workload.notes, workload.notes[1:] + workload.notes[:1], workload.directions)), run
+
+@_case("Note.from_string")
+def _note_from_string(workload: Workload):
+    def run(note_strings):
+        for note_str in note_strings:
+            Note.from_string(note_str)
+        return len(note_strings)
+    return workload.note_strings, run
+
+@_case("Scale")
+def _scale(workload: Workload):
+    def run(scales):
+        for root, scale_type in scales:
+            Scale(root, scale_type)
+        return len(scales)
+    return workload.scales, run
+
+@_case("modes_from_note")
+def _modes_from_note(workload: Workload):
+    def run(notes):
+        for note in notes:
+            modes_from_note(note)
+        return len(notes)
+    return workload.notes, run
+
+@_case("Chord")
+def _chord(workload: Workload):
+    def run(chords):
+        for root, chord_type in chords:
+            Chord(root, chord_type)
+        return len(chords)
+    return workload.chords, run
+
+@_case("Key.chords")
+def _key_chords(workload: Workload):
+    def run(keys):
+        for key in keys:
+            key.chords()
+        return len(keys)
+    return workload.keys, run
+
+@_case("Key.to_string_array")
+def _key_to_string_array(workload: Workload):
+    def run(args):
+        for key, (dominant, parallel) in args:
+            key.to_string_array(dominant, parallel)
+        return len(args)
+    return list(zip(workload.keys, workload.key_options)), run
+
+@_case("chords_from_progression")
+def _chords_from_progression(workload: Workload):
+    def run(progressions):
+        for key, numerals in progressions:
+            chords_from_progression(key, numerals)
+        return len(progressions)
+    return workload.progressions, run
+
+@_case("DiatonicScale.valid_scale_types")
+def _valid_scale_types(workload: Workload):
+    def run(calls):
+        for _ in calls:
+            DiatonicScale.valid_scale_types()
+        return len(calls)
+    return range(workload.size), run
+
+@_case("StringInstrument.notes_in_chord")
+def _notes_in_chord(workload: Workload):
+    notes_in_chord = E_STANDARD_GUITAR.notes_in_chord
+
+    def run(shapes):
+        for shape in shapes:
+            notes_in_chord(shape)
+        return len(shapes)
+    return workload.chord_shapes, run
+
+#endregion
+
+#region Running
+
+class Result(NamedTuple):
+    """
+    The measurements of a single benchmark case. Latencies are per operation
+    in nanoseconds.
+    """
+    name: str
+    ops: int
+    runs: int
+    ops_per_sec: float
+    mean_ns: float
+    p50_ns: float
+    p99_ns: float
+    peak_bytes: int
+    blocks_per_op: float
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """
+    The nearest-rank percentile of an already sorted list.
+    """
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+def _allocations(inputs: Sequence, run: Callable[[Sequence], int]) -> tuple[int, float]:
+    """
+    Returns the peak bytes traced during one run over the inputs, and how
+    many memory blocks per operation it left allocated.
+    """
+    tracemalloc.start()
+    try:
+        blocks = sys.getallocatedblocks()
+        ops = run(inputs)
+        retained = sys.getallocatedblocks() - blocks
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, max(retained, 0) / ops
+
+def run_case(name: str, workload: Workload, runs: int=DEFAULT_RUNS, warmup: int=DEFAULT_WARMUP) -> Result:
+    """
+    Times a single benchmark case over a workload.
+
+    Example:
+        >>> result = run_case("transpose", generate_workload(100), runs=5)
+        >>> result.ops
+        100
+
+    Args:
+        name (str):
+            The name of the case, a key of CASES.
+        workload (Workload):
+            The inputs to run the case over.
+        runs (int):
+            How many timed passes over the workload to make.
+        warmup (int):
+            How many untimed passes to make first.
+
+    Raises:
+        ValueError:
+            If the case doesn't exist or runs is less than 1.
+
+    Returns:
+        Result:
+    """
+    if name not in CASES:
+        raise ValueError(f"Unknown benchmark case '{name}'")
+    if runs < 1:
+        raise ValueError(f"Benchmarks need at least 1 run, not {runs}")
+
+    inputs, run = CASES[name](workload)
+    batches = [inputs[i:i + BATCH_SIZE] for i in range(0, len(inputs), BATCH_SIZE)]
+    perf_counter_ns = time.perf_counter_ns
+
+    for _ in range(warmup):
+        run(inputs)
+
+    latencies = []
+    total_ns = 0
+
+    for _ in range(runs):
+        for batch in batches:
+            start = perf_counter_ns()
+            ops = run(batch)
+            elapsed = perf_counter_ns() - start
+            total_ns += elapsed
+            latencies.append(elapsed / ops)
+
+    ops = len(inputs)
+    peak_bytes, blocks_per_op = _allocations(inputs, run)
+    latencies.sort()
+
+    return Result(
+        name=name,
+        ops=ops,
+        runs=runs,
+        ops_per_sec=ops * runs / (total_ns / 1e9) if total_ns else math.inf,
+        mean_ns=total_ns / (ops * runs),
+        p50_ns=_percentile(latencies, 50),
+        p99_ns=_percentile(latencies, 99),
+        peak_bytes=peak_bytes,
+        blocks_per_op=blocks_per_op,
+    )
+
+def run_suite(names: list[str] | None=None, size: int=DEFAULT_SIZE, runs: int=DEFAULT_RUNS,
+              warmup: int=DEFAULT_WARMUP, seed: int=0) -> list[Result]:
+    """
+    Times every benchmark case (or only the named ones) over one generated
+    workload.
+
+    Args:
+        names (list[str] | None):
+            The cases to run, in order. Every case is run when None.
+        size (int):
+            How many inputs of each kind the workload holds.
+        runs (int):
+            How many timed passes to make over the workload per case.
+        warmup (int):
+            How many untimed passes to make first per case.
+        seed (int):
+            The seed for the workload.
+
+    Raises:
+        ValueError:
+            If a case doesn't exist, or size or runs is less than 1.
+
+    Returns:
+        list[Result]:
+    """
+    workload = generate_workload(size, seed)
+    return [run_case(name, workload, runs, warmup) for name in (names or CASES)]
+
+def to_json(results: list[Result], size: int, runs: int, warmup: int, seed: int) -> dict:
+    """
+    The results of a suite along with its settings and the environment it was
+    run in, ready for `json.dump`.
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "workload": {"size": size, "runs": runs, "warmup": warmup, "seed": seed},
+        "benchmarks": [result._asdict() for result in results],
+    }
+
+def print_results(results: list[Result], out: TextIO | None=None) -> None:
+    """
+    Writes the results as a table, to stdout by default.
+    """
+    out = out or sys.stdout
+    width = max(len(result.name) for result in results)
+
+    out.write(f"{'case':<{width}}  {'ops/s':>12}  {'p50 ns':>10}  {'p99 ns':>10}  {'peak KB':>8}  {'blocks/op':>9}\n")
+
+    for r in results:
+        out.write(f"{r.name:<{width}}  {r.ops_per_sec:>12,.0f}  {r.p50_ns:>10,.0f}  {r.p99_ns:>10,.0f}  "
+                  f"{r.peak_bytes / 1024:>8.1f}  {r.blocks_per_op:>9.2f}\n")
+
+#endregion
+
+def main(argv: list[str] | None=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m music_theory.bench", description="Benchmarks the music_theory package.")
+    parser.add_argument("cases", nargs="*", metavar="case",
+                        help=f"cases to run (default: all), any of: {', '.join(CASES)}")
+    parser.add_argument("-n", "--size", type=int, default=DEFAULT_SIZE, help="inputs per workload (default: %(default)s)")
+    parser.add_argument("-r", "--runs", type=int, default=DEFAULT_RUNS, help="timed runs per case (default: %(default)s)")
+    parser.add_argument("-w", "--warmup", type=int, default=DEFAULT_WARMUP, help="warm-up runs per case (default: %(default)s)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="workload seed (default: %(default)s)")
+    parser.add_argument("--json", metavar="PATH", nargs="?", const="-",
+                        help="write JSON results to PATH, or stdout when no path is given")
+    args = parser.parse_args(argv)
+
+    try:
+        results = run_suite(args.cases, args.size, args.runs, args.warmup, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json is None:
+        print_results(results)
+        return 0
+
+    document = to_json(results, args.size, args.runs, args.warmup, args.seed)
+
+    if args.json == "-":
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -50,7 +50,7 @@ class ChordType(Enum):
             list[ChordType]:
                 A list of all supported ChordTypes.
         """  
-        return [n for n in cls]
+        return list(CHORD_TYPES)
 
     @classmethod
     def random(cls) -> Self:
@@ -61,7 +61,7 @@ class ChordType(Enum):
             ChordType:
                 A random ChordType
         """  
-        return random.choice(cls.items())
+        return random.choice(CHORD_TYPES)
 
     def __str__(self) -> str:
         """ 
@@ -87,4 +87,7 @@ class ChordType(Enum):
         Returns:
             str:
         """
-        return f'ChordType.{self.name}'
\ No newline at end of file
+        return f'ChordType.{self.name}'
+
+# All chord types in declaration order, shared by items() and random().
+CHORD_TYPES: tuple[ChordType, ...] = tuple(ChordType)
\ No newline at end of file
@@ -1,27 +1,75 @@
-from music_theory.notes import Note, transpose
+from typing import Iterable, NamedTuple, Self
+
+from music_theory.notes import Note, NOTES, transpose
 from music_theory.intervals import Interval
 from music_theory.chord_type import ChordType
+from music_theory.pitch_class_set import PitchClassSet
 from music_theory.utils import list_rotations
 
+#region Chord Tables
+
+# The intervals above the root that make up each type of chord.
+CHORD_FORMULAS: dict[ChordType, tuple[Interval, ...]] = {
+    ChordType.Major: (Interval.Unison, Interval.M3, Interval.P5),
+    ChordType.Minor: (Interval.Unison, Interval.m3, Interval.P5),
+    ChordType.Diminished: (Interval.Unison, Interval.m3, Interval.dim5),
+    ChordType.Dominant7: (Interval.Unison, Interval.M3, Interval.P5, Interval.m7),
+    ChordType.Major7: (Interval.Unison, Interval.M3, Interval.P5, Interval.M7),
+    ChordType.Minor7: (Interval.Unison, Interval.m3, Interval.P5, Interval.m7),
+    ChordType.Diminished7: (Interval.Unison, Interval.m3, Interval.dim5, Interval.M6),
+    ChordType.Sus2: (Interval.Unison, Interval.M2, Interval.P5),
+    ChordType.Sus4: (Interval.Unison, Interval.P4, Interval.P5),
+}
+
+CHORD_NOTATIONS: dict[ChordType, str] = {
+    ChordType.Major: "M",
+    ChordType.Minor: "m",
+    ChordType.Diminished: "°",
+    ChordType.Dominant7: "7",
+    ChordType.Major7: "Δ7",
+    ChordType.Minor7: "m7",
+    ChordType.Diminished7: "°7",
+    ChordType.Sus2: "sus2",
+    ChordType.Sus4: "sus4",
+}
+
+# Every (root, chord type) Chord, filled on the first Chord() call.
+_chord_registry: dict[tuple[Note, ChordType], "Chord"] = {}
+
+# Chords indexed by pitch class mask, and ChordMatches indexed by
+# mask | bass.value << 12. Filled on the first identify call.
+_chords_by_mask: dict[int, tuple["Chord", ...]] = {}
+_chords_by_voicing: dict[int, tuple["ChordMatch", ...]] = {}
+
+#endregion
+
 class Chord:
     """ 
     A class representing a musical chord. 
 
+    Chords are immutable flyweights. All 12 x 9 (root, ChordType) chords are
+    built the first time any chord is requested, after which Chord(root, 
+    chord_type) is a dict lookup returning the shared instance.
+
     Attributes:
         root:
             The Note the rest of the chord is built from.
-        type:
+        chord_type:
             A ChordType. 
         notes:
-            An array containing the root, 3rd(Major or Minor) & the 5th.
+            A tuple containing the root, 3rd(Major or Minor) & the 5th.
+        pitch_classes:
+            The notes as a PitchClassSet.
 
     Methods:
-        __init__(self, root, chord_type):
-            Constructs the chord.
+        __new__(cls, root, chord_type):
+            Returns the shared chord.
         random(cls):
             A class method to return a random chord.
         __eq__(self, other):
             Compares two chords.
+        __hash__(self):
+            Hashes the root and chord type.
         notation(self):
             Returns the chord's notation without the Note.
         quality(self):
@@ -39,9 +87,11 @@ class Chord:
         __repr__(self):
             Returns a string representation of the Chord.
     """
-    def __init__(self, root: Note, chord_type: ChordType = ChordType.Major) -> None:
+    __slots__ = ('root', 'chord_type', 'notes', 'pitch_classes', '_notation')
+
+    def __new__(cls, root: Note, chord_type: ChordType = ChordType.Major) -> Self:
         """ 
-        Constructs the chord.
+        Returns the chord for a root and ChordType.
 
         Args:
             root (Note):
@@ -51,40 +101,44 @@ class Chord:
 
         Raises:
             ValueError:
-                If the chord_type is not valid.
+                If the root or chord_type is not valid.
         """  
-        self.root, self.chord_type, self.notes = root, chord_type, []
-
-        match self.chord_type:
-            case ChordType.Major:
-                self.notes = [self.root, transpose(self.root, Interval.M3), transpose(self.root, Interval.P5)]
+        try:
+            return (_chord_registry or _build_chord_registry())[(root, chord_type)]
+        except KeyError:
+            pass
 
-            case ChordType.Minor:
-                self.notes = [self.root, transpose(self.root, Interval.m3), transpose(self.root, Interval.P5)]
+        if chord_type not in CHORD_FORMULAS:
+            raise ValueError(f"Unknown chord type: {chord_type}")
 
-            case ChordType.Diminished:
-                self.notes = [self.root, transpose(self.root, Interval.m3), transpose(self.root, Interval.dim5)]
+        raise ValueError(f"Unknown root note: {root}")
 
-            case ChordType.Dominant7:
-                self.notes = [self.root, transpose(self.root, Interval.M3), transpose(self.root, Interval.P5), transpose(self.root, Interval.m7)]
-            
-            case ChordType.Major7:
-                self.notes = [self.root, transpose(self.root, Interval.M3), transpose(self.root, Interval.P5), transpose(self.root, Interval.M7)]
+    def __setattr__(self, name: str, value) -> None:
+        """ 
+        Chords are immutable (they are shared between every caller).
 
-            case ChordType.Minor7:
-                self.notes = [self.root, transpose(self.root, Interval.m3), transpose(self.root, Interval.P5), transpose(self.root, Interval.m7)]
-            
-            case ChordType.Diminished7:
-                self.notes = [self.root, transpose(self.root, Interval.m3), transpose(self.root, Interval.dim5), transpose(self.root, Interval.M6)]
+        Raises:
+            AttributeError:
+                Always.
+        """
+        raise AttributeError(f"Chord is immutable, can't set '{name}'")
 
-            case ChordType.Sus2:
-                self.notes = [self.root, transpose(self.root, Interval.M2), transpose(self.root, Interval.P5)]        
+    def __delattr__(self, name: str) -> None:
+        """ 
+        Chords are immutable (they are shared between every caller).
 
-            case ChordType.Sus4:
-                self.notes = [self.root, transpose(self.root, Interval.P4), transpose(self.root, Interval.P5)]      
+        Raises:
+            AttributeError:
+                Always.
+        """
+        raise AttributeError(f"Chord is immutable, can't delete '{name}'")
 
-            case _:
-                raise ValueError(f"Unknown chord type: {self.chord_type}")
+    def __reduce__(self):
+        """ 
+        Pickles the chord as its root and type so that unpickling returns the
+        shared instance.
+        """
+        return (Chord, (self.root, self.chord_type))
     
     @classmethod
     def random(cls):
@@ -117,6 +171,15 @@ class Chord:
         except AttributeError:
             return False
 
+    def __hash__(self) -> int:
+        """ 
+        Returns a hash of the root and chord type, consistent with __eq__.
+
+        Returns:
+            int:
+        """
+        return hash((self.root, self.chord_type))
+
     @property
     def notation(self) -> str:
         """ 
@@ -133,33 +196,7 @@ class Chord:
         Returns:
             str:
         """    
-        match self.chord_type:
-            case ChordType.Minor:
-                return "m" 
-            
-            case ChordType.Diminished:
-                return "°"
-            
-            case ChordType.Dominant7:
-                return "7"   
-
-            case ChordType.Major7:
-                return "Δ7"            
-
-            case ChordType.Minor7:
-                return "m7"      
-
-            case ChordType.Diminished7:
-                return "°7"   
-                        
-            case ChordType.Sus2:
-                return "sus2"
-            
-            case ChordType.Sus4:
-                return f"sus4"
-            
-            case _:
-                return f"M"
+        return self._notation
             
     quality = notation  # Alias
 
@@ -174,7 +211,7 @@ class Chord:
         Returns:
             list[Note]
         """    
-        return self.notes + [transpose(self.root, Interval.M2)]
+        return [*self.notes, transpose(self.root, Interval.M2)]
 
     def add11(self) -> list[Note]:
         """ 
@@ -187,7 +224,7 @@ class Chord:
         Returns:
             list[Note]
         """    
-        return self.notes + [transpose(self.root, Interval.P4)]
+        return [*self.notes, transpose(self.root, Interval.P4)]
     
     def add13(self) -> list[Note]:
         """ 
@@ -200,7 +237,7 @@ class Chord:
         Returns:
             list[Note]:
         """    
-        return self.notes + [transpose(self.root, Interval.M6)]
+        return [*self.notes, transpose(self.root, Interval.M6)]
 
     def inversions(self) -> list[list[Note]]:
         """
@@ -251,9 +288,128 @@ class Chord:
         """
         return f"Chord({self.root}, {self.chord_type})"
 
-    
+
+class ChordMatch(NamedTuple):
+    """
+    A chord identified from a group of notes.
+
+    Attributes:
+        chord (Chord):
+            The matching chord.
+        inversion (int):
+            0 for root position, 1 for the first inversion and so on (the
+            index into `[chord.notes, *chord.inversions()]`).
+    """
+    chord: Chord
+    inversion: int
+
 #region Functions
 
+def _build_chord_registry() -> dict[tuple[Note, ChordType], Chord]:
+    """
+    Builds every (root, ChordType) Chord into the registry used by 
+    Chord.__new__.
+
+    Returns:
+        dict[tuple[Note, ChordType], Chord]:
+            The filled registry.
+    """
+    for chord_type, formula in CHORD_FORMULAS.items():
+        for root in NOTES:
+            chord = object.__new__(Chord)
+            notes = tuple(transpose(root, interval) for interval in formula)
+
+            object.__setattr__(chord, 'root', root)
+            object.__setattr__(chord, 'chord_type', chord_type)
+            object.__setattr__(chord, 'notes', notes)
+            object.__setattr__(chord, 'pitch_classes', PitchClassSet(notes))
+            object.__setattr__(chord, '_notation', CHORD_NOTATIONS[chord_type])
+
+            _chord_registry[(root, chord_type)] = chord
+
+    return _chord_registry
+
+def _build_chord_index() -> dict[int, tuple[ChordMatch, ...]]:
+    """
+    Builds the indexes used by `identify_chord` and 
+    `chords_from_pitch_classes` from every chord and its inversions.
+
+    Returns:
+        dict[int, tuple[ChordMatch, ...]]:
+            The filled voicing index.
+    """
+    by_mask, by_voicing = {}, {}
+
+    for chord in (_chord_registry or _build_chord_registry()).values():
+        mask = chord.pitch_classes.mask
+        by_mask.setdefault(mask, []).append(chord)
+
+        for inversion, notes in enumerate([chord.notes, *chord.inversions()]):
+            by_voicing.setdefault(mask | notes[0].value << 12, []).append(ChordMatch(chord, inversion))
+
+    _chords_by_mask.update((k, tuple(v)) for k, v in by_mask.items())
+    _chords_by_voicing.update((k, tuple(sorted(v, key=lambda m: m.inversion))) for k, v in by_voicing.items())
+
+    return _chords_by_voicing
+
+def identify_chord(notes: Iterable[Note]) -> tuple[ChordMatch, ...]:
+    """
+    Identifies the chords (and inversions) made by a group of notes. The first
+    note is taken as the bass, the order and repetition of the rest don't
+    matter. Matches in root position are listed first.
+
+    The result is a precomputed tuple, so identifying a chord only costs 
+    building the note mask and one dict lookup.
+
+    Example:
+        >>> identify_chord([Note.E, Note.G, Note.C])
+        (ChordMatch(chord=Chord(C, Major), inversion=1),)
+        >>> identify_chord([Note.C, Note.D, Note.G])
+        (ChordMatch(chord=Chord(C, Sus2), inversion=0), ChordMatch(chord=Chord(G, Sus4), inversion=1))
+
+    Args:
+        notes (Iterable[Note]):
+            The notes, lowest (bass) note first.
+
+    Returns:
+        tuple[ChordMatch, ...]:
+            Every matching chord, or an empty tuple if the notes don't make a
+            known chord.
+    """
+    mask, bass = 0, -1
+
+    for note in notes:
+        # _value_ is the plain attribute behind the (much slower) value property
+        value = note._value_
+
+        if bass < 0:
+            bass = value
+
+        mask |= 1 << value
+
+    return (_chords_by_voicing or _build_chord_index()).get(mask | bass << 12, ())
+
+def chords_from_pitch_classes(pitch_classes: PitchClassSet) -> tuple[Chord, ...]:
+    """
+    Returns every chord made of exactly the notes in a PitchClassSet, in any
+    inversion.
+
+    Example:
+        >>> chords_from_pitch_classes(PitchClassSet([Note.C, Note.Eb, Note.Gb, Note.A]))
+        (Chord(C, Diminished7), Chord(Eb, Diminished7), Chord(Gb, Diminished7), Chord(A, Diminished7))
+
+    Args:
+        pitch_classes (PitchClassSet):
+            The notes to identify.
+
+    Returns:
+        tuple[Chord, ...]:
+    """
+    if not _chords_by_mask:
+        _build_chord_index()
+
+    return _chords_by_mask.get(pitch_classes.mask, ())
+
 def unique_notes_in_chords(*args: Chord) -> list[Note]:
     """
     Collects all unique notes from the given Chords and returns them as a 
@@ -274,11 +430,11 @@ def unique_notes_in_chords(*args: Chord) -> list[Note]:
         list[Note]: 
             A list of unique Notes sorted by their value.
     """ 
-    notes: list[Note] = []
+    pitch_classes = PitchClassSet()
 
     for c in args:
-        notes.extend(c.notes)
+        pitch_classes |= c.pitch_classes
 
-    return sorted(set(notes), key=lambda n: n.value)
+    return pitch_classes.to_notes()
 
 #endregion
\ No newline at end of file
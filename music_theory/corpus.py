@@ -0,0 +1,536 @@
+"""
+This module defines a compact binary file format for large collections of
+melodies (a corpus), a streaming writer and a memory-mapped reader.
+
+Description:
+    A corpus file is laid out as:
+
+        header    24 bytes, little endian: magic b"MTCP", version (uint16),
+                  reserved (uint16), song count (uint64), note count (uint64)
+        notes     one pitch class byte (0 for C up to 11 for B) per note,
+                  every song packed back to back
+        padding   zero bytes up to the next multiple of 8
+        offsets   song count + 1 little endian uint64s, song i is
+                  notes[offsets[i]:offsets[i + 1]]
+
+    `CorpusWriter` streams songs to disk in fixed size chunks, so songs of
+    any length can be written without holding them in memory, then writes
+    the offsets and fills in the header when it is closed.
+
+    `Corpus` memory-maps a file, so opening it only reads the header (and,
+    unless turned off, makes one validation pass over the notes). Songs are `NoteSequence`s that view the mapped bytes directly, and the
+    note histograms used for key detection are counted straight from the
+    mapping, so the corpus is never copied into Python objects.
+
+Classes:
+    CorpusWriter:
+        Streams songs into a corpus file.
+    Corpus:
+        A read only, memory-mapped corpus file.
+
+Functions:
+    write_corpus(path, songs) -> int:
+        Writes every song from an iterable to a corpus file.
+
+Example:
+    >>> write_corpus("songs.mtc", ["C E G C", "A C E A"])
+    2
+    >>> with Corpus("songs.mtc") as corpus:
+    ...     print(corpus[1], corpus.detect_key(1))
+    A, C, E, A A Minor
+"""
+
+import sys
+from array import array
+from itertools import islice
+from mmap import mmap, ACCESS_READ
+from os import PathLike
+from struct import Struct
+from typing import BinaryIO, Iterable, Iterator
+
+from music_theory.key_detection import rank_keys_for_histogram
+from music_theory.keys import Key
+from music_theory.note_sequence import NoteSequence
+from music_theory.notes import Note, NOTES, notes_from_string
+from music_theory.pitch_class_set import PitchClassSet
+
+MAGIC = b"MTCP"
+VERSION = 1
+
+# magic, version, reserved, song count, note count
+_HEADER = Struct("<4sHHQQ")
+
+# Notes are written and counted this many at a time
+CHUNK_SIZE = 1 << 16
+
+# Every valid byte, deleting these from a buffer leaves only the invalid ones
+_PITCH_CLASS_BYTES = bytes(range(len(NOTES)))
+_SINGLE_BYTES = tuple(bytes([value]) for value in range(len(NOTES)))
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+def _histogram(view: memoryview) -> list[int]:
+    """
+    Counts each pitch class in a buffer, a chunk at a time.
+    """
+    histogram = [0] * 12
+
+    for start in range(0, len(view), CHUNK_SIZE):
+        chunk = view[start:start + CHUNK_SIZE].tobytes()
+
+        for value, single in enumerate(_SINGLE_BYTES):
+            histogram[value] += chunk.count(single)
+
+    return histogram
+
+#region CorpusWriter
+
+class CorpusWriter:
+    """
+    Streams songs into a corpus file. Use it as a context manager, or call
+    `close` to finish the file.
+
+    Attributes:
+        path (str | PathLike):
+            The file being written.
+        song_count (int):
+            The number of songs written so far.
+        note_count (int):
+            The number of notes written so far.
+
+    Methods:
+        add_song(self, notes):
+            Appends a song.
+        close(self):
+            Writes the offsets and header and closes the file.
+    """
+    __slots__ = ('path', '_file', '_offsets')
+
+    def __init__(self, path: str | PathLike) -> None:
+        """
+        Creates (or truncates) a corpus file.
+
+        Args:
+            path (str | PathLike):
+                The file to write.
+        """
+        self.path = path
+        self._file: BinaryIO | None = open(path, "wb")
+        self._offsets = array('Q', [0])
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+
+    @property
+    def song_count(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def note_count(self) -> int:
+        return self._offsets[-1]
+
+    def add_song(self, notes: str | NoteSequence | Iterable[Note]) -> int:
+        """
+        Appends a song, reading the notes a chunk at a time.
+
+        Example:
+            >>> with CorpusWriter("songs.mtc") as writer:
+            ...     writer.add_song(notes_from_string("C D E"))
+            0
+
+        Args:
+            notes (str | NoteSequence | Iterable[Note]):
+                The song's notes, or a string of note names separated by
+                whitespace (parsed with `notes_from_string`).
+
+        Raises:
+            ValueError:
+                - If the writer is closed.
+                - If a note is invalid, nothing of the song is written.
+
+        Returns:
+            int:
+                The index of the new song.
+        """
+        if self._file is None:
+            raise ValueError("Corpus writer is closed")
+
+        if isinstance(notes, str):
+            notes = notes_from_string(notes)
+
+        write = self._file.write
+        start = self._file.tell()
+        written = 0
+
+        try:
+            if isinstance(notes, NoteSequence):
+                written = write(notes.view)
+            else:
+                iterator = iter(notes)
+
+                while chunk := list(islice(iterator, CHUNK_SIZE)):
+                    # _value_ skips the Enum.value property, which is far slower per note
+                    written += write(bytes([note._value_ for note in chunk]))
+
+        except BaseException as e:
+            # Drop the partly written song so the file stays consistent
+            self._file.seek(start)
+            self._file.truncate()
+
+            if isinstance(e, AttributeError):
+                raise ValueError("Songs can only contain Notes") from None
+
+            raise
+
+        self._offsets.append(self._offsets[-1] + written)
+        return self.song_count - 1
+
+    def close(self) -> None:
+        """
+        Writes the offsets and header and closes the file. Closing twice does
+        nothing.
+        """
+        if self._file is None:
+            return
+
+        offsets = self._offsets
+
+        if sys.byteorder != "little": # pragma: no cover
+            offsets = array('Q', offsets)
+            offsets.byteswap()
+
+        self._file.write(bytes(_padding(self.note_count)))
+        self._file.write(offsets)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, self.song_count, self.note_count))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "CorpusWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"CorpusWriter({self.path!r}, {self.song_count} songs)"
+
+#endregion
+
+#region Corpus
+
+class Corpus:
+    """
+    A read only, memory-mapped corpus file. Use it as a context manager, or
+    call `close` when done.
+
+    Songs are NoteSequences that view the mapped file, so they must be
+    released (or copied with `NoteSequence.from_bytes(song.tobytes())`)
+    before the corpus is closed.
+
+    Attributes:
+        path (str | PathLike):
+            The file being read.
+        note_count (int):
+            The total number of notes in all songs.
+        notes (memoryview):
+            Every note of the corpus, as one read only buffer of pitch classes.
+
+    Methods:
+        song_histogram(self, index):
+            Counts each note in a song.
+        histogram(self):
+            Counts each note in the whole corpus.
+        pitch_classes(self, index):
+            Returns the notes used in a song as a PitchClassSet.
+        rank_keys(self, index):
+            Scores every key for a song, best first.
+        detect_key(self, index):
+            Returns the best matching key for a song.
+        detect_keys(self):
+            Yields the best matching key of every song.
+        close(self):
+            Releases the mapping.
+        __len__(self), __getitem__(self, index), __iter__(self):
+            Sequence behaviour over the songs.
+    """
+    __slots__ = ('path', 'note_count', 'notes', '_mmap', '_offsets')
+
+    def __init__(self, path: str | PathLike, validate: bool=True) -> None:
+        """
+        Memory-maps a corpus file.
+
+        Args:
+            path (str | PathLike):
+                The file to read.
+            validate (bool):
+                Check that every note byte is a pitch class and the offsets
+                are in order, which reads the whole file once (default:
+                `True`).
+
+        Raises:
+            ValueError:
+                If the file isn't a valid corpus.
+        """
+        self.path = path
+
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap(f.fileno(), 0, access=ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Not a corpus file: {path}") from None
+
+        try:
+            self._open(validate)
+        except ValueError:
+            self.close()
+            raise
+
+    def _open(self, validate: bool) -> None:
+        """
+        Reads the header and builds the views over the notes and offsets.
+        """
+        size = len(self._mmap)
+
+        if size < _HEADER.size:
+            raise ValueError(f"Not a corpus file: {self.path}")
+
+        magic, version, _, song_count, note_count = _HEADER.unpack_from(self._mmap)
+
+        if magic != MAGIC:
+            raise ValueError(f"Not a corpus file: {self.path}")
+
+        if version != VERSION:
+            raise ValueError(f"Unsupported corpus version: {version}")
+
+        offsets_start = _HEADER.size + note_count + _padding(note_count)
+
+        if size != offsets_start + 8 * (song_count + 1):
+            raise ValueError(f"Corpus file is truncated or corrupt: {self.path}")
+
+        # Only the slices are kept, close() has to release every view of the
+        # mapping before it can be closed
+        self.note_count = note_count
+        self.notes = memoryview(self._mmap)[_HEADER.size:_HEADER.size + note_count]
+
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mmap)[offsets_start:].cast('Q')
+        else: # pragma: no cover
+            self._offsets = array('Q', self._mmap[offsets_start:])
+            self._offsets.byteswap()
+
+        if not validate:
+            return
+
+        offsets = self._offsets
+
+        if offsets[0] != 0 or offsets[-1] != note_count or any(a > b for a, b in zip(offsets, offsets[1:])):
+            raise ValueError(f"Corpus offsets are corrupt: {self.path}")
+
+        for start in range(0, note_count, CHUNK_SIZE):
+            if self.notes[start:start + CHUNK_SIZE].tobytes().translate(None, _PITCH_CLASS_BYTES):
+                raise ValueError(f"Corpus notes are corrupt: {self.path}")
+
+    def _song_view(self, index: int) -> memoryview:
+        """
+        Returns the buffer of one song.
+        """
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(f"Song index out of range: {index}")
+
+        return self.notes[self._offsets[index]:self._offsets[index + 1]]
+
+    def song_histogram(self, index: int) -> list[int]:
+        """
+        Counts each note in a song, straight from the mapped file.
+
+        Args:
+            index (int):
+                The song's index.
+
+        Raises:
+            IndexError:
+                If the index is out of range.
+
+        Returns:
+            list[int]:
+                The count of each note, indexed by note value (C to B).
+        """
+        return _histogram(self._song_view(index))
+
+    def histogram(self) -> list[int]:
+        """
+        Counts each note in the whole corpus, straight from the mapped file.
+
+        Returns:
+            list[int]:
+                The count of each note, indexed by note value (C to B).
+        """
+        return _histogram(self.notes)
+
+    def pitch_classes(self, index: int) -> PitchClassSet:
+        """
+        Returns every note used in a song, e.g. to pass to
+        `scales_containing`.
+
+        Args:
+            index (int):
+                The song's index.
+
+        Raises:
+            IndexError:
+                If the index is out of range.
+
+        Returns:
+            PitchClassSet:
+        """
+        mask = 0
+
+        for value, count in enumerate(self.song_histogram(index)):
+            if count:
+                mask |= 1 << value
+
+        return PitchClassSet.from_mask(mask)
+
+    def rank_keys(self, index: int) -> list[tuple[Key, float]]:
+        """
+        Scores every key for a song, best first (see `key_detection`).
+
+        Args:
+            index (int):
+                The song's index.
+
+        Raises:
+            IndexError:
+                If the index is out of range.
+
+        Returns:
+            list[tuple[Key, float]]:
+        """
+        return rank_keys_for_histogram(self.song_histogram(index))
+
+    def detect_key(self, index: int) -> Key | None:
+        """
+        Returns the key that best matches a song.
+
+        Args:
+            index (int):
+                The song's index.
+
+        Raises:
+            IndexError:
+                If the index is out of range.
+
+        Returns:
+            Key | None:
+                The best key, or None if the song is empty.
+        """
+        ranked = self.rank_keys(index)
+        return ranked[0][0] if ranked[0][1] else None
+
+    def detect_keys(self) -> Iterator[Key | None]:
+        """
+        Yields the best matching key of every song, in order.
+
+        Returns:
+            Iterator[Key | None]:
+        """
+        for index in range(len(self)):
+            yield self.detect_key(index)
+
+    def close(self) -> None:
+        """
+        Releases the views and the mapping.
+
+        Raises:
+            BufferError:
+                If songs taken from the corpus are still referenced.
+        """
+        for name in ('_offsets', 'notes'):
+            view = getattr(self, name, None)
+
+            if isinstance(view, memoryview):
+                view.release()
+
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of songs.
+
+        Returns:
+            int:
+        """
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> NoteSequence:
+        """
+        Returns a song as a NoteSequence that views the mapped file.
+
+        Args:
+            index (int):
+                The song's index, negative indexes count from the end.
+
+        Raises:
+            IndexError:
+                If the index is out of range.
+
+        Returns:
+            NoteSequence:
+        """
+        return NoteSequence._from_view(self._song_view(index))
+
+    def __iter__(self) -> Iterator[NoteSequence]:
+        """
+        Iterates the songs in order.
+
+        Returns:
+            Iterator[NoteSequence]:
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def __enter__(self) -> "Corpus":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Corpus({self.path!r}, {len(self)} songs, {self.note_count} notes)"
+
+#endregion
+
+#region Functions
+
+def write_corpus(path: str | PathLike, songs: Iterable[str | NoteSequence | Iterable[Note]]) -> int:
+    """
+    Writes every song from an iterable to a corpus file, one at a time.
+
+    Example:
+        >>> write_corpus("songs.mtc", (notes_from_string(line) for line in open("songs.txt")))
+        1200
+
+    Args:
+        path (str | PathLike):
+            The file to write.
+        songs (Iterable[str | NoteSequence | Iterable[Note]]):
+            The songs, see `CorpusWriter.add_song`.
+
+    Raises:
+        ValueError:
+            If a song contains an invalid note.
+
+    Returns:
+        int:
+            The number of songs written.
+    """
+    with CorpusWriter(path) as writer:
+        for song in songs:
+            writer.add_song(song)
+
+        return writer.song_count
+
+#endregion
@@ -0,0 +1,190 @@
+"""
+This module defines the `Fretboard` class, a precomputed table of every note
+on a tuned neck together with a reverse index from notes to positions.
+
+Description:
+    A fretboard is built once per tuning and number of frets and then shared,
+    so looking up the note at a position or every position of a note is a
+    plain table lookup. `StringInstrument` keeps a reference to the fretboard
+    of its tuning and, on every access, checks it against the current tuning,
+    fetching the right one if the tuning has changed (through `add_capo`,
+    `detune`, `adjust_string` or by assigning to `tuning` or one of its
+    strings).
+
+    Positions are `(string_index, fret)` tuples, where string 0 is the first
+    note of the tuning (the lowest string) and fret 0 is the open string.
+
+Classes:
+    Fretboard:
+        A precomputed table of the notes on a tuned neck.
+
+Functions:
+    fretboard_for(tuning, num_frets=24) -> Fretboard:
+        Returns the shared fretboard for a tuning.
+
+Example:
+    >>> board = fretboard_for((Note.E, Note.A, Note.D, Note.G, Note.B, Note.E), 12)
+    >>> board.note_at(1, 3)
+    Note.C
+    >>> board.positions_of(Note.Eb)
+    ((0, 11), (1, 6), (2, 1), (3, 8), (4, 4), (5, 11))
+"""
+
+from array import array
+from functools import lru_cache
+from typing import Iterable
+
+from music_theory.notes import Note, NOTES, TRANSPOSE_TABLE, notes_to_string
+from music_theory.pitch_class_set import PitchClassSet
+
+DEFAULT_FRETS = 24
+
+#region Fretboard
+
+class Fretboard:
+    """
+    A precomputed table of the notes on a tuned neck, use `fretboard_for` to
+    get the shared instance for a tuning.
+
+    Attributes:
+        tuning (tuple[Note, ...]):
+            The open string notes, lowest string first.
+        num_frets (int):
+            The highest fret on the neck.
+        notes (tuple[tuple[Note, ...], ...]):
+            The fretboard matrix, `notes[string_index][fret]`.
+        pitch_classes (array):
+            The same matrix as a flat, row major `array('B')` of note values,
+            for bulk processing.
+
+    Methods:
+        note_at(self, string_index, fret):
+            Returns the note at a position.
+        positions_of(self, notes):
+            Returns every position of a note, or of any note in a set.
+    """
+    __slots__ = ('tuning', 'num_frets', 'notes', 'pitch_classes', '_positions', '_set_positions')
+
+    def __init__(self, tuning: Iterable[Note], num_frets: int=DEFAULT_FRETS) -> None:
+        """
+        Builds the table for a tuning.
+
+        Args:
+            tuning (Iterable[Note]):
+                The open string notes, lowest string first.
+            num_frets (int):
+                The highest fret on the neck (default: `24`).
+
+        Raises:
+            ValueError:
+                If the number of frets is negative.
+        """
+        if num_frets < 0:
+            raise ValueError(f"Frets can't be negative: {num_frets}")
+
+        self.tuning = tuple(tuning)
+        self.num_frets = num_frets
+        self.notes = tuple(
+            tuple(TRANSPOSE_TABLE[string.value][fret % 12] for fret in range(num_frets + 1))
+            for string in self.tuning
+        )
+        self.pitch_classes = array('B', (note.value for row in self.notes for note in row))
+
+        positions = [[] for _ in NOTES]
+
+        for string_index, row in enumerate(self.notes):
+            for fret, note in enumerate(row):
+                positions[note.value].append((string_index, fret))
+
+        # _positions[note.value] holds every position of a note
+        self._positions = tuple(tuple(p) for p in positions)
+        self._set_positions = {}
+
+    def note_at(self, string_index: int, fret: int) -> Note:
+        """
+        Returns the note at a position, without any validation.
+
+        Args:
+            string_index (int):
+                The index of the string in the tuning.
+            fret (int):
+                The fret, 0 is the open string.
+
+        Returns:
+            Note:
+        """
+        return self.notes[string_index][fret]
+
+    def positions_of(self, notes: Note | PitchClassSet) -> tuple[tuple[int, int], ...]:
+        """
+        Returns every position of a note, or of any note in a PitchClassSet.
+        Positions are ordered by string, then fret.
+
+        Example:
+            >>> board.positions_of(Chord(Note.C).pitch_classes)[:3]
+            ((0, 0), (0, 3), (0, 8))
+
+        Args:
+            notes (Note | PitchClassSet):
+                The note or notes to find.
+
+        Returns:
+            tuple[tuple[int, int], ...]:
+        """
+        if isinstance(notes, Note):
+            return self._positions[notes.value]
+
+        mask = notes.mask
+        positions = self._set_positions.get(mask)
+
+        if positions is None:
+            positions = tuple(sorted(p for note in notes for p in self._positions[note.value]))
+            self._set_positions[mask] = positions
+
+        return positions
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Equality operator, fretboards are equal if they have the same tuning
+        and number of frets.
+        """
+        if not isinstance(other, Fretboard):
+            return False
+
+        return (self.tuning, self.num_frets) == (other.tuning, other.num_frets)
+
+    def __hash__(self) -> int:
+        return hash((self.tuning, self.num_frets))
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representing the fretboard.
+
+        Example:
+            >>> repr(fretboard_for((Note.E, Note.A), 12))
+            Fretboard([E, A], 12)
+        """
+        return f"Fretboard([{notes_to_string(self.tuning)}], {self.num_frets})"
+
+#endregion
+
+#region Functions
+
+@lru_cache(maxsize=256)
+def fretboard_for(tuning: tuple[Note, ...], num_frets: int=DEFAULT_FRETS) -> Fretboard:
+    """
+    Returns the shared fretboard for a tuning, building it on first use. The
+    256 most recently used fretboards are kept.
+
+    Args:
+        tuning (tuple[Note, ...]):
+            The open string notes, lowest string first.
+        num_frets (int):
+            The highest fret on the neck (default: `24`).
+
+    Returns:
+        Fretboard:
+    """
+    return Fretboard(tuning, num_frets)
+
+#endregion
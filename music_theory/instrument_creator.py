@@ -29,22 +29,52 @@ def create_drop_guitar(note=Note.D):
 def create_ukulele():
         return StringInstrument([Note.G, Note.C, Note.E, Note.A])
 
-# Standard tunings
-E_STANDARD_GUITAR = create_standard_guitar()
-HALF_STEP_DOWN_GUITAR = create_standard_guitar(Note.Eb)
-D_STANDARD_GUITAR = create_standard_guitar(Note.D)
-C_STANDARD_GUITAR = create_standard_guitar(Note.C)
-
-# Drop tunings
-DROP_D_GUITAR = create_drop_guitar(Note.D)
-DOUBLE_DROP_D_GUITAR = StringInstrument([Note.D, Note.A, Note.D, Note.G, Note.B, Note.D])
-DROP_C_GUITAR = create_drop_guitar(Note.C)
-DOUBLE_DROP_C_GUITAR = StringInstrument([Note.C, Note.G, Note.C, Note.F, Note.A, Note.D])
-
-# Basses
-E_STANDARD_BASS = create_standard_bass()
-DROP_D_BASS = create_drop_bass(Note.D)
-
-# Extended-range instruments
-FIVE_STRING_BASS = StringInstrument([Note.B] + E_STANDARD_BASS.tuning)
-SEVEN_STRING_GUITAR = StringInstrument([Note.B] + E_STANDARD_GUITAR.tuning)
\ No newline at end of file
+# Preset instruments, built on first access (e.g. `instrument_creator.DROP_D_GUITAR`)
+# rather than at import. Each preset is built once and shared afterwards.
+_PRESETS = {
+    # Standard tunings
+    'E_STANDARD_GUITAR': lambda: create_standard_guitar(),
+    'HALF_STEP_DOWN_GUITAR': lambda: create_standard_guitar(Note.Eb),
+    'D_STANDARD_GUITAR': lambda: create_standard_guitar(Note.D),
+    'C_STANDARD_GUITAR': lambda: create_standard_guitar(Note.C),
+
+    # Drop tunings
+    'DROP_D_GUITAR': lambda: create_drop_guitar(Note.D),
+    'DOUBLE_DROP_D_GUITAR': lambda: StringInstrument([Note.D, Note.A, Note.D, Note.G, Note.B, Note.D]),
+    'DROP_C_GUITAR': lambda: create_drop_guitar(Note.C),
+    'DOUBLE_DROP_C_GUITAR': lambda: StringInstrument([Note.C, Note.G, Note.C, Note.F, Note.A, Note.D]),
+
+    # Basses
+    'E_STANDARD_BASS': lambda: create_standard_bass(),
+    'DROP_D_BASS': lambda: create_drop_bass(Note.D),
+
+    # Extended-range instruments
+    'FIVE_STRING_BASS': lambda: StringInstrument([Note.B] + create_standard_bass().tuning),
+    'SEVEN_STRING_GUITAR': lambda: StringInstrument([Note.B] + create_standard_guitar().tuning),
+}
+
+__all__ = [
+    "STANDARD_BASS_TUNING_INTERVALS", "STANDARD_GUITAR_TUNING_INTERVALS",
+    "create_standard_bass", "create_drop_bass", "create_standard_guitar",
+    "create_drop_guitar", "create_ukulele", "presets", *_PRESETS,
+]
+
+def __getattr__(name):
+    try:
+        build = _PRESETS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    return globals().setdefault(name, build())
+
+def __dir__():
+    return sorted(set(globals()) | set(_PRESETS))
+
+def presets():
+    """
+    Returns every preset instrument by name, building any not used yet.
+
+    Returns:
+        dict[str, StringInstrument]:
+    """
+    return {name: globals()[name] if name in globals() else __getattr__(name) for name in _PRESETS}
@@ -0,0 +1,375 @@
+"""
+This module provides opt-in counters and timers for the public entry points
+of the `notes`, `scales`, `chords`, `keys`, `progressions` and
+`string_instrument` modules.
+
+Description:
+    Each instrumented entry point counts its calls and the cumulative time
+    spent in them (including any instrumented calls they make, so
+    `scales.modes_from_note` includes the time of the 7 `scales.Scale` calls
+    it makes). Entry points backed by a cache also count hits and misses:
+    `scales.Scale`, `chords.Chord` and `keys.Key` (interned scales, chords
+    and keys) and `string_instrument.StringInstrument.fretboard` (the
+    fretboard built for the instrument's current tuning).
+
+    Instrumentation costs nothing while disabled: `enable` swaps a counting
+    wrapper in for each entry point (on its class, or on every
+    `music_theory` module that has imported the function), and `disable`
+    puts the originals back. References taken outside the package follow
+    the same rule: `from music_theory.notes import transpose` only counts
+    if it ran while instrumentation was enabled, and keeps counting after
+    it is disabled. Methods are always looked up on the class, so they are
+    always counted.
+
+    It is turned on either for a block of code with `instrumented`, or for
+    the whole process by setting the MUSIC_THEORY_INSTRUMENT environment
+    variable to 1 before the package is imported. When
+    MUSIC_THEORY_INSTRUMENT_DUMP is also set to a path, the counters are
+    written to it as JSON when the process exits.
+
+    Counters are plain integers updated without a lock, so counts from
+    several threads at once may be slightly off.
+
+Classes:
+    Stats:
+        A named tuple of the counters of one entry point.
+
+Functions:
+    enable() -> None:
+        Starts counting.
+    disable() -> None:
+        Stops counting and restores the original entry points.
+    is_enabled() -> bool:
+        Whether instrumentation is enabled.
+    instrumented(clear=True) -> ContextManager[None]:
+        Enables instrumentation for the duration of a with block.
+    snapshot() -> dict[str, Stats]:
+        A copy of the counters of every entry point.
+    reset() -> None:
+        Sets every counter back to zero.
+    to_json(indent=2) -> str:
+        The counters as a JSON document.
+    dump(out) -> None:
+        Writes the counters as JSON to a file-like object.
+
+Example:
+    >>> with instrumented():
+    ...     modes_from_note(Note.C)
+    >>> snapshot()["scales.Scale"]
+    Stats(calls=7, hits=0, misses=7, total_ns=61310)
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator, NamedTuple, TextIO
+
+from music_theory import chords, keys, notes, progressions, scales, string_instrument
+from music_theory.chord_type import ChordType
+from music_theory.key_type import KeyType
+from music_theory.scale_type import ScaleType
+
+ENV_VAR = "MUSIC_THEORY_INSTRUMENT"
+DUMP_ENV_VAR = "MUSIC_THEORY_INSTRUMENT_DUMP"
+
+class Stats(NamedTuple):
+    """
+    The counters of one entry point. `total_ns` is the cumulative time spent
+    in its calls, in nanoseconds.
+    """
+    calls: int
+    hits: int
+    misses: int
+    total_ns: int
+
+#region Entry points
+
+def _scale_is_interned(cls, root, scale_type=ScaleType.Major) -> bool:
+    return (cls, root, scale_type) in scales._interned_scales
+
+# Every Chord and Key is built the first time one is asked for, so only that
+# call (and calls with an invalid root or type) miss.
+def _chord_is_interned(cls, root, chord_type=ChordType.Major) -> bool:
+    return (root, chord_type) in chords._chord_registry
+
+def _key_is_interned(cls, root, key_type=KeyType.Major) -> bool:
+    return (root, key_type) in keys._key_table
+
+def _fretboard_is_built(instrument) -> bool:
+    # The fretboard is rebuilt when the tuning changed since it was cached.
+    fretboard = instrument._fretboard
+    return fretboard is not None and fretboard.tuning == tuple(instrument.tuning)
+
+# (owner, attribute, hit check). The owner is a class, or a module for
+# module level functions. A hit check takes the same arguments as the entry
+# point and says whether the call will be answered from a cache.
+_ENTRY_POINTS: tuple[tuple[object, str, Callable[..., bool] | None], ...] = (
+    (notes.Note, "from_string", None),
+    (notes.Note, "transpose", None),
+    (notes, "notes_to_string", None),
+    (notes, "notes_from_string", None),
+    (notes, "transpose", None),
+    (notes, "chromatic_notes", None),
+    (scales.Scale, "__new__", _scale_is_interned),
+    (scales.Scale, "_construct", None),
+    (scales, "modes_from_note", None),
+    (scales, "scales_containing", None),
+    (chords.Chord, "__new__", _chord_is_interned),
+    (chords, "identify_chord", None),
+    (chords, "chords_from_pitch_classes", None),
+    (chords, "unique_notes_in_chords", None),
+    (keys.Key, "__new__", _key_is_interned),
+    (keys.Key, "chords", None),
+    (keys.Key, "parallel_chords", None),
+    (keys.Key, "dominant_chords", None),
+    (keys.Key, "to_string_array", None),
+    (progressions, "chords_from_progression", None),
+    (progressions.Progression, "__init__", None),
+    (progressions.ProgressionCompiler, "__init__", None),
+    (progressions.ProgressionCompiler, "resolve", None),
+    (progressions.ProgressionCompiler, "resolve_all", None),
+    (string_instrument.StringInstrument, "from_tuning_intervals", None),
+    (string_instrument.StringInstrument, "add_capo", None),
+    (string_instrument.StringInstrument, "adjust_string", None),
+    (string_instrument.StringInstrument, "detune", None),
+    (string_instrument.StringInstrument, "fretboard", _fretboard_is_built),
+    (string_instrument.StringInstrument, "positions_of", None),
+    (string_instrument.StringInstrument, "note_at_fret", None),
+    (string_instrument.StringInstrument, "notes_in_chord", None),
+    (string_instrument.StringInstrument, "notes_in_riff", None),
+    (string_instrument.StringInstrument, "chord_voicings", None),
+    (string_instrument.StringInstrument, "intervals_in_chord", None),
+    (string_instrument, "note_at_fret", None),
+)
+
+def _entry_point_name(owner: object, attribute: str) -> str:
+    """
+    The name an entry point is reported under, e.g. "notes.transpose",
+    "keys.Key.chords" or "scales.Scale" (for Scale.__new__).
+    """
+    if isinstance(owner, type):
+        module = owner.__module__.rpartition(".")[2]
+        prefix = f"{module}.{owner.__name__}"
+        return prefix if attribute == "__new__" else f"{prefix}.{attribute}"
+
+    return f"{owner.__name__.rpartition('.')[2]}.{attribute}"
+
+# Counters of each entry point as [calls, hits, misses, total_ns], updated
+# in place by the wrappers so they can be reset without rewrapping.
+_counters: dict[str, list[int]] = {
+    _entry_point_name(owner, attribute): [0, 0, 0, 0] for owner, attribute, _ in _ENTRY_POINTS
+}
+
+#endregion
+
+#region Wrapping
+
+def _counting(func: Callable, counters: list[int], hit: Callable[..., bool] | None) -> Callable:
+    """
+    Returns a wrapper of func that updates counters on every call.
+    """
+    clock = time.perf_counter_ns
+
+    if hit is None:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counters[3] += clock() - start
+                counters[0] += 1
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            counters[1 if hit(*args, **kwargs) else 2] += 1
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counters[3] += clock() - start
+                counters[0] += 1
+
+    return wrapper
+
+def _wrap_attribute(raw: object, counters: list[int], hit: Callable[..., bool] | None) -> object:
+    """
+    Wraps a function as found in a class or module dictionary, keeping it a
+    staticmethod, classmethod or property.
+    """
+    if isinstance(raw, staticmethod):
+        return staticmethod(_counting(raw.__func__, counters, hit))
+    if isinstance(raw, classmethod):
+        return classmethod(_counting(raw.__func__, counters, hit))
+    if isinstance(raw, property):
+        return property(_counting(raw.fget, counters, hit), raw.fset, raw.fdel, raw.__doc__)
+
+    return _counting(raw, counters, hit)
+
+# (namespace, attribute, original) for every attribute replaced by enable(),
+# empty while disabled. Wrappers are built once and reused, and _originals
+# maps the id of each module level function's wrapper to (wrapper, original).
+_patched: list[tuple[object, str, object]] = []
+_wrappers: dict[tuple[int, str], object] = {}
+_originals: dict[int, tuple[object, object]] = {}
+
+def _music_theory_modules() -> list:
+    return [m for name, m in list(sys.modules.items()) if m is not None and (name == "music_theory" or name.startswith("music_theory."))]
+
+def enable() -> None:
+    """
+    Starts counting calls to every entry point. Does nothing if
+    instrumentation is already enabled.
+
+    Module level functions are replaced in every loaded `music_theory`
+    module that refers to them, so `from music_theory.notes import transpose`
+    inside the package is counted too.
+    """
+    if _patched:
+        return
+
+    modules = _music_theory_modules()
+
+    for owner, attribute, hit in _ENTRY_POINTS:
+        name = _entry_point_name(owner, attribute)
+        raw = vars(owner)[attribute]
+        wrapper = _wrappers.get((id(raw), name))
+
+        if wrapper is None:
+            wrapper = _wrappers[(id(raw), name)] = _wrap_attribute(raw, _counters[name], hit)
+
+        if isinstance(owner, type):
+            _patched.append((owner, attribute, raw))
+            setattr(owner, attribute, wrapper)
+            continue
+
+        _originals[id(wrapper)] = (wrapper, raw)
+
+        for module in modules:
+            for alias, value in list(vars(module).items()):
+                if value is raw:
+                    _patched.append((module, alias, raw))
+                    setattr(module, alias, wrapper)
+
+def disable() -> None:
+    """
+    Stops counting, restoring every entry point to the original function.
+    The counters are kept until `reset` is called.
+    """
+    if not _patched:
+        return
+
+    while _patched:
+        namespace, attribute, raw = _patched.pop()
+        setattr(namespace, attribute, raw)
+
+    # Modules imported while enabled (including the package's lazily loaded
+    # attributes) picked up wrappers of their own.
+    for module in _music_theory_modules():
+        for alias, value in list(vars(module).items()):
+            wrapper, raw = _originals.get(id(value), (None, None))
+
+            if value is wrapper:
+                setattr(module, alias, raw)
+
+def is_enabled() -> bool:
+    """
+    Returns whether instrumentation is enabled.
+
+    Returns:
+        bool:
+    """
+    return bool(_patched)
+
+@contextmanager
+def instrumented(clear: bool=True) -> Iterator[None]:
+    """
+    Enables instrumentation for the duration of a with block, then restores
+    the previous state.
+
+    Example:
+        >>> with instrumented():
+        ...     Key(Note.A, KeyType.Minor).chords()
+        >>> snapshot()["keys.Key.chords"].calls
+        1
+
+    Args:
+        clear (bool):
+            Whether to set every counter back to zero first.
+    """
+    was_enabled = is_enabled()
+
+    if clear:
+        reset()
+
+    enable()
+
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+#endregion
+
+#region Reporting
+
+def snapshot() -> dict[str, Stats]:
+    """
+    Returns a copy of the counters of every entry point, by name.
+
+    Returns:
+        dict[str, Stats]:
+    """
+    return {name: Stats(*counters) for name, counters in _counters.items()}
+
+def reset() -> None:
+    """
+    Sets every counter back to zero.
+    """
+    for counters in _counters.values():
+        counters[:] = (0, 0, 0, 0)
+
+def to_json(indent: int | None=2) -> str:
+    """
+    Returns the counters as a JSON document: whether instrumentation is
+    enabled and an object of counters for each entry point.
+
+    Args:
+        indent (int | None):
+            The indent passed to `json.dumps`.
+
+    Returns:
+        str:
+    """
+    return json.dumps({
+        "enabled": is_enabled(),
+        "counters": {name: stats._asdict() for name, stats in snapshot().items()},
+    }, indent=indent)
+
+def dump(out: TextIO) -> None:
+    """
+    Writes the counters as JSON to a file-like object.
+
+    Args:
+        out (TextIO):
+            Any object with a `write` method.
+    """
+    out.write(to_json())
+    out.write("\n")
+
+def _dump_at_exit(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        dump(f)
+
+#endregion
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable()
+
+    if os.environ.get(DUMP_ENV_VAR):
+        atexit.register(_dump_at_exit, os.environ[DUMP_ENV_VAR])
@@ -22,7 +22,7 @@ from typing import Self, TYPE_CHECKING
 if TYPE_CHECKING: # pragma: no cover
     from music_theory.notes import Note
     
-from music_theory.utils import index_to_range, UP_DIRECTIONS, DOWN_DIRECTIONS
+from music_theory.utils import direction_sign
 
 LABELS: list[str] = [
     "Unison",
@@ -39,6 +39,10 @@ LABELS: list[str] = [
     "Major 7th",
 ]
 
+NUMERICS: tuple[str, ...] = (
+    '1', 'b2', '2', 'b3', '3', '4', 'b5', '5', 'b6', '6', 'b7', '7'
+)
+
 #region Interval
 
 class Interval(Enum):
@@ -112,7 +116,7 @@ class Interval(Enum):
         Returns:
             list(Interval):
         """  
-        return [n for n in cls]
+        return list(INTERVALS)
  
     all = items # Alias
 
@@ -137,8 +141,7 @@ class Interval(Enum):
         Returns:
             Interval:
         """  
-        index = index_to_range(index)
-        return Interval.items()[index]
+        return INTERVALS[index % 12]
 
     @classmethod
     def from_numeric(cls, numeric: str) -> Self:
@@ -156,12 +159,17 @@ class Interval(Enum):
             numeric (str):
                 The numeric interval to be translated.
 
+        Raises:
+            ValueError:
+                If the numeric is not recognized.
+
         Returns:
             Interval:
         """  
-        numerics = ['1', 'b2', '2', 'b3', '3', '4', 'b5', '5', 'b6', '6', 'b7', '7']
-        index = numerics.index(numeric)
-        return Interval.items()[index]
+        try:
+            return NUMERIC_TO_INTERVAL[numeric]
+        except KeyError:
+            raise ValueError(f'numeric not recognized({numeric})') from None
 
     def to_numeric(self) -> str:
         """ 
@@ -176,8 +184,7 @@ class Interval(Enum):
             str:
                 A string representing the numeric value.
         """  
-        numerics = ['1', 'b2', '2', 'b3', '3', '4', 'b5', '5', 'b6', '6', 'b7', '7']
-        return numerics[self.value]
+        return NUMERICS[self.value]
 
     @classmethod
     def random(cls):
@@ -191,7 +198,7 @@ class Interval(Enum):
         Returns:
             Interval:
         """  
-        return random.choice(cls.items())
+        return random.choice(INTERVALS)
 
     def __str__(self) -> str:
         """ 
@@ -223,6 +230,22 @@ class Interval(Enum):
     
 #endregion
 
+#region Lookup Tables
+
+# Immutable tables built once at import so that the hot paths (from_index,
+# interval_distance, ...) are plain indexing rather than list rebuilding.
+
+INTERVALS: tuple[Interval, ...] = tuple(Interval)
+
+NUMERIC_TO_INTERVAL: dict[str, Interval] = dict(zip(NUMERICS, INTERVALS))
+
+# INTERVAL_TABLE[a][b] is the upward interval from note value a to note value b.
+INTERVAL_TABLE: tuple[tuple[Interval, ...], ...] = tuple(
+    tuple(INTERVALS[(b - a) % 12] for b in range(12)) for a in range(12)
+)
+
+#endregion
+
 #region Functions
 
 def intervals_to_string(interval_list: list[Interval]) -> str:
@@ -276,21 +299,9 @@ def interval_distance(first_note: "Note", second_note: "Note", direction: str="u
     if(first_note == second_note):
         return Interval.Unison
 
-    direction = direction.lower()
-    dif = abs(first_note.value - second_note.value)
-
-    if direction in UP_DIRECTIONS:
-        if first_note.value > second_note.value:
-            return Interval.from_index(12 - dif)  
-
-        return Interval.from_index(dif)        
-
-    elif direction in DOWN_DIRECTIONS:
-        if first_note.value > second_note.value:
-            return Interval.from_index(dif) 
-         
-        return Interval.from_index(12 - dif) 
+    if direction_sign(direction) > 0:
+        return INTERVAL_TABLE[first_note.value][second_note.value]
 
-    raise ValueError(f'direction not recognized({direction})') 
+    return INTERVAL_TABLE[second_note.value][first_note.value]
 
 #endregion
\ No newline at end of file
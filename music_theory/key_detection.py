@@ -0,0 +1,476 @@
+"""
+This module estimates the `Key` of a stream of notes by correlating how often
+each note is heard with the Krumhansl-Kessler key profiles.
+
+Description:
+    Each key profile rates how well each of the 12 notes fits in that key.
+    The profiles of all 24 keys are centred and normalised into a 12 x 24
+    matrix, so scoring a note histogram against every key at once is a
+    single vector-matrix product, and the result is the Pearson correlation
+    between the histogram and each key's profile.
+
+    Because the product is linear in the histogram, `KeyDetector` keeps the
+    24 running scores and adds (or, once a sliding window is full, removes)
+    one row of the matrix per note, so each update costs the same no matter
+    how long the stream is.
+
+    When NumPy is installed the scores are NumPy arrays, otherwise plain
+    lists are used.
+
+    Chord progressions are scored separately, by how many of the chords
+    belong to each key. An index from every chord to the keys it is diatonic
+    to (and the keys it can be borrowed into as a parallel chord) is built
+    once from `Key.chords()` and `Key.parallel_chords()`, so scoring never
+    re-derives a key's chords.
+
+Classes:
+    KeyDetector:
+        Incrementally scores all 24 keys as notes arrive.
+
+Functions:
+    rank_keys(source) -> list[tuple[Key, float]]:
+        Scores every key for a collection of notes, best first.
+    rank_keys_for_histogram(histogram) -> list[tuple[Key, float]]:
+        Scores every key for a histogram of note counts, best first.
+    detect_key(source) -> Key | None:
+        Returns the best matching key.
+    keys_for_chord(chord, parallel=False) -> tuple[Key, ...]:
+        Returns the keys a chord belongs to.
+    rank_keys_for_chords(chords, parallel_weight=0.5, tonic_weight=0.5) -> list[tuple[Key, float]]:
+        Scores every key for a chord progression, best first.
+
+Example:
+    >>> from music_theory import Note, Scale, ScaleType, Chord, ChordType
+    >>> detect_key([Scale(Note.E, ScaleType.Minor), Chord(Note.E, ChordType.Minor)])
+    Key(E Minor)
+    >>> detector = KeyDetector(window=16)
+    >>> detector.extend([Note.G, Note.B, Note.D, Note.Gb, Note.A, Note.C])
+    >>> detector.best()
+    Key(G Major)
+"""
+
+from collections import deque
+from math import sqrt
+from typing import Iterable, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+from music_theory.chords import Chord
+from music_theory.key_type import KeyType, KEY_TYPES
+from music_theory.keys import Key
+from music_theory.notes import Note, NOTES
+from music_theory.scales import Scale
+
+HAS_NUMPY = np is not None
+
+# Krumhansl-Kessler probe tone ratings, from the tonic upwards.
+MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+KEY_PROFILES: dict[KeyType, tuple[float, ...]] = {
+    KeyType.Major: MAJOR_PROFILE,
+    KeyType.Minor: MINOR_PROFILE,
+}
+
+KEY_TONIC_NUMERALS: dict[KeyType, str] = {
+    KeyType.Major: "I",
+    KeyType.Minor: "i",
+}
+
+#region Lookup Tables
+
+# The 24 keys in column order: C Major, C Minor, Db Major ...
+KEYS: tuple[Key, ...] = tuple(Key(root, key_type) for root in NOTES for key_type in KEY_TYPES)
+
+def _normalised_profile(key: Key) -> list[float]:
+    """
+    Returns a key's profile rotated to its root, centred on zero and scaled to
+    unit length.
+    """
+    profile = KEY_PROFILES[key.type]
+    rotated = [profile[(pc - key.root.value) % 12] for pc in range(12)]
+    mean = sum(rotated) / 12
+    centred = [p - mean for p in rotated]
+    length = sqrt(sum(c * c for c in centred))
+    return [c / length for c in centred]
+
+# PROFILE_MATRIX[pc][k] is the normalised profile value of pitch class pc in
+# KEYS[k]. Each row is the change in every key's score when that note is heard.
+PROFILE_MATRIX: tuple[tuple[float, ...], ...] = tuple(
+    zip(*(_normalised_profile(key) for key in KEYS))
+)
+
+if HAS_NUMPY:
+    _NP_PROFILE_MATRIX = np.array(PROFILE_MATRIX)
+
+# The tonic (I or i) chord of each key in KEYS.
+_TONIC_CHORDS: tuple[Chord, ...] = tuple(key.chords()[KEY_TONIC_NUMERALS[key.type]] for key in KEYS)
+
+# Chord -> indexes into KEYS of the keys the chord is diatonic to, and of the
+# keys it is a parallel (borrowed) chord of. Filled on first use.
+_diatonic_keys: dict[Chord, tuple[int, ...]] = {}
+_parallel_keys: dict[Chord, tuple[int, ...]] = {}
+
+#endregion
+
+#region Helpers
+
+def _iter_notes(source: Note | Scale | Chord | Iterable) -> Iterator[Note]:
+    """
+    Flattens Notes, Scales, Chords and (nested) iterables of them into a
+    stream of Notes.
+    """
+    if isinstance(source, Note):
+        yield source
+    elif isinstance(source, (Scale, Chord)):
+        yield from source.notes
+    else:
+        for item in source:
+            yield from _iter_notes(item)
+
+def _histogram_scores(histogram: list[int]):
+    """
+    Returns the (unnormalised) score of every key for a note histogram, the
+    product of the histogram and PROFILE_MATRIX.
+    """
+    if HAS_NUMPY:
+        return np.asarray(histogram, dtype=float) @ _NP_PROFILE_MATRIX
+
+    return [sum(h * p for h, p in zip(histogram, column)) for column in zip(*PROFILE_MATRIX)]
+
+def _ranked(scores, histogram: list[int]) -> list[tuple[Key, float]]:
+    """
+    Converts raw scores into correlations and ranks the keys, best first.
+    Every correlation is 0 if the histogram is empty or flat.
+    """
+    n = sum(histogram)
+    variance = sum(h * h for h in histogram) - n * n / 12
+    scale = 1 / sqrt(variance) if variance > 1e-9 else 0.0
+
+    return sorted(zip(KEYS, (float(s) * scale for s in scores)), key=lambda ks: -ks[1])
+
+#endregion
+
+#region KeyDetector
+
+class KeyDetector:
+    """
+    Scores all 24 keys against a stream of notes, one note at a time.
+
+    Attributes:
+        window (int | None):
+            How many of the most recent notes are scored, None to score every
+            note heard.
+        count (int):
+            A read only property with the number of notes being scored.
+
+    Methods:
+        add(self, note):
+            Adds a note, dropping the oldest one if the window is full.
+        extend(self, source):
+            Adds every note from Notes, Scales, Chords or iterables of them.
+        reset(self):
+            Forgets every note.
+        scores(self):
+            Returns every key with its correlation, best first.
+        best(self):
+            Returns the best matching key.
+    """
+    __slots__ = ('window', '_notes', '_histogram', '_scores')
+
+    def __init__(self, window: int | None=None) -> None:
+        """
+        Creates an empty detector.
+
+        Args:
+            window (int | None):
+                The number of most recent notes to score, or None to score
+                every note (default: `None`).
+
+        Raises:
+            ValueError:
+                If the window is less than 1.
+        """
+        if window is not None and window < 1:
+            raise ValueError(f"Window must hold at least 1 note: {window}")
+
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forgets every note.
+        """
+        self._notes = deque()
+        self._histogram = [0] * 12
+        self._scores = np.zeros(len(KEYS)) if HAS_NUMPY else [0.0] * len(KEYS)
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of notes currently being scored.
+
+        Returns:
+            int:
+        """
+        return len(self._notes)
+
+    def _apply(self, pc: int, sign: int) -> None:
+        """
+        Adds (sign=1) or removes (sign=-1) one note of pitch class pc.
+        """
+        self._histogram[pc] += sign
+
+        if HAS_NUMPY:
+            if sign > 0:
+                self._scores += _NP_PROFILE_MATRIX[pc]
+            else:
+                self._scores -= _NP_PROFILE_MATRIX[pc]
+        else:
+            self._scores = [s + sign * p for s, p in zip(self._scores, PROFILE_MATRIX[pc])]
+
+    def add(self, note: Note) -> None:
+        """
+        Adds a note, dropping the oldest one if the window is full.
+
+        Args:
+            note (Note):
+                The note heard.
+        """
+        pc = note.value
+        self._notes.append(pc)
+        self._apply(pc, 1)
+
+        if self.window is not None and len(self._notes) > self.window:
+            self._apply(self._notes.popleft(), -1)
+
+    def extend(self, source: Note | Scale | Chord | Iterable) -> None:
+        """
+        Adds every note from a Note, Scale, Chord or an iterable of them
+        (such as a list of chords).
+
+        Args:
+            source (Note | Scale | Chord | Iterable):
+                The notes heard.
+        """
+        for note in _iter_notes(source):
+            self.add(note)
+
+    def scores(self) -> list[tuple[Key, float]]:
+        """
+        Returns every key with the correlation (-1 to 1) between its profile
+        and the notes, best first. Every score is 0 before any notes (or when
+        every note has been heard equally often).
+
+        Returns:
+            list[tuple[Key, float]]:
+        """
+        return _ranked(self._scores, self._histogram)
+
+    def best(self) -> Key | None:
+        """
+        Returns the best matching key, or None if no notes have been added.
+
+        Returns:
+            Key | None:
+        """
+        if not self._notes:
+            return None
+
+        if HAS_NUMPY:
+            return KEYS[int(np.argmax(self._scores))]
+
+        scores = self._scores
+        return KEYS[max(range(len(KEYS)), key=scores.__getitem__)]
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representing the detector.
+
+        Example:
+            >>> repr(KeyDetector(window=16))
+            KeyDetector(window=16, count=0)
+        """
+        return f"KeyDetector(window={self.window}, count={self.count})"
+
+#endregion
+
+#region Functions
+
+def rank_keys(source: Note | Scale | Chord | Iterable) -> list[tuple[Key, float]]:
+    """
+    Scores every key against a collection of notes, best first. The notes are
+    counted into a histogram which is multiplied by the 12 x 24 profile
+    matrix in one go.
+
+    Example:
+        >>> chords = [Chord(Note.A, ChordType.Minor), Chord(Note.D, ChordType.Minor), Chord(Note.E)]
+        >>> rank_keys(chords)[0]
+        (Key(A Minor), 0.83...)
+
+    Args:
+        source (Note | Scale | Chord | Iterable):
+            Notes, Scales, Chords or an iterable of them.
+
+    Returns:
+        list[tuple[Key, float]]:
+            Every key with its correlation (-1 to 1).
+    """
+    histogram = [0] * 12
+
+    for note in _iter_notes(source):
+        histogram[note.value] += 1
+
+    return _ranked(_histogram_scores(histogram), histogram)
+
+def rank_keys_for_histogram(histogram: Sequence[int]) -> list[tuple[Key, float]]:
+    """
+    Scores every key against notes that have already been counted, best
+    first. Useful when the counts come straight from a buffer of pitch
+    classes (see `corpus`) rather than from Note objects.
+
+    Example:
+        >>> rank_keys_for_histogram([1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1])[0]
+        (Key(C Major), 0.75...)
+
+    Args:
+        histogram (Sequence[int]):
+            How many times each note was heard, indexed by note value (C
+            to B).
+
+    Raises:
+        ValueError:
+            If the histogram doesn't have 12 counts.
+
+    Returns:
+        list[tuple[Key, float]]:
+            Every key with its correlation (-1 to 1).
+    """
+    if len(histogram) != 12:
+        raise ValueError(f"Histograms must have 12 counts, not {len(histogram)}")
+
+    histogram = list(histogram)
+    return _ranked(_histogram_scores(histogram), histogram)
+
+def detect_key(source: Note | Scale | Chord | Iterable) -> Key | None:
+    """
+    Returns the key that best matches a collection of notes.
+
+    Example:
+        >>> detect_key(Scale(Note.D, ScaleType.Major))
+        Key(D Major)
+
+    Args:
+        source (Note | Scale | Chord | Iterable):
+            Notes, Scales, Chords or an iterable of them.
+
+    Returns:
+        Key | None:
+            The best key, or None if there were no notes (or every note was
+            heard equally often).
+    """
+    ranked = rank_keys(source)
+    return ranked[0][0] if ranked[0][1] else None
+
+def _build_chord_key_index() -> dict[Chord, tuple[int, ...]]:
+    """
+    Builds the chord -> keys indexes from the chords and parallel chords of
+    all 24 keys.
+
+    Returns:
+        dict[Chord, tuple[int, ...]]:
+            The filled diatonic index.
+    """
+    diatonic, parallel = {}, {}
+
+    for index, key in enumerate(KEYS):
+        for chord in key.chords().values():
+            diatonic.setdefault(chord, []).append(index)
+
+        for chord in key.parallel_chords().values():
+            parallel.setdefault(chord, []).append(index)
+
+    _parallel_keys.update((chord, tuple(indexes)) for chord, indexes in parallel.items())
+    _diatonic_keys.update((chord, tuple(indexes)) for chord, indexes in diatonic.items())
+    return _diatonic_keys
+
+def keys_for_chord(chord: Chord, parallel: bool=False) -> tuple[Key, ...]:
+    """
+    Returns the keys a chord belongs to.
+
+    Example:
+        >>> keys_for_chord(Chord(Note.G))
+        (Key(C Major), Key(D Major), Key(E Minor), Key(G Major), Key(A Minor), Key(B Minor))
+
+    Args:
+        chord (Chord):
+            The chord to look up.
+        parallel (bool):
+            If True, return the keys the chord can be borrowed into as a 
+            parallel chord instead (default: `False`).
+
+    Returns:
+        tuple[Key, ...]:
+    """
+    diatonic = _diatonic_keys or _build_chord_key_index()
+    indexes = (_parallel_keys if parallel else diatonic).get(chord, ())
+    return tuple(KEYS[i] for i in indexes)
+
+def rank_keys_for_chords(chords: Iterable[Chord], parallel_weight: float=0.5, tonic_weight: float=0.5) -> list[tuple[Key, float]]:
+    """
+    Scores every key for a sequence of chords, best first.
+
+    Each chord scores 1 for every key it is diatonic to and `parallel_weight`
+    for every key it can be borrowed into, plus `tonic_weight` for the key
+    it is the tonic (I or i) chord of, which separates relative keys that
+    share all of their chords. Scores are divided by the number of chords,
+    so a key that explains every chord scores at least 1.
+
+    Repeated chords are counted first, so a long progression costs one
+    index lookup per distinct chord.
+
+    Example:
+        >>> chords = [Chord(Note.C), Chord(Note.A, ChordType.Minor), Chord(Note.F), Chord(Note.G), Chord(Note.C)]
+        >>> rank_keys_for_chords(chords)[:2]
+        [(Key(C Major), 1.2), (Key(A Minor), 1.1)]
+
+    Args:
+        chords (Iterable[Chord]):
+            The chords of the progression.
+        parallel_weight (float):
+            The score of a borrowed (parallel) chord (default: `0.5`).
+        tonic_weight (float):
+            The extra score of a key's tonic chord (default: `0.5`).
+
+    Returns:
+        list[tuple[Key, float]]:
+            Every key with its score, or every key scoring 0 if there are no
+            chords.
+    """
+    diatonic = _diatonic_keys or _build_chord_key_index()
+    parallel = _parallel_keys
+
+    counts: dict[Chord, int] = {}
+
+    for chord in chords:
+        counts[chord] = counts.get(chord, 0) + 1
+
+    scores = [0.0] * len(KEYS)
+
+    for chord, count in counts.items():
+        for i in diatonic.get(chord, ()):
+            scores[i] += count
+
+        for i in parallel.get(chord, ()):
+            scores[i] += count * parallel_weight
+
+    for index, tonic in enumerate(_TONIC_CHORDS):
+        scores[index] += counts.get(tonic, 0) * tonic_weight
+
+    total = sum(counts.values()) or 1
+    return sorted(zip(KEYS, (s / total for s in scores)), key=lambda ks: -ks[1])
+
+#endregion
@@ -56,7 +56,7 @@ class KeyType(Enum):
         Returns:
             list[KeyType]:
         """  
-        return [n for n in cls]
+        return list(KEY_TYPES)
 
     all = items  # Alias
     
@@ -68,7 +68,7 @@ class KeyType(Enum):
         Returns:
             KeyType:
         """  
-        return random.choice(cls.items())
+        return random.choice(KEY_TYPES)
 
     @property
     def parallel(self) -> Self:
@@ -82,7 +82,7 @@ class KeyType(Enum):
         Returns:
             KeyType:
         """
-        return KeyType.Minor if (self.name == 'Major') else KeyType.Major
+        return KEY_TYPES[self.value ^ 1] # Major (0) <-> Minor (1)
 
     def __str__(self) -> str:
         """ 
@@ -108,4 +108,7 @@ class KeyType(Enum):
         Returns:
             str:
         """
-        return f'KeyType.{self.name}'
\ No newline at end of file
+        return f'KeyType.{self.name}'
+
+# Immutable tuple built once at import, used instead of rebuilding items().
+KEY_TYPES: tuple[KeyType, ...] = tuple(KeyType)
\ No newline at end of file
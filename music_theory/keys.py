@@ -24,14 +24,45 @@ Example:
     C Major
 """
 
-from typing import Self
+import sys
+from types import MappingProxyType
+from typing import Mapping, Self
 
-from music_theory.notes import Note, transpose
+from music_theory.notes import Note, NOTES, transpose
 from music_theory.intervals import Interval
 from music_theory.chords import Chord
 from music_theory.chord_type import ChordType
 from music_theory.scales import Scale, ScaleType
-from music_theory.key_type import KeyType
+from music_theory.key_type import KeyType, KEY_TYPES
+
+#region Key Tables
+
+KEY_SCALE_TYPES: dict[KeyType, ScaleType] = {
+    KeyType.Major: ScaleType.Major,
+    KeyType.Minor: ScaleType.Minor,
+}
+
+KEY_CHORD_NUMERALS: dict[KeyType, tuple[str, ...]] = {
+    KeyType.Major: ("I", "ii", "iii", "IV", "V", "vi", "vii°"),
+    KeyType.Minor: ("i", "ii°", "III", "iv", "v", "VI", "VII"),
+}
+
+KEY_CHORD_TYPES: dict[KeyType, tuple[ChordType, ...]] = {
+    KeyType.Major: (ChordType.Major, ChordType.Minor, ChordType.Minor, 
+                    ChordType.Major, ChordType.Major, ChordType.Minor, 
+                    ChordType.Diminished),
+    KeyType.Minor: (ChordType.Minor, ChordType.Diminished, ChordType.Major, 
+                    ChordType.Minor, ChordType.Minor, ChordType.Major, 
+                    ChordType.Major),
+}
+
+ORDER_OF_SHARPS = [Note.F, Note.C, Note.G, Note.D, Note.A, Note.E, Note.B]
+ORDER_OF_FLATS = ORDER_OF_SHARPS[::-1]
+
+# All 24 keys, filled with every (root, KeyType) pair on the first Key() call.
+_key_table: dict[tuple[Note, KeyType], "Key"] = {}
+
+#endregion
 
 #region Key
 
@@ -40,17 +71,26 @@ class Key:
     Represents a musical key. A key is important to find what chords can be 
     used together.
 
+    Keys are immutable and interned. All 24 keys, along with their chords, 
+    relative keys and sharp/flat counts, are precomputed the first time any
+    key is requested, so the properties and chord methods below only read
+    from that table.
+
     Attributes:
         root (Note):
             A note that the key starts on. (defines the I chord).
         type (KeyType):
             The type of the key (Major or Minor).
+        pitch_classes (PitchClassSet):
+            The notes of the key's (major or minor) scale.
 
     Methods:
-        __init__(root, key_type=KeyType.Major):
-            Constructs the key.
+        __new__(root, key_type=KeyType.Major):
+            Returns the interned key.
         __eq__(self, other):
             Compares two keys.
+        __hash__(self):
+            Hashes the root and key type.
         random(cls):
             A class method that returns a random Key from a random Note.
         parallel(self):
@@ -68,11 +108,11 @@ class Key:
         flats(self):
             A property that returns a list of the flat notes.
         chords(self):
-            Returns a dict containing the chords of the key.
+            Returns a read-only mapping of the chords of the key.
         parallel_chords(self):
-            Returns a dict containing the parallel chords of the key.
+            Returns a read-only mapping of the parallel chords of the key.
         dominant_chords(self):
-            Returns a dict containing the dominant chords of the key.
+            Returns a read-only mapping of the dominant chords of the key.
         to_string_array(self, dominant=False, parallel=False):
             Returns the chords in the key as an array of strings.
         pretty_print(self, dominant=False, parallel=False):
@@ -82,22 +122,63 @@ class Key:
         __repr__(self):
             Returns the name of the key.
     """
-    def __init__(self, root: Note, key_type: KeyType=KeyType.Major) -> None:
+    __slots__ = ('root', 'type', 'pitch_classes', '_parallel', '_relative_key',
+                 '_sharp_count', '_flat_count', '_chords', '_dominant_chords')
+
+    def __new__(cls, root: Note, key_type: KeyType=KeyType.Major) -> Self:
         """
-        Constructs the key from a Note and a KeyType. 
+        Returns the key for a Note and a KeyType. 
 
         Example:
             >>> Key(Note.C, KeyType.Major)
-            C Minor
+            C Major
 
         Args:
             root (Note):
                 The note to build the key from.
             key_type (KeyType):
                 The type of the key to be built.
+
+        Raises:
+            ValueError:
+                If the root or key_type is not valid.
         """  
-        self.root = root
-        self.type = key_type
+        try:
+            return (_key_table or _build_key_table())[(root, key_type)]
+        except KeyError:
+            pass
+
+        if key_type not in KEY_TYPES:
+            raise ValueError(f"Unknown key type: {key_type}")
+
+        raise ValueError(f"Unknown root note: {root}")
+
+    def __setattr__(self, name: str, value) -> None:
+        """ 
+        Keys are immutable (they are shared between every caller).
+
+        Raises:
+            AttributeError:
+                Always.
+        """
+        raise AttributeError(f"Key is immutable, can't set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """ 
+        Keys are immutable (they are shared between every caller).
+
+        Raises:
+            AttributeError:
+                Always.
+        """
+        raise AttributeError(f"Key is immutable, can't delete '{name}'")
+
+    def __reduce__(self):
+        """ 
+        Pickles the key as its root and type so that unpickling returns the
+        interned instance.
+        """
+        return (Key, (self.root, self.type))
 
     def __eq__(self, other: Self) -> bool:
         """ 
@@ -121,6 +202,15 @@ class Key:
         except AttributeError:
             return False
 
+    def __hash__(self) -> int:
+        """ 
+        Returns a hash of the root and key type, consistent with __eq__.
+
+        Returns:
+            int:
+        """
+        return hash((self.root, self.type))
+
     @classmethod
     def random(cls) -> Self:
         """
@@ -144,7 +234,7 @@ class Key:
         Returns:
             Key:
         """  
-        return Key(self.root, self.type.parallel)
+        return self._parallel
 
     @property
     def relative_key(self) -> Self:
@@ -161,13 +251,7 @@ class Key:
         Returns:
             Key:
         """  
-        if self.type == KeyType.Major:
-            new_note = transpose(self.root, Interval.m3, direction='d')
-            return Key(new_note, KeyType.Minor)
-
-        else:
-            new_note = transpose(self.root, Interval.m3, direction='u')
-            return Key(new_note, KeyType.Major)
+        return self._relative_key
 
     @property
     def name(self) -> str:
@@ -191,18 +275,7 @@ class Key:
         Returns:
             int:     
         """
-        if self.type == KeyType.Minor:
-            return self.relative_key.sharp_count
-
-        note = Note.C
-
-        for i in range(7+1): 
-            if note == self.root:
-                return i
-
-            note = transpose(note, Interval.P5) 
-
-        return 0
+        return self._sharp_count
 
     @property
     def flat_count(self) -> int:
@@ -212,18 +285,7 @@ class Key:
         Returns:
             int:     
         """
-        if self.type == KeyType.Minor:
-            return self.relative_key.flat_count
-
-        note = Note.C
-
-        for i in range(7+1):
-            if note == self.root:
-                return i
-
-            note = transpose(note, Interval.P5, direction='d') 
-
-        return 0
+        return self._flat_count
 
     @property
     def sharps(self) -> list[Note]:
@@ -237,8 +299,7 @@ class Key:
             list[Note]:
                 An list of Notes representing the sharps.        
         """
-        order_of_sharps = [Note.F, Note.C, Note.G, Note.D, Note.A, Note.E, Note.B]
-        return order_of_sharps[:self.sharp_count]
+        return ORDER_OF_SHARPS[:self._sharp_count]
 
     @property
     def flats(self) -> list[Note]:
@@ -252,12 +313,11 @@ class Key:
             list[Note]:
                 An list of Notes representing the flats.        
         """
-        order_of_flats = [Note.B, Note.E, Note.A, Note.D, Note.G, Note.C, Note.F]
-        return order_of_flats[:self.flat_count]
+        return ORDER_OF_FLATS[:self._flat_count]
 
-    def chords(self) -> dict[str, Chord]:
+    def chords(self) -> Mapping[str, Chord]:
         """ 
-        Returns a dict representing all the chords in the key.
+        Returns a read-only mapping of all the chords in the key.
 
         The dict key is a Roman numeral as used in traditional notation. 
         A upper case numeral represents a major chord and a lower case numeral
@@ -280,31 +340,15 @@ class Key:
             }
 
         Returns:
-            dict[str, Chord]:
-                A dict where each key is a string in the RomanNumeral format 
-                and each value is a Chord instance.
+            Mapping[str, Chord]:
+                A read-only mapping where each key is a string in the 
+                RomanNumeral format and each value is a Chord instance.
         """
-        scale, numerals, sequence = None, None, None
-        
-        if self.type == KeyType.Major:
-            numerals = ["I", "ii", "iii", "IV", "V", "vi", "vii°"]
-            scale = Scale(self.root, ScaleType.Major)
-            sequence = [ChordType.Major, ChordType.Minor, ChordType.Minor, 
-                        ChordType.Major, ChordType.Major, ChordType.Minor, 
-                        ChordType.Diminished]
-            
-        elif self.type == KeyType.Minor:
-            numerals = ["i", "ii°", "III", "iv", "v", "VI", "VII"]
-            scale = Scale(self.root, ScaleType.Minor)
-            sequence = [ChordType.Minor, ChordType.Diminished, ChordType.Major, 
-                        ChordType.Minor, ChordType.Minor, ChordType.Major, 
-                        ChordType.Major]
-
-        return  {n[0]: Chord(n[1], n[2]) for n in zip(numerals, scale.notes, sequence)}
+        return self._chords
  
-    def parallel_chords(self) -> dict[str, Chord]:
+    def parallel_chords(self) -> Mapping[str, Chord]:
         """ 
-        Returns a dict representing all the parallel chords in the key.
+        Returns a read-only mapping of all the parallel chords in the key.
 
         These are the chords that are constructed from the parallel (opposite)
         key.
@@ -325,15 +369,15 @@ class Key:
             }
 
         Returns:
-            dict[str, Chord]
-                A dict where each key is a string in the RomanNumeral format 
-                and each value is a Chord instance.
+            Mapping[str, Chord]
+                A read-only mapping where each key is a string in the 
+                RomanNumeral format and each value is a Chord instance.
         """
-        return self.parallel.chords()
+        return self._parallel._chords
 
-    def dominant_chords(self) -> dict[str, Chord]:
+    def dominant_chords(self) -> Mapping[str, Chord]:
         """ 
-        Returns a dict representing all the chords in dominant the key.
+        Returns a read-only mapping of all the chords in dominant the key.
 
         The dominant key is created by raising the root note of the chord in 
         the main key up a 5th. It is then turned into a seventh cord.     
@@ -352,19 +396,11 @@ class Key:
             }
 
         Returns:
-            dict[str, Chord]: 
-                A dict where each key is a string in the format 'V7/RomanNumeral' 
-                and each value is a Chord instance.
+            Mapping[str, Chord]: 
+                A read-only mapping where each key is a string in the format 
+                'V7/RomanNumeral' and each value is a Chord instance.
         """
-        chords = self.chords()
-
-        # Shift root note up a 5th
-        dom_notes = [transpose(chord.root, Interval.P5) for k, chord in chords.items()]
-
-        # Create a seventh chord from this new note.
-        dom_chords = [Chord(note, ChordType.Dominant7) for note in dom_notes]
-
-        return {f'V7/{n[0]}': n[1] for n in zip(chords.keys(), dom_chords)}
+        return self._dominant_chords
 
     def to_string_array(self, dominant=False, parallel=False) -> list[str]:
         """
@@ -400,36 +436,10 @@ class Key:
             List[str]: 
                 An array of strings representing the formatted chord lines.
         """     
-        data = [f"Chords of {self.root} {self.type}:"] 
-
-        chords = self.chords()
-        table_data = [
-            [str(chord) for chord in chords.values()],
-            list(chords.keys()), 
-        ]
-
-        if dominant:
-            dominant_chords = self.dominant_chords()
-            dominant_data = [
-                ["", "", "", "", "", "", "",],
-                [str(chord) for chord in dominant_chords.values()],
-                list(dominant_chords.keys()),
-            ]
-            table_data += dominant_data
-        
-        if parallel:
-            parallel_chords = self.parallel_chords()
-            parallel_data = [
-                ["", "", "", "", "", "", "",],
-                [str(chord) for chord in parallel_chords.values()],
-                list(parallel_chords.keys()),
-            ]
-            table_data += parallel_data
-
-        for row in table_data:
-            data.append(("{: >10}" * 7).format(*row)) # Always 7 chords in a key
+        # Imported here as the rendering module depends on this one
+        from music_theory.rendering import render_string
 
-        return data
+        return render_string(self, "ascii", dominant, parallel).splitlines()
 
     def pretty_print(self, dominant=False, parallel=False) -> None:
         """ 
@@ -459,8 +469,9 @@ class Key:
             parallel (bool): 
                 A bool indicating whether you want to print the parallel chords.
         """      
-        for line in self.to_string_array(dominant, parallel):
-            print(line)
+        from music_theory.rendering import render
+
+        render(self, sys.stdout, "ascii", dominant, parallel)
 
     def __str__(self) -> str:
         """ 
@@ -488,4 +499,83 @@ class Key:
         """
         return f'Key({self.root} {self.type})' 
 
-#endregion
\ No newline at end of file
+#endregion
+
+#region Functions
+
+def _fifths_from_c(root: Note, direction: str) -> int:
+    """
+    Counts the steps around the circle of fifths from C to a root note, 
+    going up (sharps) or down (flats). Returns 0 if the root is not within 7
+    steps.
+
+    Args:
+        root (Note):
+            The root note of a major key.
+        direction (str):
+            "u" to count sharps, "d" to count flats.
+
+    Returns:
+        int:
+    """
+    note = Note.C
+
+    for i in range(7+1):
+        if note == root:
+            return i
+
+        note = transpose(note, Interval.P5, direction=direction)
+
+    return 0
+
+def _build_key_table() -> dict[tuple[Note, KeyType], Key]:
+    """
+    Builds all 24 keys and everything their properties and chord methods
+    return, then publishes them in the table used by Key.__new__.
+
+    Returns:
+        dict[tuple[Note, KeyType], Key]:
+            The filled table.
+    """
+    set_ = object.__setattr__
+    keys = {}
+
+    for key_type in KEY_TYPES:
+        for root in NOTES:
+            key = object.__new__(Key)
+            set_(key, 'root', root)
+            set_(key, 'type', key_type)
+            keys[(root, key_type)] = key
+
+    for (root, key_type), key in keys.items():
+        scale = Scale(root, KEY_SCALE_TYPES[key_type])
+        chords = {
+            numeral: Chord(note, chord_type) for numeral, note, chord_type 
+            in zip(KEY_CHORD_NUMERALS[key_type], scale.notes, KEY_CHORD_TYPES[key_type])
+        }
+
+        # Shift each root note up a 5th and make it a seventh chord.
+        dominant_chords = {
+            f'V7/{numeral}': Chord(transpose(chord.root, Interval.P5), ChordType.Dominant7)
+            for numeral, chord in chords.items()
+        }
+
+        if key_type == KeyType.Major:
+            relative_key = keys[(transpose(root, Interval.m3, direction='d'), KeyType.Minor)]
+        else:
+            relative_key = keys[(transpose(root, Interval.m3, direction='u'), KeyType.Major)]
+
+        major_root = root if key_type == KeyType.Major else relative_key.root
+
+        set_(key, 'pitch_classes', scale.pitch_classes)
+        set_(key, '_parallel', keys[(root, key_type.parallel)])
+        set_(key, '_relative_key', relative_key)
+        set_(key, '_sharp_count', _fifths_from_c(major_root, 'u'))
+        set_(key, '_flat_count', _fifths_from_c(major_root, 'd'))
+        set_(key, '_chords', MappingProxyType(chords))
+        set_(key, '_dominant_chords', MappingProxyType(dominant_chords))
+
+    _key_table.update(keys)
+    return _key_table
+
+#endregion
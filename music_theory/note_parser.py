@@ -0,0 +1,170 @@
+"""
+This module provides a streaming parser for large amounts of note text, such
+as whole files of whitespace separated note names.
+
+Description:
+    Tokens are resolved with a single dict lookup in `NOTE_TOKENS`, a table
+    of every accepted spelling (a letter A-G in any case followed by no
+    accidental, one or two sharps, or one or two flats). As well as the ASCII
+    `#` and `b` accepted by `Note.from_string`, the Unicode `♯`, `♭`, `𝄪` and
+    `𝄫` symbols are understood.
+
+    Input is consumed one line at a time and notes are yielded lazily, so a
+    file never has to be held in memory. Unlike `notes_from_string`, invalid
+    tokens are never silently replaced; they are either raised as a
+    `NoteParseError` or collected, with their line and column, into a list
+    supplied by the caller.
+
+Classes:
+    NoteParseError:
+        A ValueError raised for an invalid token, holding its position.
+    InvalidNoteToken:
+        A named tuple (token, line, column) describing an invalid token.
+
+Functions:
+    parse_notes(source, errors=None) -> Iterator[Note]:
+        Parses a string or an iterable of lines into Notes.
+    parse_notes_file(path, encoding="utf-8", errors=None) -> Iterator[Note]:
+        Parses a text file into Notes.
+
+Example:
+    >>> from music_theory.note_parser import parse_notes
+    >>> list(parse_notes("C  E♭\\nG\\tB♭♭"))
+    [Note.C, Note.Eb, Note.G, Note.A]
+    >>> errors = []
+    >>> list(parse_notes("C H G", errors))
+    [Note.C, Note.G]
+    >>> errors
+    [InvalidNoteToken(token='H', line=1, column=3)]
+"""
+
+import re
+from os import PathLike
+from typing import Iterable, Iterator, NamedTuple
+
+from music_theory.notes import Note, NOTE_STRINGS, TRANSPOSE_TABLE
+
+# Unicode accidentals, mapped to their semitone offsets.
+UNICODE_ACCIDENTALS: dict[str, int] = {'♯': 1, '♯♯': 2, '𝄪': 2, '♭': -1, '♭♭': -2, '𝄫': -2}
+
+# Every token the parser accepts, mapped to its Note.
+NOTE_TOKENS: dict[str, Note] = {
+    **NOTE_STRINGS,
+    **{
+        letter + accidental: TRANSPOSE_TABLE[Note[letter.upper()].value][offset % 12]
+        for letter in "CDEFGABcdefgab"
+        for accidental, offset in UNICODE_ACCIDENTALS.items()
+    },
+}
+
+_TOKEN_PATTERN = re.compile(r'\S+')
+
+#region Errors
+
+class InvalidNoteToken(NamedTuple):
+    """
+    An invalid token and where it was found. Lines and columns both start at 1.
+    """
+    token: str
+    line: int
+    column: int
+
+class NoteParseError(ValueError):
+    """
+    Raised by `parse_notes` for a token that isn't a note name.
+
+    Attributes:
+        token (str):
+            The invalid token.
+        line (int):
+            The line the token is on, starting at 1.
+        column (int):
+            The column the token starts at, starting at 1.
+    """
+    def __init__(self, token: str, line: int, column: int) -> None:
+        super().__init__(f"Invalid note '{token}' at line {line}, column {column}")
+        self.token = token
+        self.line = line
+        self.column = column
+
+#endregion
+
+#region Functions
+
+def _invalid_tokens(line: str, line_number: int) -> Iterator[InvalidNoteToken]:
+    """
+    Yields the position of every invalid token on a line. Only called once a
+    line is known to hold at least one, so valid lines never pay for
+    position tracking.
+    """
+    for match in _TOKEN_PATTERN.finditer(line):
+        if match.group() not in NOTE_TOKENS:
+            yield InvalidNoteToken(match.group(), line_number, match.start() + 1)
+
+def parse_notes(source: str | Iterable[str], errors: list[InvalidNoteToken] | None=None) -> Iterator[Note]:
+    """
+    Parses note names separated by any whitespace into Notes, yielding them
+    lazily.
+
+    Example:
+        >>> list(parse_notes(["C c# Ebb", "F♯ G𝄫"]))
+        [Note.C, Note.Db, Note.D, Note.Gb, Note.F]
+
+    Args:
+        source (str | Iterable[str]):
+            Either a string (which may span several lines) or an iterable of
+            lines, such as an open text file.
+        errors (list[InvalidNoteToken] | None):
+            If a list is given, invalid tokens are appended to it and skipped.
+            Otherwise the first invalid token raises (default: `None`).
+
+    Raises:
+        NoteParseError:
+            If a token is invalid and no `errors` list was given.
+
+    Returns:
+        Iterator[Note]:
+    """
+    if isinstance(source, str):
+        source = source.splitlines()
+
+    get = NOTE_TOKENS.get
+
+    for line_number, line in enumerate(source, 1):
+        notes = [get(token) for token in line.split()]
+
+        if None in notes:
+            invalid = list(_invalid_tokens(line, line_number))
+
+            if errors is None:
+                raise NoteParseError(*invalid[0])
+
+            errors.extend(invalid)
+            notes = [n for n in notes if n is not None]
+
+        yield from notes
+
+def parse_notes_file(path: str | PathLike, encoding: str="utf-8", errors: list[InvalidNoteToken] | None=None) -> Iterator[Note]:
+    """
+    Parses a text file of note names into Notes, reading it one line at a time.
+
+    Args:
+        path (str | PathLike):
+            The file to read.
+        encoding (str):
+            The file's text encoding (default: `"utf-8"`).
+        errors (list[InvalidNoteToken] | None):
+            If a list is given, invalid tokens are appended to it and skipped.
+            Otherwise the first invalid token raises (default: `None`).
+
+    Raises:
+        NoteParseError:
+            If a token is invalid and no `errors` list was given.
+
+    Returns:
+        Iterator[Note]:
+    """
+    with open(path, encoding=encoding) as f:
+        yield from parse_notes(f, errors)
+
+#endregion
@@ -0,0 +1,393 @@
+"""
+This module defines the `NoteSequence` class, an immutable sequence of notes
+(such as a melody) stored as one byte per note.
+
+Description:
+    A `list[Note]` holds an 8 byte reference for every note. A NoteSequence
+    keeps the pitch classes (0 for C up to 11 for B) in a `bytes` object and
+    reads them through a `memoryview`, so:
+
+        - Each note costs a single byte.
+        - Slicing returns a new NoteSequence over the same bytes, nothing is
+          copied however long the melody is.
+        - Transposition is one `bytes.translate` call through a 256 entry
+          table, rather than one `transpose` call per note.
+
+    Sequences convert to and from `list[Note]`, `bytes` and `array('B')`,
+    and compare equal (and hash the same) when they hold the same notes.
+
+Classes:
+    NoteSequence:
+        An immutable, hashable sequence of notes. Provides:
+            - Construction from notes, bytes, arrays or a string of note names
+            - Indexing, zero-copy slicing, iteration and concatenation
+            - Bulk transposition by an interval in either direction
+            - Conversion to lists of notes, bytes and arrays
+
+Example:
+    >>> from music_theory import Note, NoteSequence
+    >>> melody = NoteSequence.from_string("C E G Bb")
+    >>> melody.transpose(Interval.M2)
+    NoteSequence(D, Gb, A, C)
+    >>> melody[1:3].to_notes()
+    [Note.E, Note.G]
+"""
+
+from array import array
+from mmap import mmap
+from typing import Iterable, Iterator, Self
+
+from music_theory.intervals import Interval
+from music_theory.notes import Note, NOTES, NOTE_STRINGS, TRANSPOSE_TABLE
+from music_theory.utils import direction_sign
+
+# Every valid byte, deleting these from a buffer leaves only the invalid ones
+_PITCH_CLASS_BYTES = bytes(range(len(NOTES)))
+
+_NOTE_NAMES: tuple[str, ...] = tuple(note.name for note in NOTES)
+
+# _TRANSPOSE_TABLES[s] is a 256 byte translation table moving pitch classes
+# up by s semitones, every other byte maps to itself.
+_TRANSPOSE_TABLES: tuple[bytes, ...] = tuple(
+    bytes(TRANSPOSE_TABLE[i][s].value if i < len(NOTES) else i for i in range(256)) for s in range(len(NOTES))
+)
+
+def _as_bytes(view: memoryview) -> bytes:
+    """
+    Returns the bytes a memoryview covers, without copying when it covers
+    the whole of a bytes object.
+    """
+    if isinstance(view.obj, bytes) and view.c_contiguous and view.nbytes == len(view.obj):
+        return view.obj
+
+    return view.tobytes()
+
+#region NoteSequence
+
+class NoteSequence:
+    """
+    An immutable sequence of notes backed by a read only memoryview of bytes,
+    one byte (the note's value) per note.
+
+    Attributes:
+        view (memoryview):
+            A read only property holding the pitch classes.
+
+    Methods:
+        __init__(self, notes=()):
+            Builds the sequence from an iterable of Notes.
+        from_bytes(cls, data):
+            A class method that builds the sequence from pitch class bytes.
+        from_string(cls, notes_str):
+            A class method that parses a whitespace separated string of notes.
+        transpose(self, interval, direction="u"):
+            Returns the sequence transposed by an interval in either direction.
+        to_notes(self):
+            Returns the notes as a list.
+        to_array(self):
+            Returns the pitch classes as an `array('B')`.
+        tobytes(self):
+            Returns the pitch classes as bytes.
+        __len__(self), __iter__(self), __contains__(self, note):
+            Sequence behaviour, iteration yields Notes.
+        __getitem__(self, index):
+            Returns a Note for an index, or a NoteSequence sharing the same
+            memory for a slice.
+        __add__(self, other):
+            Concatenates two sequences.
+        __eq__(self, other), __hash__(self):
+            Sequences are equal (and hash the same) when their notes match.
+        __str__(self), __repr__(self):
+            String representations of the sequence.
+    """
+    __slots__ = ('_view',)
+
+    def __init__(self, notes: Iterable[Note]=()) -> None:
+        """
+        Builds the sequence from an iterable of Notes.
+
+        Example:
+            >>> NoteSequence([Note.C, Note.E, Note.G]).tobytes()
+            b'\\x00\\x04\\x07'
+
+        Args:
+            notes (Iterable[Note]):
+                The notes in order.
+        """
+        # _value_ skips the Enum.value property, which is far slower per note
+        self._view = memoryview(bytes([note._value_ for note in notes]))
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview | array) -> Self:
+        """
+        A class method that builds the sequence from a buffer of pitch
+        classes. A `bytes` object or a read only `mmap` (or a memoryview of
+        either) is used without copying, mutable buffers are copied first.
+
+        Example:
+            >>> NoteSequence.from_bytes(b'\\x00\\x0b')
+            NoteSequence(C, B)
+
+        Args:
+            data (bytes | bytearray | memoryview | array):
+                One pitch class (0 to 11) per byte.
+
+        Raises:
+            ValueError:
+                If any byte isn't a pitch class.
+
+        Returns:
+            NoteSequence:
+        """
+        view = memoryview(data)
+
+        # Only immutable buffers (bytes or a read only mmap) can be shared,
+        # anything else could change underneath the sequence
+        if not (view.readonly and isinstance(view.obj, (bytes, mmap))) or view.format != 'B' or view.ndim != 1:
+            view = memoryview(view.tobytes())
+
+        if _as_bytes(view).translate(None, _PITCH_CLASS_BYTES):
+            raise ValueError("Pitch classes must be in the range 0 to 11")
+
+        return cls._from_view(view)
+
+    @classmethod
+    def _from_view(cls, view: memoryview) -> Self:
+        """
+        Wraps a read only memoryview of pitch classes that is known to be
+        valid, without copying or checking it.
+        """
+        sequence = cls.__new__(cls)
+        sequence._view = view
+        return sequence
+
+    @classmethod
+    def from_string(cls, notes_str: str) -> Self:
+        """
+        A class method that parses a string of note names separated by
+        whitespace, accepting every spelling `Note.from_string` does.
+
+        Example:
+            >>> NoteSequence.from_string("C c# Ebb")
+            NoteSequence(C, Db, D)
+
+        Args:
+            notes_str (str):
+                The note names.
+
+        Raises:
+            ValueError:
+                If a token isn't a note name.
+
+        Returns:
+            NoteSequence:
+        """
+        get = NOTE_STRINGS.get
+        notes = [get(token) for token in notes_str.split()]
+
+        if None in notes:
+            token = notes_str.split()[notes.index(None)]
+            raise ValueError(f"Invalid note: {token}")
+
+        return cls(notes)
+
+    @property
+    def view(self) -> memoryview:
+        """
+        Returns the read only memoryview of pitch classes.
+
+        Returns:
+            memoryview:
+        """
+        return self._view
+
+    def transpose(self, interval: Interval, direction: str="u") -> Self:
+        """
+        Returns the sequence transposed by an interval, every note is moved
+        in a single `bytes.translate` call.
+
+        Example:
+            >>> NoteSequence([Note.C, Note.E, Note.G]).transpose(Interval.P4, "down")
+            NoteSequence(G, B, D)
+
+        Args:
+            interval (Interval):
+                The interval to transpose the notes.
+            direction (str):
+                Can either transpose up or down in pitch. acceptable values are
+                "u", "up", "above", "d", "down" or "below" in any case.
+
+        Raises:
+            ValueError:
+                If the direction string is not recognized.
+
+        Returns:
+            NoteSequence:
+        """
+        semitones = (direction_sign(direction) * interval.value) % 12
+        return NoteSequence._from_view(memoryview(_as_bytes(self._view).translate(_TRANSPOSE_TABLES[semitones])))
+
+    def to_notes(self) -> list[Note]:
+        """
+        Returns the notes as a list.
+
+        Returns:
+            list[Note]:
+        """
+        return list(map(NOTES.__getitem__, self._view))
+
+    def to_array(self) -> array:
+        """
+        Returns a copy of the pitch classes as an `array('B')`, the format
+        used by `batch`.
+
+        Returns:
+            array:
+        """
+        return array('B', self._view)
+
+    def tobytes(self) -> bytes:
+        """
+        Returns the pitch classes as bytes.
+
+        Returns:
+            bytes:
+        """
+        return _as_bytes(self._view)
+
+    __bytes__ = tobytes
+
+    def __len__(self) -> int:
+        """
+        Returns the number of notes.
+
+        Returns:
+            int:
+        """
+        return len(self._view)
+
+    def __iter__(self) -> Iterator[Note]:
+        """
+        Iterates the notes in order.
+
+        Returns:
+            Iterator[Note]:
+        """
+        return map(NOTES.__getitem__, self._view)
+
+    def __contains__(self, note: Note) -> bool:
+        """
+        Returns True if the note is in the sequence.
+
+        Args:
+            note (Note):
+                The note to find.
+
+        Returns:
+            bool:
+        """
+        if not isinstance(note, Note):
+            return False
+
+        return _as_bytes(self._view).find(note.value) != -1
+
+    def __getitem__(self, index: int | slice) -> Note | Self:
+        """
+        Returns the note at an index, or for a slice a NoteSequence that
+        shares this sequence's memory.
+
+        Example:
+            >>> NoteSequence.from_string("C D E F")[::2]
+            NoteSequence(C, E)
+
+        Args:
+            index (int | slice):
+                The index or slice.
+
+        Raises:
+            IndexError:
+                If the index is out of range.
+
+        Returns:
+            Note | NoteSequence:
+        """
+        if isinstance(index, slice):
+            return NoteSequence._from_view(self._view[index])
+
+        return NOTES[self._view[index]]
+
+    def __add__(self, other: Self) -> Self:
+        """
+        Returns the two sequences joined together.
+
+        Args:
+            other (NoteSequence):
+                The sequence to append.
+
+        Returns:
+            NoteSequence:
+        """
+        if not isinstance(other, NoteSequence):
+            return NotImplemented
+
+        return NoteSequence._from_view(memoryview(_as_bytes(self._view) + _as_bytes(other._view)))
+
+    def __eq__(self, other: Self) -> bool:
+        """
+        Equality operator, two sequences are equal if they hold the same
+        notes in the same order.
+
+        Args:
+            other (NoteSequence):
+                The other sequence to compare.
+
+        Returns:
+            bool:
+        """
+        try:
+            return self._view == other._view
+        except AttributeError:
+            return False
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the pitch classes.
+
+        Returns:
+            int:
+        """
+        return hash(_as_bytes(self._view))
+
+    def __reduce__(self):
+        """
+        Pickles the sequence as its bytes (memoryviews can't be pickled).
+        """
+        return (NoteSequence.from_bytes, (_as_bytes(self._view),))
+
+    def __str__(self) -> str:
+        """
+        Returns a string of the note names, formatted like `notes_to_string`.
+
+        Example:
+            >>> str(NoteSequence([Note.G, Note.C]))
+            G, C
+
+        Returns:
+            str:
+        """
+        return ", ".join(map(_NOTE_NAMES.__getitem__, self._view))
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representing the sequence.
+
+        Example:
+            >>> repr(NoteSequence([Note.G, Note.C]))
+            NoteSequence(G, C)
+
+        Returns:
+            str:
+        """
+        return f"NoteSequence({self})"
+
+#endregion
@@ -22,11 +22,7 @@ from enum import Enum
 from typing import Any, Self
 
 from music_theory.intervals import Interval
-from music_theory.utils import (UP_DIRECTIONS, 
-                                DOWN_DIRECTIONS,
-                                index_to_range, 
-                                is_valid_note_str, 
-                                is_empty_or_whitespace)
+from music_theory.utils import direction_sign
 
 
 #region Note
@@ -83,7 +79,7 @@ class Note(Enum):
         Returns:
             list[Note]:
         """  
-        return [n for n in cls]
+        return list(NOTES)
  
     all = items  # Alias
 
@@ -108,8 +104,7 @@ class Note(Enum):
         Returns:
             Note:
         """  
-        index = index_to_range(index)
-        return Note.items()[index]
+        return NOTES[index % 12]
 
     @classmethod
     def from_string(cls, note_str: str) -> Self | None:
@@ -125,6 +120,9 @@ class Note(Enum):
             - One accidental (e.g., "C#", "Eb") applies a minor second transposition.
             - Double accidentals (e.g., "C##", "Ebb") apply a major second transposition.
 
+        Every valid string is precomputed in NOTE_STRINGS, so this is a single
+        dict lookup.
+
         Examples:
             >>> note_from_string("C")
             Note.C
@@ -141,25 +139,7 @@ class Note(Enum):
             Note | None:
                 A corresponding `Note` object if valid, otherwise None.
         """
-        if not is_valid_note_str(note_str):
-            return None
-        
-        note_strs = [str(n) for n in Note.items()]
-        note_index = note_strs.index(note_str[0].upper())
-        note = Note.from_index(note_index)
-
-        if len(note_str) == 1:
-            return note
-        
-        direction = 'u' if (note_str[1] == '#') else 'd'
-
-        # Sharps / flats
-        if len(note_str) == 2:
-            return note.transpose(Interval.m2, direction)
-
-        # Double sharps / flats
-        if len(note_str) == 3:
-            return note.transpose(Interval.M2, direction)
+        return NOTE_STRINGS.get(note_str)
     
     @classmethod
     def random(cls) -> Self:
@@ -169,7 +149,7 @@ class Note(Enum):
         Returns:
             Note:
         """  
-        return random.choice(cls.items())
+        return random.choice(NOTES)
 
     def to_sharp(self) -> str:
         """ 
@@ -185,7 +165,7 @@ class Note(Enum):
                 A string representing a note.
         """  
         if(len(self.name) == 2):
-            lower_note = Note.from_index(self.value-1) # move down a semitone
+            lower_note = NOTES[self.value-1] # move down a semitone
             return lower_note.name + '#'
 
         return self.name
@@ -203,7 +183,7 @@ class Note(Enum):
         Returns:
             Note:
         """  
-        return Note.from_index(self.value-1)
+        return TRANSPOSE_TABLE[self.value][11]
     
     def next(self) -> Self:
         """ 
@@ -216,7 +196,7 @@ class Note(Enum):
         Returns:
             Note:
         """  
-        return Note.from_index(self.value+1)
+        return TRANSPOSE_TABLE[self.value][1]
     
     def transpose(self, interval, direction: str="u") -> Self:
         """ 
@@ -296,6 +276,33 @@ class Note(Enum):
     
 #endregion
 
+#region Lookup Tables
+
+# Immutable tables built once at import so that the hot paths (from_index,
+# transpose, chromatic_notes, ...) are plain indexing rather than list 
+# rebuilding.
+
+NOTES: tuple[Note, ...] = tuple(Note)
+
+# TRANSPOSE_TABLE[n][s] is the note s semitones above the note with value n.
+# Each row is also the upward chromatic scale starting from that note.
+TRANSPOSE_TABLE: tuple[tuple[Note, ...], ...] = tuple(
+    tuple(NOTES[(n + s) % 12] for s in range(12)) for n in range(12)
+)
+
+# Semitone offsets of the accidentals accepted by Note.from_string.
+ACCIDENTALS: dict[str, int] = {'': 0, '#': 1, '##': 2, 'b': -1, 'bb': -2}
+
+# Every string accepted by Note.from_string (a letter A-G in any case, then
+# one of ACCIDENTALS), mapped to its Note.
+NOTE_STRINGS: dict[str, Note] = {
+    letter + accidental: TRANSPOSE_TABLE[Note[letter.upper()].value][offset % 12]
+    for letter in "CDEFGABcdefgab"
+    for accidental, offset in ACCIDENTALS.items()
+}
+
+#endregion
+
 #region Functions
 
 def notes_to_string(note_list: list[Note]) -> str:
@@ -320,9 +327,12 @@ def notes_from_string(notes_str: str, allow_duplicates: bool=True, error: Any=No
     Convert a whitespace-separated string of note names into a list of `Note` 
     objects.
 
-    Each whitespace token is passed to `Note.from_string()`. Successful 
-    conversions produce a `Note` object; failures insert the provided `error`
-    value instead.
+    Each whitespace token (split on any run of whitespace) is passed to 
+    `Note.from_string()`. Successful conversions produce a `Note` object; 
+    failures insert the provided `error` value instead.
+
+    See `note_parser.parse_notes` to stream large inputs and report the 
+    position of invalid tokens.
 
     Example:
         >>> notes_from_string("cb c c#")
@@ -342,14 +352,8 @@ def notes_from_string(notes_str: str, allow_duplicates: bool=True, error: Any=No
             A list containing one item per input token — either a `Note` for
             successful conversions or the `error` value for failed ones.
     """
-    if is_empty_or_whitespace(notes_str):
-        return []
-    
-    l = []
-
-    for _ in notes_str.split(" "):
-        note = Note.from_string(_)
-        l.append(note if note else error)
+    get = NOTE_STRINGS.get
+    l = [get(token, error) for token in notes_str.split()]
 
     if not allow_duplicates:
         l = list(dict.fromkeys(l))
@@ -382,15 +386,7 @@ def transpose(note: Note, interval: Interval, direction: str="u") -> Note:
         Note:
             The note after being transposed.
     """       
-    direction = direction.lower()
-
-    if direction in UP_DIRECTIONS:
-        return Note.from_index(note.value + interval.value)
-
-    elif direction in DOWN_DIRECTIONS:
-        return Note.from_index(note.value - interval.value)
-
-    raise ValueError(f'direction not recognized({direction})')
+    return TRANSPOSE_TABLE[note.value][(direction_sign(direction) * interval.value) % 12]
 
 def chromatic_notes(note: Note, direction: str="u") -> list[Note]:
     """ 
@@ -412,21 +408,12 @@ def chromatic_notes(note: Note, direction: str="u") -> list[Note]:
     Returns:
         list[Note]:
     """     
-    notes = [note]
-    direction = direction.lower()
-
-    for _ in range(11):
-        if direction in UP_DIRECTIONS:
-            note = note.next()
-
-        elif direction in DOWN_DIRECTIONS:
-            note = note.previous()
-
-        else:
-            raise ValueError(f'direction not recognized({direction})')
+    sign = direction_sign(direction)
+    row = TRANSPOSE_TABLE[note.value]
 
-        notes.append(note)
+    if sign > 0:
+        return list(row)
 
-    return notes
+    return [row[0], *row[:0:-1]]
 
 #endregion
\ No newline at end of file
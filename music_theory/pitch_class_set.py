@@ -0,0 +1,385 @@
+"""
+This module defines the `PitchClassSet` class, an immutable set of notes
+stored as a single 12-bit integer mask.
+
+Description:
+    Bit `n` of the mask is set when the note with value `n` is in the set
+    (bit 0 is C, bit 11 is B). Because the library is octave-agnostic every
+    collection of notes fits in 12 bits, so membership, union, intersection
+    and subset checks are single integer operations and transposition is a
+    12-bit rotation.
+
+Classes:
+    PitchClassSet:
+        An immutable, hashable set of notes. Provides:
+            - Construction from notes or a raw mask
+            - Set algebra (union, intersection, difference, subset checks)
+            - Transposition by rotating the mask
+            - Popcount (len) and iteration in ascending note order
+
+Example:
+    >>> from music_theory import Note, PitchClassSet
+    >>> pcs = PitchClassSet([Note.C, Note.E, Note.G])
+    >>> Note.E in pcs
+    True
+    >>> pcs.transpose(Interval.M2)
+    PitchClassSet(D, Gb, A)
+"""
+
+from typing import Iterable, Iterator, Self
+
+from music_theory.intervals import Interval
+from music_theory.notes import Note, NOTES, notes_to_string
+from music_theory.utils import direction_sign
+
+FULL_MASK = 0xFFF
+
+def _build_notes_in_mask() -> tuple[tuple[Note, ...], ...]:
+    """
+    Builds the notes of every mask by doubling: the masks with bit n set are
+    the masks below bit n with the note n appended, which keeps each entry in
+    ascending order with one tuple per mask (rather than 12 bit tests).
+    """
+    table = [()]
+
+    for note in NOTES:
+        table += [notes + (note,) for notes in table]
+
+    return tuple(table)
+
+# _NOTES_IN_MASK[mask] holds the notes of every possible mask in ascending
+# order, so iteration never has to test individual bits.
+_NOTES_IN_MASK: tuple[tuple[Note, ...], ...] = _build_notes_in_mask()
+
+#region PitchClassSet
+
+class PitchClassSet:
+    """
+    An immutable set of notes (pitch classes) backed by a 12-bit integer mask.
+
+    Attributes:
+        mask (int):
+            A read only property holding the 12-bit mask.
+
+    Methods:
+        __init__(self, notes=()):
+            Builds the set from an iterable of Notes.
+        from_mask(cls, mask):
+            A class method that builds the set straight from a 12-bit mask.
+        union(self, other), intersection(self, other), difference(self, other):
+            Set algebra, also available as the |, & and - operators.
+        issubset(self, other), issuperset(self, other), isdisjoint(self, other):
+            Set comparisons, subset checks are also available as <= and >=.
+        complement(self):
+            Returns the notes that are not in this set.
+        rotate(self, semitones):
+            Returns the set with every note moved up by a number of semitones.
+        transpose(self, interval, direction="u"):
+            Returns the set transposed by an interval in either direction.
+        to_notes(self):
+            Returns the notes as a list, in ascending order.
+        __len__(self):
+            Returns the number of notes in the set (popcount).
+        __iter__(self):
+            Iterates the notes in ascending order.
+        __contains__(self, note):
+            True if the note is in the set.
+        __eq__(self, other), __hash__(self):
+            Sets are equal (and hash the same) when their masks match.
+        __str__(self), __repr__(self):
+            String representations of the set.
+    """
+    __slots__ = ('_mask',)
+
+    def __init__(self, notes: Iterable[Note]=()) -> None:
+        """
+        Builds the set from an iterable of Notes. Duplicates are ignored.
+
+        Example:
+            >>> PitchClassSet([Note.C, Note.E, Note.G]).mask
+            145
+
+        Args:
+            notes (Iterable[Note]):
+                The notes in the set.
+        """
+        mask = 0
+
+        for note in notes:
+            mask |= 1 << note.value
+
+        self._mask = mask
+
+    @classmethod
+    def from_mask(cls, mask: int) -> Self:
+        """
+        A class method that builds the set straight from a 12-bit mask.
+
+        Example:
+            >>> PitchClassSet.from_mask(0b10010001)
+            PitchClassSet(C, E, G)
+
+        Args:
+            mask (int):
+                An integer in the range 0 to 4095.
+
+        Raises:
+            ValueError:
+                If the mask is outside of the 12-bit range.
+
+        Returns:
+            PitchClassSet:
+        """
+        if mask < 0 or mask > FULL_MASK:
+            raise ValueError(f"Mask must be in the range 0 to {FULL_MASK}: {mask}")
+
+        pcs = cls.__new__(cls)
+        pcs._mask = mask
+        return pcs
+
+    @property
+    def mask(self) -> int:
+        """
+        Returns the 12-bit mask, bit n is set if the note with value n is in
+        the set.
+
+        Returns:
+            int:
+        """
+        return self._mask
+
+    def union(self, other: Self) -> Self:
+        """
+        Returns the notes in either set.
+
+        Args:
+            other (PitchClassSet):
+                The other set.
+
+        Returns:
+            PitchClassSet:
+        """
+        return PitchClassSet.from_mask(self._mask | other._mask)
+
+    def intersection(self, other: Self) -> Self:
+        """
+        Returns the notes in both sets.
+
+        Args:
+            other (PitchClassSet):
+                The other set.
+
+        Returns:
+            PitchClassSet:
+        """
+        return PitchClassSet.from_mask(self._mask & other._mask)
+
+    def difference(self, other: Self) -> Self:
+        """
+        Returns the notes in this set that are not in the other.
+
+        Args:
+            other (PitchClassSet):
+                The other set.
+
+        Returns:
+            PitchClassSet:
+        """
+        return PitchClassSet.from_mask(self._mask & ~other._mask)
+
+    def issubset(self, other: Self) -> bool:
+        """
+        Returns True if every note in this set is in the other.
+
+        Example:
+            >>> Chord(Note.C).pitch_classes.issubset(Scale(Note.C).pitch_classes)
+            True
+
+        Args:
+            other (PitchClassSet):
+                The other set.
+
+        Returns:
+            bool:
+        """
+        return self._mask & ~other._mask == 0
+
+    def issuperset(self, other: Self) -> bool:
+        """
+        Returns True if every note in the other set is in this one.
+
+        Args:
+            other (PitchClassSet):
+                The other set.
+
+        Returns:
+            bool:
+        """
+        return other._mask & ~self._mask == 0
+
+    def isdisjoint(self, other: Self) -> bool:
+        """
+        Returns True if the sets have no notes in common.
+
+        Args:
+            other (PitchClassSet):
+                The other set.
+
+        Returns:
+            bool:
+        """
+        return self._mask & other._mask == 0
+
+    def complement(self) -> Self:
+        """
+        Returns the notes that are not in this set.
+
+        Returns:
+            PitchClassSet:
+        """
+        return PitchClassSet.from_mask(FULL_MASK & ~self._mask)
+
+    def rotate(self, semitones: int) -> Self:
+        """
+        Returns the set with every note moved up by a number of semitones
+        (negative values move down).
+
+        Example:
+            >>> PitchClassSet([Note.A, Note.B]).rotate(2)
+            PitchClassSet(Db, B)
+
+        Args:
+            semitones (int):
+                The number of semitones to move up.
+
+        Returns:
+            PitchClassSet:
+        """
+        s, mask = semitones % 12, self._mask
+        return PitchClassSet.from_mask(((mask << s) | (mask >> (12 - s))) & FULL_MASK)
+
+    def transpose(self, interval: Interval, direction: str="u") -> Self:
+        """
+        Returns the set transposed by an interval.
+
+        Example:
+            >>> PitchClassSet([Note.C, Note.E, Note.G]).transpose(Interval.M2)
+            PitchClassSet(D, Gb, A)
+
+        Args:
+            interval (Interval):
+                The interval to transpose the notes.
+            direction (str):
+                Can either transpose up or down in pitch. acceptable values are
+                "u", "up", "above", "d", "down" or "below" in any case.
+
+        Raises:
+            ValueError:
+                If the direction string is not recognized.
+
+        Returns:
+            PitchClassSet:
+        """
+        return self.rotate(direction_sign(direction) * interval.value)
+
+    def to_notes(self) -> list[Note]:
+        """
+        Returns the notes in the set as a list, in ascending order.
+
+        Returns:
+            list[Note]:
+        """
+        return list(_NOTES_IN_MASK[self._mask])
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __le__ = issubset
+    __ge__ = issuperset
+
+    def __len__(self) -> int:
+        """
+        Returns the number of notes in the set.
+
+        Returns:
+            int:
+        """
+        return self._mask.bit_count()
+
+    def __iter__(self) -> Iterator[Note]:
+        """
+        Iterates the notes in the set in ascending order (C to B).
+
+        Returns:
+            Iterator[Note]:
+        """
+        return iter(_NOTES_IN_MASK[self._mask])
+
+    def __contains__(self, note: Note) -> bool:
+        """
+        Returns True if the note is in the set.
+
+        Args:
+            note (Note):
+                The note to check.
+
+        Returns:
+            bool:
+        """
+        try:
+            return bool(self._mask >> note.value & 1)
+        except AttributeError:
+            return False
+
+    def __eq__(self, other: Self) -> bool:
+        """
+        Equality operator, two sets are equal if they hold the same notes.
+
+        Args:
+            other (PitchClassSet):
+                The other set to compare.
+
+        Returns:
+            bool:
+        """
+        try:
+            return self._mask == other._mask
+        except AttributeError:
+            return False
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the mask.
+
+        Returns:
+            int:
+        """
+        return hash(self._mask)
+
+    def __str__(self) -> str:
+        """
+        Returns a string of the note names.
+
+        Example:
+            >>> str(PitchClassSet([Note.G, Note.C]))
+            C, G
+
+        Returns:
+            str:
+        """
+        return notes_to_string(_NOTES_IN_MASK[self._mask])
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representing the set.
+
+        Example:
+            >>> repr(PitchClassSet([Note.G, Note.C]))
+            PitchClassSet(C, G)
+
+        Returns:
+            str:
+        """
+        return f"PitchClassSet({self})"
+
+#endregion
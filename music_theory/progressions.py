@@ -7,7 +7,13 @@
 # TODO:
 #-------------------------------------------------------------------------------
 
-from music_theory.keys import Key
+import sys
+from itertools import product, repeat
+from typing import Any, Iterable
+
+from music_theory.keys import Key, KEY_CHORD_NUMERALS
+from music_theory.key_type import KEY_TYPES
+from music_theory.notes import NOTES
 
 #region Progressions
 
@@ -105,6 +111,8 @@ class NumeralCadences:
 class Progression:
     """Represents a chord progression.
     """
+    __slots__ = ('key', 'numerals', 'error', 'chords')
+
     def __init__(self, key, numeral_progression, error='X'):
         self.key = key
         self.numerals = numeral_progression
@@ -112,15 +120,10 @@ class Progression:
         self.chords = chords_from_progression(key, self.numerals, error)
 
     def pretty_print(self):
-        print(f"Chords in progression in the key of {self.key}:")
-
-        table_data = [
-            list(self.numerals), 
-            [str(chord) for chord in self.chords],
-        ]
+        # Imported here as the rendering module depends on this one
+        from music_theory.rendering import render
 
-        for row in table_data:
-            print(("{: >10}" * len(self.numerals)).format(*row))
+        render(self, sys.stdout, "ascii")
 
     def __str__(self):
         return f'{self.key} - {self.numerals}'
@@ -128,6 +131,168 @@ class Progression:
     def __repr__(self):
         return f'Progression({self.key}, {self.numerals})'
     
+#region Compiled Progressions
+
+# Normalisation table for user shorthand
+SHORTHAND_MAP = {
+    'viidim': 'vii°',
+    'vii': 'vii°', 
+    'iidim': 'ii°',
+    'ii': 'ii',
+}
+
+# A numeral's code is key_type.value * 7 + degree, so 0-6 are the chords of
+# the major key and 7-13 the chords of the minor key on the same root.
+NUMERAL_CODES: dict[str, int] = {
+    numeral: key_type.value * 7 + degree
+    for key_type in KEY_TYPES
+    for degree, numeral in enumerate(KEY_CHORD_NUMERALS[key_type])
+}
+
+INVALID_CODE = len(NUMERAL_CODES)
+
+def _spellings(word: str) -> set[str]:
+    """
+    Returns every upper/lower case spelling of a word.
+    """
+    return {''.join(chars) for chars in product(*((c.lower(), c.upper()) for c in word))}
+
+# Every string chords_from_progression accepts, mapped straight to its code.
+# Shorthands match in any case, other numerals must match exactly.
+_NUMERAL_CODE_TABLE: dict[str, int] = {
+    numeral: code for numeral, code in NUMERAL_CODES.items() 
+    if numeral.lower() not in SHORTHAND_MAP
+} | {
+    spelling: NUMERAL_CODES[full] 
+    for shorthand, full in SHORTHAND_MAP.items() 
+    for spelling in _spellings(shorthand)
+}
+
+# _chord_rows[root value][code] -> Chord, filled on first use.
+_chord_rows: list[tuple] = []
+
+def _build_chord_rows() -> list[tuple]:
+    """
+    Builds the table of chords for every root and numeral code.
+
+    Returns:
+        list[tuple]:
+    """
+    for root in NOTES:
+        _chord_rows.append(tuple(
+            chord for key_type in KEY_TYPES for chord in Key(root, key_type).chords().values()
+        ))
+
+    return _chord_rows
+
+class ProgressionCompiler:
+    """
+    A numeral progression parsed once into integer codes, which can then be
+    resolved against any key (or all 24 keys) with table lookups.
+
+    A key's chords and parallel chords are the chords of the major and minor
+    keys on the same root, so each numeral compiles to a code for one of
+    those 14 chords (see NUMERAL_CODES). Unrecognised numerals compile to
+    INVALID_CODE.
+
+    Example:
+        >>> compiled = ProgressionCompiler(["I", "V", "vi", "IV"])
+        >>> compiled.resolve(Key(Note.G))
+        [Chord(G, Major), Chord(D, Major), Chord(E, Minor), Chord(C, Major)]
+
+    Attributes:
+        numerals (tuple):
+            The progression as given.
+        codes (tuple[int, ...]):
+            One integer code per numeral.
+
+    Methods:
+        resolve(self, key, error='X'):
+            Returns the chords of the progression in a key.
+        resolve_all(self, error='X'):
+            Returns the chords of the progression in all 24 keys.
+    """
+    __slots__ = ('numerals', 'codes')
+
+    def __init__(self, progression: Iterable[str]) -> None:
+        """
+        Parses the progression into integer codes.
+
+        Numerals are normalised the same way as chords_from_progression,
+        diminished chords can be passed as '°' or 'dim' and 'vii' is accepted
+        for 'vii°'.
+
+        Args:
+            progression (Iterable[str]):
+                A list of roman numerals notating the chords.
+        """
+        self.numerals = numerals = tuple(progression)
+
+        try:
+            self.codes = tuple(map(_NUMERAL_CODE_TABLE.get, numerals, repeat(INVALID_CODE)))
+        except TypeError: # An unhashable numeral 
+            self.codes = tuple(
+                _NUMERAL_CODE_TABLE.get(n, INVALID_CODE) if isinstance(n, str) else INVALID_CODE
+                for n in numerals
+            )
+
+    def resolve(self, key: Key, error: Any='X') -> list:
+        """
+        Returns the chords of the progression in a key. Can be in either the
+        chords or parallel chords of the key.
+
+        Args:
+            key (Key):
+                The key the chords are from.
+            error (Any):
+                A placeholder for missing or invalid chords in the key.
+
+        Returns:
+            list[Chord|Any]:
+                A List of Chord objects or the 'error' parameter.
+        """
+        row = (_chord_rows or _build_chord_rows())[key.root.value] + (error,)
+        return [row[code] for code in self.codes]
+
+    def resolve_all(self, error: Any='X') -> dict[Key, list]:
+        """
+        Returns the chords of the progression in all 24 keys.
+
+        Args:
+            error (Any):
+                A placeholder for missing or invalid chords in the key.
+
+        Returns:
+            dict[Key, list[Chord|Any]]:
+                The resolved progression for each key, in the order of 
+                KeyType then Note.
+        """
+        rows = _chord_rows or _build_chord_rows()
+        resolved = [[row[code] for code in self.codes] for row in (r + (error,) for r in rows)]
+
+        # Major and minor keys on the same root share their chords.
+        return {Key(root, key_type): list(resolved[root.value]) for key_type in KEY_TYPES for root in NOTES}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of numerals in the progression.
+
+        Returns:
+            int:
+        """
+        return len(self.codes)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representing the compiled progression.
+
+        Returns:
+            str:
+        """
+        return f'ProgressionCompiler({list(self.numerals)})'
+
+#endregion
+
 #region Functions
 
 def chords_from_progression(key, progression, error='X'):
@@ -163,22 +328,6 @@ def chords_from_progression(key, progression, error='X'):
         list[Chord|str]: 
             A List of Chord objects or a string containing the 'error' parameter.
     """
-    # Normalisation table for user shorthand
-    shorthand_map = {
-        'viidim': 'vii°',
-        'vii': 'vii°', 
-        'iidim': 'ii°',
-        'ii': 'ii',
-    }
-
-    progression = [
-        shorthand_map.get(numeral.lower(), numeral)
-        if isinstance(numeral, str) else numeral
-        for numeral in progression
-    ]
-
-    chord_dict = key.chords() | key.parallel_chords()
-
-    return [chord_dict.get(numeral, error) for numeral in progression]
+    return ProgressionCompiler(progression).resolve(key, error)
 
 #endregion
\ No newline at end of file
@@ -0,0 +1,484 @@
+"""
+This module provides a rendering layer that writes keys, progressions,
+diatonic scales and instrument fretboards as ASCII, Markdown, CSV or JSON.
+
+Description:
+    Every entity is first turned into a `Table`: a kind, a name, a title and
+    one or more `Section`s of label / value pairs (numerals and chords,
+    degrees and notes, frets and notes). Each format then lays the table out
+    in its own way:
+
+        - "ascii": the fixed width tables printed by `pretty_print`.
+        - "markdown": a heading followed by pipe tables.
+        - "csv": one `kind,name,section,label,value` row per pair.
+        - "json": one object per entity, with the same fields as `Table`.
+          Labels are kept as a list as they can repeat (a progression may
+          use the same numeral twice).
+
+    Output is written straight to any object with a `write` method (an open
+    file, `sys.stdout`, an `io.StringIO`...). Tables and the formatted text
+    of each entity are cached, keys, scales and chords being immutable, so
+    rendering the same entity again is a dictionary lookup and a single
+    write.
+
+Classes:
+    Section:
+        A named tuple of matching labels and values.
+    Table:
+        A named tuple describing an entity ready to be formatted.
+
+Functions:
+    table_for(entity, dominant=False, parallel=False, num_frets=12) -> Table:
+        Returns the table for an entity.
+    render_string(entity, fmt="ascii", dominant=False, parallel=False, num_frets=12) -> str:
+        Returns an entity formatted as a string.
+    render(entity, out, fmt="ascii", dominant=False, parallel=False, num_frets=12) -> None:
+        Writes one entity to a file-like object.
+    render_all(entities, out, fmt="ascii", dominant=False, parallel=False, num_frets=12) -> None:
+        Writes several entities to a file-like object as one document.
+    render_keys(out, fmt="ascii") -> None:
+        Writes every key with every combination of options in one pass.
+
+Example:
+    >>> import sys
+    >>> render(Key(Note.C), sys.stdout, "markdown")
+    ### Chords of C Major
+
+    | I | ii | iii | IV | V | vi | vii° |
+    | --- | --- | --- | --- | --- | --- | --- |
+    | CM | Dm | Em | FM | GM | Am | B° |
+"""
+
+import csv
+import json
+from functools import lru_cache
+from io import StringIO
+from typing import Any, Iterable, NamedTuple, TextIO
+
+from music_theory.fretboard import fretboard_for
+from music_theory.key_type import KEY_TYPES
+from music_theory.keys import Key
+from music_theory.notes import NOTES, notes_to_string
+from music_theory.progressions import Progression
+from music_theory.scale_diatonic import DiatonicScale
+from music_theory.string_instrument import StringInstrument
+
+FORMATS = ("ascii", "markdown", "csv", "json")
+
+CSV_HEADER = ("kind", "name", "section", "label", "value")
+
+# Every (dominant, parallel) combination a key can be rendered with
+KEY_OPTIONS = ((False, False), (True, False), (False, True), (True, True))
+
+DEFAULT_FRETS = 12
+
+#region Tables
+
+class Section(NamedTuple):
+    """
+    A named group of labels and their values, e.g. numerals and chords.
+
+    Attributes:
+        name (str):
+            The section name, unique within its table.
+        labels (tuple[str, ...]):
+            The labels, e.g. `('I', 'ii', ...)`.
+        values (tuple[str, ...]):
+            The value for each label, e.g. `('CM', 'Dm', ...)`.
+    """
+    name: str
+    labels: tuple[str, ...]
+    values: tuple[str, ...]
+
+
+class Table(NamedTuple):
+    """
+    An entity ready to be formatted.
+
+    Attributes:
+        kind (str):
+            One of "key", "progression", "scale" or "instrument".
+        name (str):
+            The entity's name, e.g. "C Major".
+        title (str):
+            The heading printed above the table.
+        sections (tuple[Section, ...]):
+            The table's sections, in display order.
+    """
+    kind: str
+    name: str
+    title: str
+    sections: tuple[Section, ...]
+
+
+def _section(name: str, mapping: dict[str, Any]) -> Section:
+    return Section(name, tuple(mapping), tuple(str(value) for value in mapping.values()))
+
+def _key_table(key: Key, dominant: bool, parallel: bool) -> Table:
+    sections = [_section("chords", key.chords())]
+
+    if dominant:
+        sections.append(_section("dominant", key.dominant_chords()))
+
+    if parallel:
+        sections.append(_section("parallel", key.parallel_chords()))
+
+    name = f"{key.root} {key.type}"
+    return Table("key", name, f"Chords of {name}:", tuple(sections))
+
+def _progression_table(key: Key, numerals: tuple[str, ...], chords: tuple[Any, ...]) -> Table:
+    section = Section("progression", tuple(str(numeral) for numeral in numerals), tuple(str(chord) for chord in chords))
+    return Table("progression", str(key), f"Chords in progression in the key of {key}:", (section,))
+
+def _scale_table(scale: DiatonicScale) -> Table:
+    return Table("scale", scale.name, f"Scale Degrees of {scale.name}:", (_section("degrees", scale.note_degrees()),))
+
+def _instrument_table(tuning: tuple, num_frets: int) -> Table:
+    frets = tuple(str(fret) for fret in range(num_frets + 1))
+    sections = tuple(
+        Section(f"string {string_index}", frets, tuple(str(note) for note in row))
+        for string_index, row in enumerate(fretboard_for(tuning, num_frets).notes)
+    )
+    name = notes_to_string(tuning)
+    return Table("instrument", name, f"Fretboard of {name}:", sections)
+
+_TABLE_BUILDERS = {
+    "key": _key_table,
+    "progression": _progression_table,
+    "scale": _scale_table,
+    "instrument": _instrument_table,
+}
+
+def _cache_key(entity: Any, dominant: bool=False, parallel: bool=False, num_frets: int=DEFAULT_FRETS) -> tuple:
+    """
+    Returns a hashable tuple identifying what an entity renders as, the first
+    item is the kind of table and the rest are the arguments of its builder.
+    Options that don't apply to an entity are ignored.
+    """
+    if isinstance(entity, Key):
+        return ("key", entity, dominant, parallel)
+
+    if isinstance(entity, DiatonicScale):
+        return ("scale", entity)
+
+    if isinstance(entity, Progression):
+        return ("progression", entity.key, tuple(entity.numerals), tuple(entity.chords))
+
+    if isinstance(entity, StringInstrument):
+        if num_frets < 0:
+            raise ValueError(f"Frets can't be negative: {num_frets}")
+
+        return ("instrument", tuple(entity.tuning), num_frets)
+
+    raise ValueError(f"Can't render {type(entity).__name__} objects")
+
+@lru_cache(maxsize=1024)
+def _table(cache_key: tuple) -> Table:
+    return _TABLE_BUILDERS[cache_key[0]](*cache_key[1:])
+
+#endregion
+
+#region Formats
+
+def _ascii(table: Table) -> str:
+    """
+    Lays a table out in the fixed width format printed by `pretty_print`.
+    """
+    buffer = StringIO()
+    write = buffer.write
+    write(table.title + "\n")
+
+    if table.kind == "scale":
+        section = table.sections[0]
+        width = max(map(len, section.labels)) + 1
+
+        for label, value in zip(section.labels, section.values):
+            write(f"\t{label.ljust(width)}: {value}\n")
+
+    elif table.kind == "instrument":
+        # Highest string first, the way tab is written
+        frets = table.sections[0].labels
+        write("    " + ("{: >4}" * len(frets)).format(*frets) + "\n")
+
+        for section in reversed(table.sections):
+            write(("{: <4}" + "{: >4}" * len(section.values) + "\n").format(section.values[0], *section.values))
+
+    else:
+        for index, section in enumerate(table.sections):
+            row_format = "{: >10}" * len(section.labels) + "\n"
+
+            if index:
+                write(row_format.format(*([""] * len(section.labels))))
+
+            # Keys list chords above their numerals, progressions below
+            if table.kind == "key":
+                write(row_format.format(*section.values))
+                write(row_format.format(*section.labels))
+            else:
+                write(row_format.format(*section.labels))
+                write(row_format.format(*section.values))
+
+    return buffer.getvalue()
+
+def _markdown_row(cells: Iterable[str]) -> str:
+    return "| " + " | ".join(cell.replace("|", "\\|") for cell in cells) + " |\n"
+
+def _markdown(table: Table) -> str:
+    """
+    Lays a table out as a heading and pipe tables, one per section, or a
+    single grid for a fretboard.
+    """
+    parts = [f"### {table.title.rstrip(':')}\n"]
+
+    if table.kind == "instrument":
+        labels = table.sections[0].labels
+        parts.append("\n")
+        parts.append(_markdown_row(("string", *labels)))
+        parts.append(_markdown_row(["---"] * (len(labels) + 1)))
+
+        for section in table.sections:
+            parts.append(_markdown_row((section.name, *section.values)))
+
+        return "".join(parts)
+
+    for section in table.sections:
+        parts.append("\n")
+
+        if len(table.sections) > 1:
+            parts.append(f"#### {section.name}\n\n")
+
+        parts.append(_markdown_row(section.labels))
+        parts.append(_markdown_row(["---"] * len(section.labels)))
+        parts.append(_markdown_row(section.values))
+
+    return "".join(parts)
+
+def _csv(table: Table) -> str:
+    """
+    Returns a table's CSV rows, without the header.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    for section in table.sections:
+        writer.writerows((table.kind, table.name, section.name, label, value)
+                         for label, value in zip(section.labels, section.values))
+
+    return buffer.getvalue()
+
+def _json(table: Table) -> str:
+    """
+    Returns a table as a single line JSON object.
+    """
+    return json.dumps({
+        "kind": table.kind,
+        "name": table.name,
+        "title": table.title,
+        "sections": [section._asdict() for section in table.sections],
+    }, ensure_ascii=False)
+
+_FORMATTERS = {
+    "ascii": _ascii,
+    "markdown": _markdown,
+    "csv": _csv,
+    "json": _json,
+}
+
+_CSV_HEADER_LINE = ",".join(CSV_HEADER) + "\n"
+
+# (prefix, separator, suffix) written around a single entity and around
+# several entities. Several JSON objects are written as an array.
+_SINGLE_FRAMES = {
+    "ascii": ("", "", ""),
+    "markdown": ("", "", ""),
+    "csv": (_CSV_HEADER_LINE, "", ""),
+    "json": ("", "", "\n"),
+}
+
+_MANY_FRAMES = {
+    "ascii": ("", "\n", ""),
+    "markdown": ("", "\n", ""),
+    "csv": (_CSV_HEADER_LINE, "", ""),
+    "json": ("[\n", ",\n", "\n]\n"),
+}
+
+@lru_cache(maxsize=4096)
+def _formatted(fmt: str, cache_key: tuple) -> str:
+    return _FORMATTERS[fmt](_table(cache_key))
+
+def _check_format(fmt: str) -> None:
+    if fmt not in _FORMATTERS:
+        raise ValueError(f"Unknown format: {fmt}, expected one of {', '.join(FORMATS)}")
+
+#endregion
+
+#region Functions
+
+def table_for(entity: Key | Progression | DiatonicScale | StringInstrument, dominant: bool=False,
+              parallel: bool=False, num_frets: int=DEFAULT_FRETS) -> Table:
+    """
+    Returns the (cached) table for an entity, for building other formats.
+
+    Example:
+        >>> table_for(Key(Note.G)).sections[0].values[:3]
+        ('GM', 'Am', 'Bm')
+
+    Args:
+        entity (Key | Progression | DiatonicScale | StringInstrument):
+            The entity to describe.
+        dominant (bool):
+            Include a key's dominant chords (default: `False`).
+        parallel (bool):
+            Include a key's parallel chords (default: `False`).
+        num_frets (int):
+            The number of frets shown for an instrument (default: `12`).
+
+    Raises:
+        ValueError:
+            - If the entity can't be rendered.
+            - If `num_frets` is negative.
+
+    Returns:
+        Table:
+    """
+    return _table(_cache_key(entity, dominant, parallel, num_frets))
+
+def render_string(entity: Key | Progression | DiatonicScale | StringInstrument, fmt: str="ascii",
+                  dominant: bool=False, parallel: bool=False, num_frets: int=DEFAULT_FRETS) -> str:
+    """
+    Returns an entity formatted as a string, see `render` for the arguments.
+
+    Example:
+        >>> render_string(Key(Note.C), "json")
+        '{"kind": "key", "name": "C Major", "title": "Chords of C Major:", "sections": [{"name": "chords", "labels": ["I", ...], "values": ["CM", ...]}]}\\n'
+
+    Returns:
+        str:
+    """
+    _check_format(fmt)
+    prefix, _, suffix = _SINGLE_FRAMES[fmt]
+    return prefix + _formatted(fmt, _cache_key(entity, dominant, parallel, num_frets)) + suffix
+
+def render(entity: Key | Progression | DiatonicScale | StringInstrument, out: TextIO, fmt: str="ascii",
+           dominant: bool=False, parallel: bool=False, num_frets: int=DEFAULT_FRETS) -> None:
+    """
+    Writes one entity to a file-like object.
+
+    Example:
+        >>> render(DiatonicScale(Note.A, ScaleType.Minor), sys.stdout, "csv")
+        kind,name,section,label,value
+        scale,A Minor,degrees,tonic,A
+        ...
+
+    Args:
+        entity (Key | Progression | DiatonicScale | StringInstrument):
+            The entity to write.
+        out (TextIO):
+            Anything with a `write(str)` method.
+        fmt (str):
+            One of `FORMATS` (default: `"ascii"`).
+        dominant (bool):
+            Include a key's dominant chords (default: `False`).
+        parallel (bool):
+            Include a key's parallel chords (default: `False`).
+        num_frets (int):
+            The number of frets shown for an instrument (default: `12`).
+
+    Raises:
+        ValueError:
+            - If the format is unknown.
+            - If the entity can't be rendered.
+            - If `num_frets` is negative.
+    """
+    _check_format(fmt)
+    prefix, _, suffix = _SINGLE_FRAMES[fmt]
+    write = out.write
+
+    if prefix:
+        write(prefix)
+
+    write(_formatted(fmt, _cache_key(entity, dominant, parallel, num_frets)))
+
+    if suffix:
+        write(suffix)
+
+def _write_many(cache_keys: Iterable[tuple], out: TextIO, fmt: str) -> None:
+    """
+    Writes the entities identified by cache keys as one document.
+    """
+    prefix, separator, suffix = _MANY_FRAMES[fmt]
+    write = out.write
+    formatted = _formatted
+    first = True
+
+    write(prefix)
+
+    for cache_key in cache_keys:
+        if first:
+            first = False
+        elif separator:
+            write(separator)
+
+        write(formatted(fmt, cache_key))
+
+    write(suffix)
+
+def render_all(entities: Iterable[Key | Progression | DiatonicScale | StringInstrument], out: TextIO, fmt: str="ascii",
+               dominant: bool=False, parallel: bool=False, num_frets: int=DEFAULT_FRETS) -> None:
+    """
+    Writes several entities to a file-like object as one document: ASCII and
+    Markdown tables are separated by a blank line, CSV has a single header and
+    JSON is written as an array. Entities are consumed lazily.
+
+    Args:
+        entities (Iterable[Key | Progression | DiatonicScale | StringInstrument]):
+            The entities to write, in order.
+        out (TextIO):
+            Anything with a `write(str)` method.
+        fmt (str):
+            One of `FORMATS` (default: `"ascii"`).
+        dominant (bool):
+            Include the keys' dominant chords (default: `False`).
+        parallel (bool):
+            Include the keys' parallel chords (default: `False`).
+        num_frets (int):
+            The number of frets shown for instruments (default: `12`).
+
+    Raises:
+        ValueError:
+            - If the format is unknown.
+            - If an entity can't be rendered.
+            - If `num_frets` is negative.
+    """
+    _check_format(fmt)
+    _write_many((_cache_key(entity, dominant, parallel, num_frets) for entity in entities), out, fmt)
+
+def render_keys(out: TextIO, fmt: str="ascii") -> None:
+    """
+    Writes all 24 keys with every combination of dominant and parallel chords
+    (96 tables) to a file-like object in one pass, ordered by root, then key
+    type, then options.
+
+    Example:
+        >>> with open("keys.md", "w", encoding="utf-8") as f:
+        ...     render_keys(f, "markdown")
+
+    Args:
+        out (TextIO):
+            Anything with a `write(str)` method.
+        fmt (str):
+            One of `FORMATS` (default: `"ascii"`).
+
+    Raises:
+        ValueError:
+            If the format is unknown.
+    """
+    _check_format(fmt)
+    _write_many((
+        ("key", Key(root, key_type), dominant, parallel)
+        for root in NOTES
+        for key_type in KEY_TYPES
+        for dominant, parallel in KEY_OPTIONS
+    ), out, fmt)
+
+#endregion
@@ -38,6 +38,8 @@ Example:
     ]
 """
 
+import sys
+
 from music_theory.intervals import Interval, interval_distance
 from music_theory.notes import Note
 from music_theory.scale_type import ScaleType
@@ -76,8 +78,8 @@ class DiatonicScale(Scale):
             The 7th scale degree (see above)
 
     Methods:        
-        __init__(self, root, scale_type):
-            Initializes the root and scale type.
+        _construct(self):
+            Builds the scale and checks that it contains 7 notes.
         valid_scale_types(cls):
             A class method that returns all ScaleTypes that contain 7 notes.
         invalid_scale_types(cls):
@@ -91,25 +93,22 @@ class DiatonicScale(Scale):
         __repr__(self):
             Returns a string with the class, root note and ScaleType.
     """
-    def __init__(self, root: Note, scale_type: ScaleType=ScaleType.Major) -> None:
+    __slots__ = ()
+
+    def _construct(self) -> None:
         """ 
-        Builds the scale from a root note and a scale type. 
+        Builds the scale (see Scale._construct) and checks that it is
+        diatonic. Runs once per root and scale type, DiatonicScales are 
+        interned alongside Scales.
 
         Example:
             >>> ds = DiatonicScale(Note.E, ScaleType.Dorian)
 
         Raises:
-             AttributeError: 
+             ValueError: 
                 If the scale does not contain 7 notes.
-
-        Args:
-            root (Note):
-                The note to build the scale from.
-            scale_type (ScaleType):
-                The type of scale that contains 7 notes (i.e. not pentatonic
-                or blues)      
         """
-        super(DiatonicScale, self).__init__(root, scale_type)
+        super()._construct()
         
         if self.num_notes != 7:
             raise ValueError(f"Diatonic scales must contain 7 notes, not {self.num_notes}")
@@ -302,15 +301,10 @@ class DiatonicScale(Scale):
             list[str]:
                 A list of strings representing each scale degree in a readable format.
         """
-        nd = self.note_degrees()
-        max_key_len = max(len(k) for k in nd.keys())
+        # Imported here as the rendering module depends on this one
+        from music_theory.rendering import render_string
 
-        l = [f"Scale Degrees of {self.name}:"]
-
-        for k, v in nd.items():
-            l.append(f"\t{k.ljust(max_key_len + 1)}: {v}")
-
-        return l      
+        return render_string(self, "ascii").splitlines()
 
     def pretty_print(self) -> None:
         """
@@ -328,8 +322,9 @@ class DiatonicScale(Scale):
                 submediant   : A
                 leading_tone : B
         """
-        for _ in self.to_string_array():
-            print(_)
+        from music_theory.rendering import render
+
+        render(self, sys.stdout, "ascii")
   
     def __repr__(self) -> str:
         """ 
@@ -49,7 +49,7 @@ class ScaleType(Enum):
         Returns:
             A list of ScaleTypes.
         """  
-        return [n for n in cls]
+        return list(SCALE_TYPES)
 
     all = items  # Alias
 
@@ -65,7 +65,7 @@ class ScaleType(Enum):
         Returns:
             A ScaleType.
         """  
-        return random.choice(cls.items())
+        return random.choice(SCALE_TYPES)
 
     def __str__(self):
         """ Returns a string representing the scale name. 
@@ -91,4 +91,7 @@ class ScaleType(Enum):
         Returns:
             A string representing the ScaleType.
         """
-        return f'ScaleType.{self.name}'
\ No newline at end of file
+        return f'ScaleType.{self.name}'
+
+# Built once at import, returned by items() and used by random().
+SCALE_TYPES: tuple[ScaleType, ...] = tuple(ScaleType)
\ No newline at end of file
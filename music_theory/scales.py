@@ -9,9 +9,10 @@
 # TODO:
 #-------------------------------------------------------------------------------
 
-from typing import Iterator, Self
+from typing import Iterable, Iterator, Self
 
 from music_theory.notes import Note, notes_to_string
+from music_theory.pitch_class_set import PitchClassSet
 from music_theory.scale_type import ScaleType
 from music_theory.intervals import Interval
 
@@ -143,12 +144,80 @@ def _intervals_from_numerics(formula):
 
 #region Scale
 
+# The (creation, interval, numeric) formulas of each ScaleType, shared by
+# every root. Built on first use.
+_formulas_by_type: dict[ScaleType, tuple[tuple, tuple[Interval, ...], tuple[str, ...]]] = {}
+
+def _scale_formulas(scale_type: ScaleType) -> tuple[tuple, tuple[Interval, ...], tuple[str, ...]]:
+    """ Returns the creation, interval and numeric formulas of a scale type.
+
+        Scales are built 3 different ways. Some scales are defined by intervals, 
+        some are defined by steps and some are defined by numerics. They can also
+        have a different number of notes in them.
+
+    Args:
+        scale_type:
+            The type of scale.
+
+    Returns:
+        A tuple of the creation, interval and numeric formula tuples.
+
+    Raises:
+        ValueError:
+            Raised if the Scale's type is not in any dictionaries.
+    """
+    try:
+        return _formulas_by_type[scale_type]
+    except KeyError:
+        pass
+
+    # First, try to build the scale from intervals e.g. (Unison M2 M3 M5 M6) 
+    if(scale_type in formula_interval_dict):
+        creation_formula = formula_interval_dict[scale_type]
+        interval_formula = creation_formula
+
+    # If the formula is not in interval form, convert it from step 
+    # e.g. (w w h w w w h) -> (M2 M3 P4 P5 M6 M7, Unison)
+    #      NOTE: The first letter is the step from the root. 
+    elif(scale_type in formula_step_dict):    
+        creation_formula = formula_step_dict[scale_type]
+        interval_formula = _intervals_from_steps(creation_formula)
+
+    # Last way to construct a scale is from numerics.
+    # e.g. (1 b3 4 b5 5 b7) -> (Unison, m3, P4, dim5 5 m7)
+    elif(scale_type in formula_numeric_dict):
+        creation_formula = formula_numeric_dict[scale_type]
+        interval_formula = _intervals_from_numerics(creation_formula) 
+        
+    else:
+        raise ValueError(f'Scale is not in either formula dictionary ({repr(scale_type)})')
+
+    formulas = (
+        tuple(creation_formula),
+        tuple(interval_formula),
+        tuple(i.to_numeric() for i in interval_formula),
+    )
+    _formulas_by_type[scale_type] = formulas
+
+    return formulas
+
+# Every Scale (and DiatonicScale) built so far, keyed by (class, root, type).
+_interned_scales: dict[tuple[type, Note, ScaleType], "Scale"] = {}
+
 class Scale:
     """ A class representing a Scale (A collection of musical notes).
 
         Note: There isn't a step_fomula attribute, because not every scale can
         represent them. The pentatonic scale for example, will cover steps
         greater than a whole (2 semi-tones).
+
+        Scales are immutable and interned. There are only 12 x 14 possible
+        scales, so each (root, scale type) pair is built once and every later
+        Scale(root, scale_type) call returns the same instance. Scales are
+        hashable and can be used as dict keys or set members.
+
+        The notes, formulas and pitch classes are computed the first time
+        they are read and kept from then on.
     
     Attributes:
         root:
@@ -156,13 +225,15 @@ class Scale:
         type:
             The type of scale (e.g. minor, major, blues, lydian, etc...).
         notes:
-            A list of notes for the scale
+            A tuple of notes for the scale
         creation_formula:
             The formula used to create the scale.
         interval_formula:
-            A list of intervals describing the scale.
+            A tuple of intervals describing the scale.
         numeric_formula:
-            A list of numerics describing the scale.
+            A tuple of numerics describing the scale.
+        pitch_classes:
+            The notes as a PitchClassSet.
         name:
             A property that returns the name of the scale.
         num_notes:
@@ -171,13 +242,22 @@ class Scale:
             A property that returns the number of flats in the scale.
 
     Methods:        
-        __init__(self, root, scale_type):
-            Initialises the root and scale type, then calls _construct().
+        __new__(cls, root, scale_type):
+            Returns the interned scale, calling _construct() the first time a
+            root and scale type are requested.
         _construct(self):
-            Constructs the scale from the root and scale type in __init__().
-            Put into it's own private method so that __init__() remains readable. 
+            Checks the scale type can be built.
+            Put into it's own private method so that __new__() remains readable. 
+        __getattr__(self, name):
+            Computes the notes, formulas and pitch classes on first access.
         __eq__(self, other):
             Compares two scales. True if root and scale_type match.
+        __hash__(self):
+            Hashes the root and scale_type.
+        __setattr__(self, name, value), __delattr__(self, name):
+            Raise AttributeError, scales are immutable.
+        __reduce__(self):
+            Pickles a scale as its root and scale_type.
         __iter__(self):
             Allows for convienient for loop useage.
         random(cls):
@@ -187,28 +267,56 @@ class Scale:
         __repr__(self):
             Returns a string representation of the scale and type.
     """
-    def __init__(self, root: Note, scale_type:ScaleType=ScaleType.Major) -> None:
+    __slots__ = ('root', 'type', 'creation_formula', 'interval_formula', 
+                 'notes', 'numeric_formula', 'pitch_classes')
+
+    def __new__(cls, root: Note, scale_type: ScaleType=ScaleType.Major) -> Self:
         """ 
-        Builds the scale from a root Note and a ScaleType. 
+        Returns the scale for a root Note and a ScaleType, building it on the
+        first request and returning the interned instance afterwards.
+
+        Example:
+            >>> Scale(Note.C, ScaleType.Major) is Scale(Note.C, ScaleType.Major)
+            True
 
         Args:
-            root:
+            root (Note):
                 The note to build the scale from.
-            scale_type:
+            scale_type (ScaleType):
                 The type of scale (e.g. minor, major, blues, lydian, etc...
 
+        Raises:
+            ValueError:
+                Raised if the root is not a Note, or the Scale's type is not
+                in any dictionaries.
+
         Returns:
-            None.        
+            Scale:
         """
-        self.root, self.type = root, scale_type
+        key = (cls, root, scale_type)
+
+        try:
+            return _interned_scales[key]
+        except KeyError:
+            pass
+
+        if not isinstance(root, Note):
+            raise ValueError(f"Unknown root note: {root}")
+
+        self = super().__new__(cls)
+        object.__setattr__(self, 'root', root)
+        object.__setattr__(self, 'type', scale_type)
         self._construct()
 
-    def _construct(self):
-        """ Method is private so not to pollute the __init__() method. 
+        return _interned_scales.setdefault(key, self)
 
-            Build the scale from 3 different ways. Some scales are defined by intervals, 
-            some are defined by steps and some are defined by numerics. They can also
-            have a different number of notes in them.
+    def _construct(self) -> None:
+        """ Method is private so not to pollute the __new__() method. 
+
+            Checks that the scale can be built from its type. The notes and
+            formulas are not computed here, they are filled in on first
+            access by __getattr__() (see _LAZY_ATTRIBUTES), so building a
+            scale only to read its name or root costs nothing more.
 
         Args:
             None.
@@ -220,34 +328,53 @@ class Scale:
             ValueError:
                 Raised if the Scale's type is not in any dictionaries.
         """
-        # First, try to build the scale from intervals e.g. (Unison M2 M3 M5 M6) 
-        if(self.type in formula_interval_dict):
-            self.creation_formula = formula_interval_dict[self.type]
-            self.interval_formula = self.creation_formula
-
-        # If the formula is not in interval form, convert it from step 
-        # e.g. (w w h w w w h) -> (M2 M3 P4 P5 M6 M7, Unison)
-        #      NOTE: The first letter is the step from the root. 
-        elif(self.type in formula_step_dict):    
-            steps = formula_step_dict[self.type]
-
-            self.creation_formula = steps
-            self.interval_formula = _intervals_from_steps(steps)
- 
-        # Last way to construct a scale is from numerics.
-        # e.g. (1 b3 4 b5 5 b7) -> (Unison, m3, P4, dim5 5 m7)
-        elif(self.type in formula_numeric_dict):
-            numerics = formula_numeric_dict[self.type]
-
-            self.creation_formula = numerics
-            self.interval_formula = _intervals_from_numerics(numerics) 
-            
-        else:
-            raise ValueError(f'Scale is not in either formula dictionary ({repr(self.type)})')
+        _scale_formulas(self.type)
+
+    def __getattr__(self, name: str):
+        """ 
+        Computes a lazy attribute the first time it is read and stores it in
+        its slot, so later reads are plain attribute lookups that never reach
+        this method.
+
+        Raises:
+            AttributeError:
+                If the attribute doesn't exist.
+        """
+        try:
+            compute = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+        value = compute(self)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value) -> None:
+        """ 
+        Scales are immutable (they are shared between every caller).
+
+        Raises:
+            AttributeError:
+                Always.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable, can't set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """ 
+        Scales are immutable (they are shared between every caller).
+
+        Raises:
+            AttributeError:
+                Always.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable, can't delete '{name}'")
 
-        # Once we have a formula in interval format we can build the scale from it.
-        self.notes = _notes_from_intervals(self.root, self.interval_formula) 
-        self.numeric_formula = [i.to_numeric() for i in self.interval_formula]  
+    def __reduce__(self):
+        """ 
+        Pickles the scale as its root and type so that unpickling returns the
+        interned instance.
+        """
+        return (type(self), (self.root, self.type))
 
     def __eq__(self, other: Self) -> bool:
         """ 
@@ -270,6 +397,15 @@ class Scale:
         except AttributeError:
             return False
 
+    def __hash__(self) -> int:
+        """ 
+        Returns a hash of the root and scale type, consistent with __eq__.
+
+        Returns:
+            int:
+        """
+        return hash((self.root, self.type))
+
     def __iter__(self) -> Iterator[Note]:
         """
         Allows convenient iteration over the scale using a for loop to return 
@@ -309,7 +445,7 @@ class Scale:
         Returns:
             An integer.
         """
-        return len(self.notes)
+        return len(self.interval_formula)
 
     @property
     def num_flats(self):
@@ -346,7 +482,7 @@ class Scale:
         Returns:
             A string.
         """
-        return f"{self.notes[0].name} {self.type.name}: { notes_to_string(self.notes) }"
+        return f"{self.root.name} {self.type.name}: { notes_to_string(self.notes) }"
 
     def __repr__(self):
         """ Returns a string representing the Scale name and type. 
@@ -359,7 +495,17 @@ class Scale:
         Returns:
             A string.
         """
-        return f"Scale(Note.{self.notes[0]}, ScaleType.{self.type})"
+        return f"Scale(Note.{self.root}, ScaleType.{self.type})"
+
+# How each lazy Scale attribute is computed on first access, see
+# Scale.__getattr__(). The formulas are shared by every scale of a type.
+_LAZY_ATTRIBUTES = {
+    'creation_formula': lambda scale: _scale_formulas(scale.type)[0],
+    'interval_formula': lambda scale: _scale_formulas(scale.type)[1],
+    'numeric_formula': lambda scale: _scale_formulas(scale.type)[2],
+    'notes': lambda scale: tuple(_notes_from_intervals(scale.root, scale.interval_formula)),
+    'pitch_classes': lambda scale: PitchClassSet(scale.notes),
+}
 
 #endregion
 
@@ -403,4 +549,85 @@ def modes_from_note(note: Note) -> list[Scale]:
     m.append(Scale(s.notes[5], ScaleType.Aeolian))
     m.append(Scale(s.notes[6], ScaleType.Locrian))
 
-    return m
\ No newline at end of file
+    return m
+#region Scale Index
+
+# Every Scale ordered by fit (fewest notes first, then ScaleType, then root),
+# and _SCALES_WITH_NOTE[n] is a bitmap of the scales containing the note with
+# value n, where bit i stands for _RANKED_SCALES[i]. Built on first use.
+_RANKED_SCALES: list[Scale] = []
+_SCALES_WITH_NOTE: list[int] = []
+
+# Query results, keyed by the pitch class mask of the query.
+_scales_containing_cache: dict[int, tuple[Scale, ...]] = {}
+
+def _build_scale_index() -> list[int]:
+    """
+    Builds the ranked scale list and the note -> scales bitmaps used by
+    `scales_containing`.
+
+    Returns:
+        list[int]:
+            The filled bitmaps.
+    """
+    scales = [Scale(root, scale_type) for scale_type in ScaleType for root in Note]
+    scales.sort(key=lambda s: len(s.pitch_classes))  # stable, keeps type then root order
+
+    bitmaps = [0] * 12
+
+    for i, scale in enumerate(scales):
+        for note in scale.pitch_classes:
+            bitmaps[note.value] |= 1 << i
+
+    _RANKED_SCALES.extend(scales)
+    _SCALES_WITH_NOTE.extend(bitmaps)
+    return _SCALES_WITH_NOTE
+
+def scales_containing(notes: Iterable[Note] | PitchClassSet) -> tuple[Scale, ...]:
+    """
+    Returns every scale (all roots and ScaleTypes) that contains all of the 
+    given notes, ranked by fit: scales with fewer notes outside the query come
+    first.
+
+    Each note's bitmap of scales is intersected, so a query costs one AND per
+    distinct note, and results are cached per set of notes.
+
+    Example:
+        >>> scales_containing([Note.C, Note.Eb, Note.G, Note.Bb])[:3]
+        (Scale(Note.Eb, ScaleType.MajorPentatonic), Scale(Note.C, ScaleType.MinorPentatonic), Scale(Note.C, ScaleType.Blues))
+
+    Args:
+        notes (Iterable[Note] | PitchClassSet):
+            The notes that must all be in the scale.
+
+    Returns:
+        tuple[Scale, ...]:
+            The matching scales, best fit first. Every scale matches an empty
+            query.
+    """
+    if not isinstance(notes, PitchClassSet):
+        notes = PitchClassSet(notes)
+
+    mask = notes.mask
+
+    try:
+        return _scales_containing_cache[mask]
+    except KeyError:
+        pass
+
+    bitmaps = _SCALES_WITH_NOTE or _build_scale_index()
+    matches = (1 << len(_RANKED_SCALES)) - 1
+
+    for note in notes:
+        matches &= bitmaps[note.value]
+
+    result = []
+
+    while matches:
+        lowest = matches & -matches
+        result.append(_RANKED_SCALES[lowest.bit_length() - 1])
+        matches ^= lowest
+
+    return _scales_containing_cache.setdefault(mask, tuple(result))
+
+#endregion
@@ -0,0 +1,589 @@
+"""
+This module provides a local asyncio server that answers scale, chord, key,
+progression and instrument queries over line-delimited JSON-RPC 2.0, and a
+client for it.
+
+Description:
+    Each line sent to the server is a JSON-RPC request object, or a batch (a
+    JSON array of request objects), and each line it sends back is the
+    matching response (or array of responses). Notifications (requests
+    without an id) get no response.
+
+    Requests are handled in the order they arrive on a connection, so a
+    client can pipeline any number of requests without waiting for the
+    responses, which come back in the same order. Handling a request never
+    awaits, so one connection can't hold up the others for longer than one
+    request takes.
+
+    The server builds every Scale, Chord and Key and the key detection
+    tables before it starts listening, and caches the encoded result of
+    every distinct query, as every method is a pure function of its
+    parameters. A repeated query costs one JSON decode and one dict lookup.
+
+    Notes are written as strings ("C#", "Eb"), and scale, chord and key
+    types, intervals and directions by name ("Dorian", "Minor7", "P5",
+    "down"). A bad parameter gets an "Invalid params" error, as does an
+    instrument query over the limits on strings, span and frets
+    (MAX_STRINGS, MAX_SPAN, MAX_FRET), which keep every request short.
+
+    The server listens on TCP (127.0.0.1:8765 by default) or on a Unix
+    socket, run with `python -m music_theory.server`.
+
+Classes:
+    RpcError:
+        A ValueError raised by the client for an error response.
+    Client:
+        An asyncio client that pipelines calls over one connection.
+
+Functions:
+    handle_line(line) -> bytes | None:
+        Returns the response line for a request line.
+    start_server(host="127.0.0.1", port=8765, path=None) -> asyncio.Server:
+        Warms the tables and starts listening.
+    main(argv=None) -> int:
+        The command line entry point.
+
+Example:
+    $ python -m music_theory.server --port 8765
+    >>> async with await Client.connect(port=8765) as client:
+    ...     await client.call("key", root="A", type="Minor")
+    {'name': 'A Minor', 'chords': {'i': 'Am', 'ii°': 'B°', ...}, ...}
+    ...     await client.batch([("chord", {"root": "C"}), ("progression", {"root": "G", "numerals": ["I", "V"]})])
+    [{'name': 'CM', 'notes': ['C', 'E', 'G']}, ['GM', 'DM']]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from functools import lru_cache
+from itertools import count
+from os import PathLike
+from typing import Any, Callable, Iterable, Self
+
+from music_theory.chord_type import ChordType
+from music_theory.chords import Chord, identify_chord
+from music_theory.instrument_creator import create_standard_guitar
+from music_theory.intervals import Interval
+from music_theory.key_detection import KEYS, rank_keys, rank_keys_for_chords
+from music_theory.key_type import KeyType
+from music_theory.keys import Key
+from music_theory.note_parser import NOTE_TOKENS
+from music_theory.notes import Note, NOTES, transpose
+from music_theory.progressions import ProgressionCompiler
+from music_theory.scale_type import ScaleType
+from music_theory.scales import Scale, modes_from_note, scales_containing
+from music_theory.string_instrument import StringInstrument
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# The longest request line (or batch) accepted, in bytes.
+LINE_LIMIT = 1 << 20
+
+# Writes are only awaited once this much output is waiting to be sent.
+WRITE_BUFFER_LIMIT = 1 << 16
+
+# Limits on the instrument queries, which run on the event loop. The largest
+# chord_voicings search they allow takes tens of milliseconds.
+MAX_STRINGS = 8
+MAX_SPAN = 5
+MAX_FRET = 24
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+_STANDARD_TUNING = tuple(note.name for note in create_standard_guitar().tuning)
+
+#region Parameters
+
+def _note(name: str) -> Note:
+    try:
+        return NOTE_TOKENS[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid note: {name!r}") from None
+
+def _notes(names: Iterable[str]) -> list[Note]:
+    if isinstance(names, str):
+        names = names.split()
+    return [_note(name) for name in names]
+
+def _member(enum, name: str):
+    try:
+        return enum[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid {enum.__name__}: {name!r}") from None
+
+def _names(items: Iterable) -> list[str]:
+    return [str(item) for item in items]
+
+def _string(name: str, value: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string: {value!r}")
+    return value
+
+def _strings(name: str, values: list[str]) -> list[str]:
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise ValueError(f"{name} must be a list of strings: {values!r}")
+    return values
+
+def _bounded(name: str, value: int, low: int, high: int) -> int:
+    if not isinstance(value, int) or isinstance(value, bool) or not low <= value <= high:
+        raise ValueError(f"{name} must be an integer from {low} to {high}: {value!r}")
+    return value
+
+def _instrument(tuning: list[str]) -> StringInstrument:
+    if isinstance(tuning, str) or not 1 <= len(tuning) <= MAX_STRINGS:
+        raise ValueError(f"tuning must be a list of 1 to {MAX_STRINGS} notes: {tuning!r}")
+    return _instrument_for(tuple(tuning))
+
+@lru_cache(maxsize=64)
+def _instrument_for(tuning: tuple[str, ...]) -> StringInstrument:
+    # Shared per tuning, the methods used here never change an instrument.
+    return StringInstrument(_notes(tuning))
+
+#endregion
+
+#region Methods
+
+# Every method by name. Methods take JSON values as parameters and return a
+# JSON value, raising ValueError (or TypeError) for bad parameters.
+METHODS: dict[str, Callable[..., Any]] = {}
+
+def _method(name: str):
+    def register(func):
+        METHODS[name] = func
+        return func
+    return register
+
+@_method("ping")
+def _ping() -> str:
+    return "pong"
+
+@_method("transpose")
+def _transpose(notes: list[str], interval: str, direction: str="u") -> list[str]:
+    interval = _member(Interval, interval)
+    direction = _string("direction", direction)
+    return _names(transpose(note, interval, direction) for note in _notes(notes))
+
+@_method("scale")
+def _scale(root: str, type: str="Major") -> dict:
+    scale = Scale(_note(root), _member(ScaleType, type))
+    return {"name": scale.name, "notes": _names(scale.notes)}
+
+@_method("modes")
+def _modes(root: str) -> list[str]:
+    return [scale.name for scale in modes_from_note(_note(root))]
+
+@_method("scales_containing")
+def _scales_containing(notes: list[str], limit: int=20) -> list[str]:
+    return [scale.name for scale in scales_containing(_notes(notes))[:limit]]
+
+@_method("chord")
+def _chord(root: str, type: str="Major") -> dict:
+    chord = Chord(_note(root), _member(ChordType, type))
+    return {"name": str(chord), "notes": _names(chord.notes)}
+
+@_method("identify_chord")
+def _identify_chord(notes: list[str]) -> list[dict]:
+    return [{"name": str(match.chord), "inversion": match.inversion} for match in identify_chord(_notes(notes))]
+
+@_method("key")
+def _key(root: str, type: str="Major") -> dict:
+    key = Key(_note(root), _member(KeyType, type))
+
+    return {
+        "name": key.name,
+        "chords": {numeral: str(chord) for numeral, chord in key.chords().items()},
+        "parallel_chords": {numeral: str(chord) for numeral, chord in key.parallel_chords().items()},
+        "dominant_chords": {numeral: str(chord) for numeral, chord in key.dominant_chords().items()},
+        "relative_key": key.relative_key.name,
+    }
+
+@_method("progression")
+def _progression(root: str, numerals: list[str], type: str="Major", error: str="X") -> list[str]:
+    key = Key(_note(root), _member(KeyType, type))
+    return [str(chord) for chord in ProgressionCompiler(_strings("numerals", numerals)).resolve(key, _string("error", error))]
+
+@_method("detect_key")
+def _detect_key(notes: list[str]=(), chords: list[dict]=(), top: int=3) -> list[list]:
+    if chords:
+        ranked = rank_keys_for_chords([Chord(_note(c["root"]), _member(ChordType, c.get("type", "Major"))) for c in chords])
+    else:
+        ranked = rank_keys(_notes(notes))
+
+    return [[key.name, round(score, 6)] for key, score in ranked[:top]]
+
+@_method("notes_in_chord")
+def _notes_in_chord(chord: str, tuning: list[str]=_STANDARD_TUNING) -> list[str]:
+    return _names(_instrument(tuning).notes_in_chord(_string("chord", chord)))
+
+@_method("chord_voicings")
+def _chord_voicings(root: str, type: str="Major", tuning: list[str]=_STANDARD_TUNING, max_span: int=3, max_fret: int=12, limit: int=50) -> list[list]:
+    chord = Chord(_note(root), _member(ChordType, type))
+    instrument = _instrument(tuning)
+    voicings = instrument.chord_voicings(chord, _bounded("max_span", max_span, 0, MAX_SPAN), _bounded("max_fret", max_fret, 0, MAX_FRET))
+    return [list(voicing) for voicing in voicings[:_bounded("limit", limit, 0, sys.maxsize)]]
+
+#endregion
+
+#region Requests
+
+class _Failure(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+def _error(request_id: Any, code: int, message: str) -> str:
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}, ensure_ascii=False)
+
+@lru_cache(maxsize=16384)
+def _result(method: str, params: str) -> str:
+    """
+    Runs a method and returns its encoded result. Keyed by the method and its
+    canonical (sorted, compact) JSON parameters, so repeated queries are
+    answered from the cache. Errors are not cached.
+    """
+    func = METHODS.get(method)
+
+    if func is None:
+        raise _Failure(METHOD_NOT_FOUND, f"Method not found: {method!r}")
+
+    args = json.loads(params)
+
+    try:
+        result = func(*args) if isinstance(args, list) else func(**args)
+    except (ValueError, TypeError, KeyError) as e:
+        raise _Failure(INVALID_PARAMS, f"Invalid params: {e}") from None
+
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+def _handle(request: Any) -> str | None:
+    """
+    Returns the encoded response to one request object, or None for a
+    notification.
+    """
+    if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+        return _error(request.get("id") if isinstance(request, dict) else None, INVALID_REQUEST, "Invalid Request")
+
+    params = request.get("params", {})
+    request_id = request.get("id")
+
+    if not isinstance(params, (dict, list)):
+        return _error(request_id, INVALID_REQUEST, "Invalid Request")
+
+    try:
+        result = _result(request["method"], json.dumps(params, sort_keys=True, separators=(",", ":")))
+    except _Failure as e:
+        response = _error(request_id, e.code, e.message)
+    except Exception as e: # pragma: no cover
+        response = _error(request_id, INTERNAL_ERROR, f"Internal error: {e}")
+    else:
+        response = f'{{"jsonrpc":"2.0","id":{json.dumps(request_id)},"result":{result}}}'
+
+    return None if "id" not in request else response
+
+def handle_line(line: bytes | str) -> bytes | None:
+    """
+    Returns the response line (ending in a newline) for a request line, or
+    None if nothing should be sent back (a notification, a batch of only
+    notifications, or a blank line).
+
+    Example:
+        >>> handle_line(b'{"jsonrpc": "2.0", "id": 1, "method": "chord", "params": {"root": "A", "type": "Minor"}}')
+        b'{"jsonrpc":"2.0","id":1,"result":{"name":"Am","notes":["A","C","E"]}}\\n'
+
+    Args:
+        line (bytes | str):
+            One JSON request object or batch array.
+
+    Returns:
+        bytes | None:
+    """
+    if not line.strip():
+        return None
+
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return (_error(None, PARSE_ERROR, "Parse error") + "\n").encode()
+
+    if isinstance(request, list):
+        if not request:
+            return (_error(None, INVALID_REQUEST, "Invalid Request") + "\n").encode()
+
+        responses = [r for r in map(_handle, request) if r is not None]
+        return f"[{','.join(responses)}]\n".encode() if responses else None
+
+    response = _handle(request)
+    return None if response is None else (response + "\n").encode()
+
+#endregion
+
+#region Server
+
+def _warm_up() -> None:
+    """
+    Builds every Scale, Chord and Key, and the key detection tables, so the
+    first queries don't pay for them.
+    """
+    for root in NOTES:
+        for scale_type in ScaleType:
+            Scale(root, scale_type)
+
+        for chord_type in ChordType:
+            Chord(root, chord_type)
+
+    for key in KEYS:
+        key.chords()
+
+    rank_keys(NOTES)
+    rank_keys_for_chords([Chord(NOTES[0])])
+    ProgressionCompiler(["I"]).resolve(KEYS[0])
+
+async def _serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError: # The line is longer than LINE_LIMIT
+                writer.write((_error(None, INVALID_REQUEST, "Request too long") + "\n").encode())
+                break
+
+            if not line:
+                break
+
+            response = handle_line(line)
+
+            if response is not None:
+                writer.write(response)
+
+                if writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                    await writer.drain()
+
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+async def start_server(host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, path: str | PathLike | None=None) -> asyncio.Server:
+    """
+    Warms the tables and starts listening on a TCP port, or on a Unix socket
+    when a path is given.
+
+    Example:
+        >>> server = await start_server(port=0)
+        >>> server.sockets[0].getsockname()
+        ('127.0.0.1', 52514)
+
+    Args:
+        host (str):
+            The address to listen on (default: `"127.0.0.1"`).
+        port (int):
+            The port to listen on, 0 picks a free port (default: `8765`).
+        path (str | PathLike | None):
+            A Unix socket to listen on instead of TCP.
+
+    Returns:
+        asyncio.Server:
+    """
+    _warm_up()
+
+    if path is not None:
+        return await asyncio.start_unix_server(_serve_connection, path, limit=LINE_LIMIT)
+
+    return await asyncio.start_server(_serve_connection, host, port, limit=LINE_LIMIT)
+
+#endregion
+
+#region Client
+
+class RpcError(ValueError):
+    """
+    An error response from the server.
+
+    Attributes:
+        code (int):
+            The JSON-RPC error code.
+        message (str):
+            The error message.
+    """
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(f"{message} ({code})")
+        self.code = code
+        self.message = message
+
+class Client:
+    """
+    An asyncio client that sends every call over one connection without
+    waiting for earlier calls to finish, matching responses to calls by id.
+
+    Example:
+        >>> async with await Client.connect() as client:
+        ...     await asyncio.gather(*(client.call("scale", root=n) for n in "CDEFGAB"))
+
+    Methods:
+        connect(cls, host="127.0.0.1", port=8765, path=None):
+            Opens a connection to a server.
+        call(self, method, **params):
+            Calls a method and returns its result.
+        batch(self, calls):
+            Sends several calls as one batch.
+        notify(self, method, **params):
+            Sends a notification, which gets no response.
+        close(self):
+            Closes the connection.
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._ids = count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._reading = asyncio.get_running_loop().create_task(self._read_responses())
+
+    @classmethod
+    async def connect(cls, host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, path: str | PathLike | None=None) -> Self:
+        """
+        Opens a connection to a server on a TCP port, or on a Unix socket
+        when a path is given.
+
+        Returns:
+            Client:
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=LINE_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+
+        return cls(reader, writer)
+
+    async def _read_responses(self) -> None:
+        error = ConnectionError("Connection closed")
+
+        try:
+            while line := await self._reader.readline():
+                responses = json.loads(line)
+
+                for response in responses if isinstance(responses, list) else (responses,):
+                    future = self._pending.pop(response.get("id"), None)
+
+                    if future is None or future.done():
+                        continue
+
+                    if "error" in response:
+                        future.set_exception(RpcError(response["error"]["code"], response["error"]["message"]))
+                    else:
+                        future.set_result(response["result"])
+        except (ConnectionError, ValueError) as e:
+            error = ConnectionError(f"Connection lost: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+            self._pending.clear()
+
+    def _request(self, method: str, params: dict) -> tuple[dict, asyncio.Future]:
+        if self._reading.done():
+            raise ConnectionError("Connection closed")
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}, future
+
+    async def _send(self, payload: Any) -> None:
+        self._writer.write(json.dumps(payload, ensure_ascii=False).encode() + b"\n")
+
+        if self._writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+            await self._writer.drain()
+
+    async def call(self, method: str, **params) -> Any:
+        """
+        Calls a method and returns its result.
+
+        Raises:
+            RpcError:
+                If the server returned an error.
+            ConnectionError:
+                If the connection was lost.
+        """
+        request, future = self._request(method, params)
+        await self._send(request)
+        return await future
+
+    async def batch(self, calls: Iterable[tuple[str, dict]]) -> list[Any]:
+        """
+        Sends several (method, params) calls as one batch and returns their
+        results in order. A call that failed has its RpcError in place of
+        its result rather than raising.
+
+        Returns:
+            list[Any]:
+        """
+        pending = [self._request(method, params) for method, params in calls]
+
+        if not pending:
+            return []
+
+        await self._send([request for request, _ in pending])
+        return list(await asyncio.gather(*(future for _, future in pending), return_exceptions=True))
+
+    async def notify(self, method: str, **params) -> None:
+        """
+        Sends a notification, a call whose result isn't wanted.
+        """
+        await self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    async def close(self) -> None:
+        """
+        Closes the connection, failing any calls still waiting.
+        """
+        self._writer.close()
+
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+        await self._reading
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+#endregion
+
+async def _serve_forever(host: str, port: int, path: str | None) -> None:
+    server = await start_server(host, port, path)
+    address = path or ":".join(map(str, server.sockets[0].getsockname()[:2]))
+    print(f"listening on {address}", flush=True)
+
+    async with server:
+        await server.serve_forever()
+
+def main(argv: list[str] | None=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m music_theory.server", description="Serves music theory queries over line-delimited JSON-RPC.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on, 0 for any (default: %(default)s)")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,17 @@ import re
 
 from music_theory.notes import Note, transpose, notes_to_string
 from music_theory.intervals import Interval, interval_distance
+from music_theory.fretboard import DEFAULT_FRETS, Fretboard, fretboard_for
+from music_theory.pitch_class_set import PitchClassSet
+from music_theory.tab_parser import parse_tab
+from music_theory.voicings import Voicing, find_voicings
 
 def extract_frets(line):
     return [int(fret) for fret in re.findall(r"\d+", line)]
 
 class StringInstrument:
+    __slots__ = ('tuning', '_fretboard')
+
     def __init__(self, tuning: list[Note]):
         """ 
         Creates the instrument from a list of Notes that represent each string. 
@@ -26,8 +32,12 @@ class StringInstrument:
         if len(tuning) < 1:
             raise ValueError("Instruments must have at least 1 string")
 
-        self.num_strings = len(tuning)
         self.tuning = tuning
+        self._fretboard = None
+
+    @property
+    def num_strings(self) -> int:
+        return len(self.tuning)
         
     @classmethod 
     def from_tuning_intervals(cls, root_note, tuning_intervals):
@@ -52,6 +62,44 @@ class StringInstrument:
 
     def detune(self, interval):
         self.tuning = [transpose(string, interval, direction="d") for string in self.tuning]
+
+    @property
+    def fretboard(self) -> Fretboard:
+        """
+        Returns the precomputed fretboard (up to fret 24) for the current 
+        tuning. It is shared between instruments with the same tuning and 
+        refreshed whenever the tuning changes, including by assigning to
+        `tuning` or one of its strings.
+
+        Returns:
+            Fretboard:
+        """
+        tuning = tuple(self.tuning)
+        fretboard = self._fretboard
+
+        if fretboard is None or fretboard.tuning != tuning:
+            fretboard = self._fretboard = fretboard_for(tuning, DEFAULT_FRETS)
+
+        return fretboard
+
+    def positions_of(self, notes: Note | PitchClassSet) -> tuple[tuple[int, int], ...]:
+        """
+        Returns every (string_index, fret) position of a note, or of any note
+        in a PitchClassSet, up to fret 24.
+
+        Example:
+            >>> create_standard_guitar().positions_of(Note.Eb)[:2]
+            ((0, 11), (0, 23))
+
+        Args:
+            notes (Note | PitchClassSet):
+                The note or notes to find.
+
+        Returns:
+            tuple[tuple[int, int], ...]:
+                Positions ordered by string, then fret.
+        """
+        return self.fretboard.positions_of(notes)
     
     def note_at_fret(self, string_index: int, fret: int) -> Note:
         """
@@ -83,6 +131,9 @@ class StringInstrument:
         if fret < 0:
             raise ValueError(f"Frets can't be negative: {fret}")
         
+        if fret <= DEFAULT_FRETS:
+            return self.fretboard.notes[string_index][fret]
+
         return Note.from_index(self.tuning[string_index].value + fret) 
 
     def notes_in_chord(self, chord_str):
@@ -100,6 +151,52 @@ class StringInstrument:
 
         return notes  
 
+    def notes_in_riff(self, riff_str: str) -> list[Note]:
+        """
+        Returns the notes played in a riff written as ASCII tab, in the order
+        they are played. Notes played together are listed from the lowest
+        string up, muted notes are skipped.
+
+        Example:
+            >>> guitar.notes_in_riff("e|-----|\nB|-----|\nG|-----|\nD|-----|\nA|-3h5-|\nE|-----|")
+            [Note.C, Note.D]
+
+        Args:
+            riff_str (str):
+                The tab, one line per string with the highest string first.
+                See `tab_parser.parse_tab` for streaming large files.
+
+        Returns:
+            list[Note]:
+        """
+        return [event.note for event in parse_tab(self, riff_str) if event.note is not None]
+
+    def chord_voicings(self, chord, max_span: int=3, max_fret: int=12, bass: Note | None=None, allow_muted: bool=True) -> tuple[Voicing, ...]:
+        """
+        Returns every playable voicing of a chord on the instrument, see
+        `voicings.find_voicings` for the constraints.
+
+        Example:
+            >>> (None, 3, 2, 0, 1, 0) in create_standard_guitar().chord_voicings(Chord(Note.C))
+            True
+
+        Args:
+            chord (Chord | PitchClassSet | Iterable[Note]):
+                The chord, or any collection of notes, to voice.
+            max_span (int):
+                The largest distance between fretted frets (default: `3`).
+            max_fret (int):
+                The highest fret that can be used (default: `12`).
+            bass (Note | None):
+                A note the lowest sounding string must play (default: `None`).
+            allow_muted (bool):
+                If False every string must be played (default: `True`).
+
+        Returns:
+            tuple[Voicing, ...]:
+        """
+        return find_voicings(self, chord, max_span, max_fret, bass, allow_muted)
+
     def intervals_in_chord(self, chord_str):
         notes = self.notes_in_chord(chord_str)
 
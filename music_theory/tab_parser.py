@@ -0,0 +1,198 @@
+"""
+This module provides a streaming parser for ASCII guitar (or bass) tab.
+
+Description:
+    A tab staff is a block of lines, one per string, where time runs from left
+    to right and each column is one step in time:
+
+        e|-----0-----|
+        B|---1---1---|
+        G|-0-------0-|
+        D|-----------|
+        A|-3-----3h5-|
+        E|-----------|
+
+    Frets can be any number of digits and may be preceded by a technique
+    symbol: `h` (hammer-on), `p` (pull-off), `/` (slide up) or `\\` (slide
+    down). An `x` is a muted (dead) note. Anything else (`-`, `|`, vibrato
+    marks and so on) is treated as filler.
+
+    Lines are read one at a time and only the staff currently being read is
+    kept in memory, so arbitrarily large tab files can be parsed. Lines that
+    don't look like a staff line (an optional string name, a `|` or `:` bar
+    marker, then tab), such as titles, section headings, lyrics, chord names
+    and blank lines, are skipped, and each staff's columns carry on from
+    where the previous staff finished so event times keep increasing
+    through the file.
+
+Classes:
+    TabEvent:
+        A named tuple describing one note (or muted note) in the tab.
+
+Functions:
+    parse_tab(instrument, source, high_string_first=True) -> Iterator[TabEvent]:
+        Parses a string or an iterable of lines into time ordered events.
+    parse_tab_file(instrument, path, encoding="utf-8", high_string_first=True) -> Iterator[TabEvent]:
+        Parses a tab file into time ordered events.
+
+Example:
+    >>> from music_theory.instrument_creator import create_standard_guitar
+    >>> tab = "e|---|\\nB|---|\\nG|---|\\nD|---|\\nA|-3h5|\\nE|---|"
+    >>> [(e.time, e.note, e.technique) for e in parse_tab(create_standard_guitar(), tab)]
+    [(1, Note.C, ''), (3, Note.D, 'h')]
+"""
+
+import re
+from os import PathLike
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple
+
+from music_theory.notes import Note, TRANSPOSE_TABLE
+
+if TYPE_CHECKING: # pragma: no cover
+    from music_theory.string_instrument import StringInstrument
+
+TECHNIQUES = {
+    '': "picked",
+    'h': "hammer-on",
+    'p': "pull-off",
+    '/': "slide up",
+    '\\': "slide down",
+    'x': "muted",
+}
+
+# A staff line is an optional string name (e.g. "e", "Eb") and a bar marker,
+# followed by a run of tab characters containing at least one dash. Words
+# such as "Verse-1" and dividers such as "-----" have no bar marker.
+_TAB_CHARS = r'[-0-9hpbrstvxX/\\~|:*()<>^=.]'
+_STAFF_LINE = re.compile(rf'\s*(?:[A-Ga-g][#b]?\s*)?[|:](?P<body>{_TAB_CHARS}*-{_TAB_CHARS}*)\s*$')
+
+# Group 1 is the technique before a fret, group 2 is the fret, a lone x is muted.
+_TAB_TOKEN = re.compile(r'([hp/\\]?)(\d+)|[xX]')
+
+#region TabEvent
+
+class TabEvent(NamedTuple):
+    """
+    A single note in a tab.
+
+    Attributes:
+        time (int):
+            The column the note starts at, counted from the start of the first
+            staff. Notes played together share the same time.
+        string_index (int):
+            The index of the string in the instrument's tuning (0 is the
+            lowest string).
+        fret (int | None):
+            The fret played, or None for a muted note.
+        note (Note | None):
+            The note sounded, or None for a muted note.
+        technique (str):
+            One of the keys of `TECHNIQUES`: '' for a picked note, 'h', 'p',
+            '/', '\\' or 'x'.
+    """
+    time: int
+    string_index: int
+    fret: int | None
+    note: Note | None
+    technique: str
+
+#endregion
+
+#region Functions
+
+def _staff_events(tuning: list[Note], bodies: list[str], offset: int, high_string_first: bool) -> list[TabEvent]:
+    """
+    Returns the events of one complete staff, ordered by time and then from
+    the lowest string up.
+    """
+    num_strings = len(tuning)
+    events = []
+    append = events.append
+    make = TabEvent._make
+
+    for line_index, body in enumerate(bodies):
+        string_index = num_strings - 1 - line_index if high_string_first else line_index
+        row = TRANSPOSE_TABLE[tuning[string_index].value]
+
+        for match in _TAB_TOKEN.finditer(body):
+            technique, fret = match.groups()
+
+            if fret is None:
+                append(make((offset + match.start(), string_index, None, None, 'x')))
+            else:
+                fret = int(fret)
+                append(make((offset + match.start(2), string_index, fret, row[fret % 12], technique)))
+
+    events.sort()
+    return events
+
+def parse_tab(instrument: "StringInstrument", source: str | Iterable[str], high_string_first: bool=True) -> Iterator[TabEvent]:
+    """
+    Parses ASCII tab into note events using an instrument's tuning, yielding
+    them lazily in time order.
+
+    Example:
+        >>> guitar = create_standard_guitar()
+        >>> [e.note for e in parse_tab(guitar, "e|-0-\\nB|-1-\\nG|-0-\\nD|-2-\\nA|-3-\\nE|---")]
+        [Note.C, Note.E, Note.G, Note.C, Note.E]
+
+    Args:
+        instrument (StringInstrument):
+            The instrument the tab is written for, one staff line is expected
+            per string.
+        source (str | Iterable[str]):
+            Either a string (which may span several lines) or an iterable of
+            lines, such as an open text file.
+        high_string_first (bool):
+            True if each staff lists the highest string first, which is the
+            usual way tab is written (default: `True`).
+
+    Returns:
+        Iterator[TabEvent]:
+    """
+    if isinstance(source, str):
+        source = source.splitlines()
+
+    tuning = list(instrument.tuning)
+    num_strings = len(tuning)
+    match_staff_line = _STAFF_LINE.match
+
+    bodies = []
+    offset = 0
+
+    for line in source:
+        match = match_staff_line(line)
+
+        if match is None:
+            # A staff interrupted by other text is incomplete, so discard it
+            bodies.clear()
+            continue
+
+        bodies.append(match.group('body'))
+
+        if len(bodies) == num_strings:
+            yield from _staff_events(tuning, bodies, offset, high_string_first)
+            offset += max(map(len, bodies))
+            bodies.clear()
+
+def parse_tab_file(instrument: "StringInstrument", path: str | PathLike, encoding: str="utf-8", high_string_first: bool=True) -> Iterator[TabEvent]:
+    """
+    Parses an ASCII tab file into note events, reading it one line at a time.
+
+    Args:
+        instrument (StringInstrument):
+            The instrument the tab is written for.
+        path (str | PathLike):
+            The file to read.
+        encoding (str):
+            The file's text encoding (default: `"utf-8"`).
+        high_string_first (bool):
+            True if each staff lists the highest string first (default: `True`).
+
+    Returns:
+        Iterator[TabEvent]:
+    """
+    with open(path, encoding=encoding) as f:
+        yield from parse_tab(instrument, f, high_string_first)
+
+#endregion
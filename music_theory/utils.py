@@ -7,10 +7,13 @@ octave-equivalent and reduced modulo 12, preserving directional intent.
 Constants:
     UP_DIRECTIONS:    Aliases for upward movement.
     DOWN_DIRECTIONS:  Aliases for downward movement.
+    DIRECTION_SIGNS:  Maps every direction alias to +1 (up) or -1 (down).
 
 Functions:
     index_to_range(index: int) -> int:
         Normalizes an integer index to the range -11 to +11, preserving sign.
+    direction_sign(direction: str) -> int:
+        Resolves a direction alias (in any case) to +1 or -1.
     list_rotations(seq: Sequence[T]) -> list[list[T]]:
         Return all cyclic rotations of a sequence.
     is_valid_note_str(note_str: str) -> bool:
@@ -27,6 +30,13 @@ T = TypeVar("T")
 UP_DIRECTIONS = ["u", "up", "above"]
 DOWN_DIRECTIONS = ["d", "down", "below"]
 
+NOTE_STR_PATTERN = re.compile(r'^[a-gA-G](?:#{1,2}|b{1,2})?$', re.ASCII)
+
+DIRECTION_SIGNS: dict[str, int] = {
+    **{d: 1 for d in UP_DIRECTIONS},
+    **{d: -1 for d in DOWN_DIRECTIONS},
+}
+
 def index_to_range(index: int) -> int:
     """ 
     Converts an index into the range -11 to +11 (+ or - Interval or Note). 
@@ -50,6 +60,41 @@ def index_to_range(index: int) -> int:
     return sign * index
 
 
+def direction_sign(direction: str) -> int:
+    """
+    Resolves a direction alias into a sign, +1 for up and -1 for down.
+
+    Lower case aliases are found with a single dict lookup, any other casing
+    is lowered first.
+
+    Example:
+        >>> direction_sign("Down")
+        -1
+
+    Args:
+        direction (str):
+            "u", "up", "above", "d", "down" or "below" in any case.
+
+    Raises:
+        ValueError:
+            If the direction string is not recognized.
+
+    Returns:
+        int:
+            1 for an upward direction, -1 for a downward one.
+    """
+    sign = DIRECTION_SIGNS.get(direction)
+
+    if sign is None:
+        direction = direction.lower()
+        sign = DIRECTION_SIGNS.get(direction)
+
+        if sign is None:
+            raise ValueError(f'direction not recognized({direction})')
+
+    return sign
+
+
 def list_rotations(seq: Sequence[T]) -> list[list[T]]:
     """
     Return all cyclic rotations of a sequence.
@@ -105,9 +150,7 @@ def is_valid_note_str(note_str: str) -> bool:
     Returns:
         bool:
     """
-    pattern = re.compile(r'^[a-gA-G](?:#{1,2}|b{1,2})?$', re.ASCII)
-
-    return bool(pattern.match(note_str))
+    return bool(NOTE_STR_PATTERN.match(note_str))
 
 def is_empty_or_whitespace(s: str) -> bool:
     """
@@ -0,0 +1,200 @@
+"""
+This module provides a search engine for chord voicings (fingerings) on any
+tuned string instrument.
+
+Description:
+    A voicing is a tuple with one entry per string (lowest string first)
+    holding either the fret played or None for a muted string, so
+    `(None, 3, 2, 0, 1, 0)` is the open C major shape written "x 3 2 0 1 0".
+
+    The search walks the strings from lowest to highest and only considers
+    frets that sound a note of the chord, taken from the instrument's
+    fretboard index. Branches are cut as soon as the fretted notes span too
+    many frets, the bass note is wrong, or the remaining strings can no
+    longer sound every note of the chord. Results are cached per tuning and
+    set of constraints, so building voicing libraries for many instruments
+    that share a tuning only searches each one once.
+
+Functions:
+    find_voicings(instrument, chord, max_span=3, max_fret=12, bass=None, allow_muted=True) -> tuple[Voicing, ...]:
+        Returns every playable voicing of a chord that meets the constraints.
+    voicing_to_string(voicing) -> str:
+        Returns a voicing in the "x 3 2 0 1 0" format used by `notes_in_chord`.
+
+Example:
+    >>> guitar = create_standard_guitar()
+    >>> (None, 3, 2, 0, 1, 0) in find_voicings(guitar, Chord(Note.C), max_fret=3)
+    True
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+from music_theory.chords import Chord
+from music_theory.fretboard import fretboard_for
+from music_theory.notes import Note
+from music_theory.pitch_class_set import PitchClassSet
+
+if TYPE_CHECKING: # pragma: no cover
+    from music_theory.string_instrument import StringInstrument
+
+Voicing = tuple[int | None, ...]
+
+#region Functions
+
+def _as_mask(chord: Chord | PitchClassSet | Iterable[Note]) -> int:
+    """
+    Returns the 12-bit pitch class mask of a chord, set or collection of notes.
+    """
+    if isinstance(chord, Chord):
+        return chord.pitch_classes.mask
+
+    if isinstance(chord, PitchClassSet):
+        return chord.mask
+
+    return PitchClassSet(chord).mask
+
+@lru_cache(maxsize=4096)
+def _search(tuning: tuple[Note, ...], mask: int, max_span: int, max_fret: int, bass: int | None, allow_muted: bool) -> tuple[Voicing, ...]:
+    """
+    Finds every voicing for a tuning and set of constraints, see
+    `find_voicings`. Note values are used for the mask and bass so the
+    arguments are cheap to hash.
+    """
+    board = fretboard_for(tuning, max_fret)
+    num_strings = len(tuning)
+
+    # candidates[s] is every (fret, note bit) on string s that sounds a chord
+    # note, reachable[s] is the mask of notes strings s and above can sound
+    candidates = []
+
+    for string_index, row in enumerate(board.notes):
+        candidates.append(tuple(
+            (fret, 1 << note.value) for fret, note in enumerate(row) if mask >> note.value & 1
+        ))
+
+    reachable = [0] * (num_strings + 1)
+
+    for string_index in range(num_strings - 1, -1, -1):
+        string_mask = 0
+
+        for _, bit in candidates[string_index]:
+            string_mask |= bit
+
+        reachable[string_index] = reachable[string_index + 1] | string_mask
+
+    bass_bit = None if bass is None else 1 << bass
+    results = []
+    frets: list[int | None] = []
+
+    def search(string_index: int, covered: int, low: int, high: int, sounded: bool) -> None:
+        if string_index == num_strings:
+            if covered == mask:
+                results.append(tuple(frets))
+            return
+
+        # Every note still missing must be playable on the strings left
+        missing = mask & ~covered
+
+        if missing & ~reachable[string_index] or missing.bit_count() > num_strings - string_index:
+            return
+
+        for fret, bit in candidates[string_index]:
+            if not sounded and bass_bit is not None and bit != bass_bit:
+                continue
+
+            if fret:
+                # Frets are ascending, so once one is too far above the
+                # lowest fretted note every later one is too
+                if fret - low > max_span:
+                    break
+
+                if high - fret > max_span:
+                    continue
+
+                new_low, new_high = min(low, fret), max(high, fret)
+            else:
+                new_low, new_high = low, high
+
+            frets.append(fret)
+            search(string_index + 1, covered | bit, new_low, new_high, True)
+            frets.pop()
+
+        if allow_muted:
+            frets.append(None)
+            search(string_index + 1, covered, low, high, sounded)
+            frets.pop()
+
+    search(0, 0, max_fret + 1, -1, False)
+    return tuple(results)
+
+def find_voicings(instrument: "StringInstrument", chord: Chord | PitchClassSet | Iterable[Note], max_span: int=3,
+                  max_fret: int=12, bass: Note | None=None, allow_muted: bool=True) -> tuple[Voicing, ...]:
+    """
+    Returns every playable voicing of a chord on an instrument. A voicing
+    must sound every note of the chord and no other notes.
+
+    Example:
+        >>> voicings = find_voicings(create_standard_guitar(), Chord(Note.G), bass=Note.G, max_fret=3)
+        >>> (3, 2, 0, 0, 0, 3) in voicings
+        True
+
+    Args:
+        instrument (StringInstrument):
+            The instrument to play the chord on.
+        chord (Chord | PitchClassSet | Iterable[Note]):
+            The chord, or any collection of notes, to voice.
+        max_span (int):
+            The largest allowed distance between the lowest and highest
+            fretted (non-open) frets (default: `3`).
+        max_fret (int):
+            The highest fret that can be used (default: `12`).
+        bass (Note | None):
+            If given, the lowest sounding string must play this note
+            (default: `None`).
+        allow_muted (bool):
+            If False every string must be played (default: `True`).
+
+    Raises:
+        ValueError:
+            - If `max_span` or `max_fret` is negative.
+            - If the chord has no notes.
+
+    Returns:
+        tuple[Voicing, ...]:
+            The voicings, each a tuple of frets (None for a muted string)
+            ordered from the lowest string.
+    """
+    if max_span < 0:
+        raise ValueError(f"Fret span can't be negative: {max_span}")
+
+    if max_fret < 0:
+        raise ValueError(f"Frets can't be negative: {max_fret}")
+
+    mask = _as_mask(chord)
+
+    if mask == 0:
+        raise ValueError("Chord must contain at least one note")
+
+    return _search(tuple(instrument.tuning), mask, max_span, max_fret,
+                   None if bass is None else bass.value, allow_muted)
+
+def voicing_to_string(voicing: Voicing) -> str:
+    """
+    Returns a voicing as a string of frets, with muted strings as "x". This is
+    the format accepted by `StringInstrument.notes_in_chord`.
+
+    Example:
+        >>> voicing_to_string((None, 3, 2, 0, 1, 0))
+        x 3 2 0 1 0
+
+    Args:
+        voicing (Voicing):
+            The voicing to format.
+
+    Returns:
+        str:
+    """
+    return " ".join("x" if fret is None else str(fret) for fret in voicing)
+
+#endregion
@@ -0,0 +1,138 @@
+import io
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from music_theory.analysis import CorpusStats, Shard, analyze, analyze_shard, main, make_shards
+from music_theory.chord_type import ChordType
+from music_theory.corpus import write_corpus
+from music_theory.key_type import KeyType
+from music_theory.keys import Key
+from music_theory.notes import Note
+
+CHARTS = """\
+CM Am FM G7 CM
+# a comment
+
+C E G C D E F G
+Am Dm E7 Am
+C H G
+Gmaj GM Em Cmaj Dsus4 D7
+"""
+
+
+class AnalysisTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.text = os.path.join(self.tmp.name, "charts.txt")
+        self.corpus = os.path.join(self.tmp.name, "songs.mtc")
+
+        with open(self.text, "w", encoding="utf-8") as f:
+            f.write(CHARTS)
+
+        write_corpus(self.corpus, ["C E G C", "A C E A B", "", "F# A# C# F#"])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+class TestAnalyzeShard(AnalysisTestCase):
+    def test_text(self):
+        stats = analyze_shard(Shard(self.text, 0, os.path.getsize(self.text), False))
+
+        self.assertEqual((stats.songs, stats.note_songs, stats.chord_songs, stats.invalid), (4, 1, 3, 1))
+        self.assertEqual(stats.top_keys(), [(Key(Note.C), 2), (Key(Note.G), 1), (Key(Note.A, KeyType.Minor), 1)])
+
+    def test_numerals_are_relative_to_the_key(self):
+        stats = analyze_shard(Shard(self.text, 0, os.path.getsize(self.text), False))
+
+        self.assertEqual(stats.numerals["I"], 4)
+        self.assertEqual(stats.numerals["V7/I"], 2)
+        self.assertEqual(stats.transitions["vi-IV"], 2)
+        self.assertEqual(stats.chord_types[ChordType.Dominant7.value], 3)
+
+    def test_bare_roots_in_a_chart_are_major_chords(self):
+        path = os.path.join(self.tmp.name, "bare.txt")
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("C Am F G\nC E G\n")
+
+        stats = analyze_shard(Shard(path, 0, os.path.getsize(path), False))
+
+        self.assertEqual((stats.note_songs, stats.chord_songs, stats.invalid), (1, 1, 0))
+        self.assertEqual(stats.transitions["vi-IV"], 1)
+        self.assertEqual(stats.chord_types[ChordType.Major.value], 3)
+
+    def test_corpus(self):
+        stats = analyze_shard(Shard(self.corpus, 0, 4, True))
+
+        self.assertEqual((stats.songs, stats.note_songs), (4, 4))
+        self.assertEqual(sum(stats.pitch_classes), 13)
+        self.assertEqual(sum(stats.keys), 3)
+
+
+class TestShards(AnalysisTestCase):
+    def test_text_shards_cover_the_file(self):
+        shards = make_shards([self.text], shard_bytes=10)
+
+        self.assertEqual(shards[0].start, 0)
+        self.assertEqual(shards[-1].stop, os.path.getsize(self.text))
+        self.assertTrue(all(a.stop == b.start for a, b in zip(shards, shards[1:])))
+
+    def test_every_shard_size_gives_the_same_stats(self):
+        expected = analyze([self.text, self.corpus], workers=1)
+
+        for shard_bytes in (1, 2, 7, 16, 1000):
+            self.assertEqual(analyze([self.text, self.corpus], workers=1, shard_bytes=shard_bytes), expected, shard_bytes)
+
+    def test_corpus_shards(self):
+        self.assertEqual(make_shards([self.corpus], shard_bytes=4), [
+            Shard(self.corpus, 0, 2, True), Shard(self.corpus, 2, 4, True),
+        ])
+
+    def test_invalid_shard_size(self):
+        self.assertRaises(ValueError, make_shards, [self.text], 0)
+
+
+class TestAnalyze(AnalysisTestCase):
+    def test_workers_give_the_same_stats(self):
+        serial = analyze([self.text, self.corpus], workers=1, shard_bytes=8)
+        parallel = analyze([self.text, self.corpus], workers=2, shard_bytes=8)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(parallel.to_dict(), serial.to_dict())
+
+    def test_invalid_workers(self):
+        self.assertRaises(ValueError, analyze, [self.text], 0)
+
+    def test_stats_pickle_compactly(self):
+        stats = analyze([self.text], workers=1)
+        data = pickle.dumps(stats)
+
+        self.assertEqual(pickle.loads(data), stats)
+        self.assertNotIn(b"Chord", data)
+
+    def test_merge(self):
+        total = CorpusStats()
+        total.merge(analyze([self.text], workers=1))
+        total.merge(analyze([self.corpus], workers=1))
+
+        self.assertEqual(total, analyze([self.text, self.corpus], workers=1))
+
+    def test_main_json(self):
+        out = io.StringIO()
+
+        with redirect_stdout(out):
+            self.assertEqual(main([self.text, "-j", "1", "--json"]), 0)
+
+        document = json.loads(out.getvalue())
+
+        self.assertEqual(document["songs"], 4)
+        self.assertEqual(document["keys"]["C Major"], 2)
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from music_theory import batch
+from music_theory.notes import Note, transpose
+from music_theory.intervals import Interval, interval_distance
+
+
+class TestBatchConversion(unittest.TestCase):
+    def test_from_notes(self):
+        result = list(batch.from_notes([Note.C, Note.Bb, Note.B]))
+        expected = [0, 10, 11]
+
+        self.assertEqual(result, expected)
+
+    def test_to_notes(self):
+        result = batch.to_notes([0, 10, batch.INVALID], error='X')
+        expected = [Note.C, Note.Bb, 'X']
+
+        self.assertEqual(result, expected)
+
+    def test_round_trip(self):
+        notes = [Note.random() for _ in range(100)]
+
+        self.assertEqual(batch.to_notes(batch.from_notes(notes)), notes)
+
+
+class TestBatchTranspose(unittest.TestCase):
+    def test_transpose_matches_scalar(self):
+        notes = Note.items()
+
+        for interval in Interval:
+            for direction in ["u", "Down"]:
+                result = batch.to_notes(batch.transpose(batch.from_notes(notes), interval, direction))
+                expected = [transpose(n, interval, direction) for n in notes]
+
+                self.assertEqual(result, expected)
+
+    def test_transpose_keeps_invalid(self):
+        result = list(batch.transpose([11, batch.INVALID], Interval.m2))
+        expected = [0, batch.INVALID]
+
+        self.assertEqual(result, expected)
+
+    def test_transpose_empty(self):
+        self.assertEqual(len(batch.transpose([], Interval.P5)), 0)
+
+    def test_transpose_direction_error(self):
+        self.assertRaises(ValueError, batch.transpose, [0], Interval.P5, "sideways")
+
+
+class TestBatchIntervalDistance(unittest.TestCase):
+    def test_interval_distance_matches_scalar(self):
+        rng = random.Random(0)
+        first = [rng.choice(list(Note)) for _ in range(500)]
+        second = [rng.choice(list(Note)) for _ in range(500)]
+
+        for direction in ["up", "d"]:
+            result = list(batch.interval_distance(batch.from_notes(first), batch.from_notes(second), direction))
+            expected = [interval_distance(a, b, direction).value for a, b in zip(first, second)]
+
+            self.assertEqual(result, expected)
+
+    def test_interval_distance_keeps_invalid(self):
+        result = list(batch.interval_distance([0, batch.INVALID], [7, 0]))
+        expected = [7, batch.INVALID]
+
+        self.assertEqual(result, expected)
+
+    def test_interval_distance_length_mismatch(self):
+        self.assertRaises(ValueError, batch.interval_distance, [0, 1], [0])
+
+    def test_interval_distance_direction_error(self):
+        self.assertRaises(ValueError, batch.interval_distance, [0], [0], "sideways")
+
+
+class TestBatchParseNotes(unittest.TestCase):
+    def test_parse_notes_matches_from_string(self):
+        tokens = ["C", "c#", "Dbb", "b##", "bb", "H", "DBB", "", " C", "A~"]
+
+        result = batch.to_notes(batch.parse_notes(tokens))
+        expected = [Note.from_string(t) for t in tokens]
+
+        self.assertEqual(result, expected)
+
+    def test_parse_notes_from_whitespace_string(self):
+        result = list(batch.parse_notes("C  E\tG\nBb"))
+        expected = [0, 4, 7, 10]
+
+        self.assertEqual(result, expected)
+
+    def test_parse_notes_empty(self):
+        self.assertEqual(len(batch.parse_notes("   ")), 0)
+
+
+@unittest.skipUnless(batch.HAS_NUMPY, "NumPy is not installed")
+class TestBatchNumpy(unittest.TestCase):
+    def test_results_are_numpy_arrays(self):
+        import numpy as np
+
+        result = batch.transpose(np.array([0, 4, 7]), Interval.P5)
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.dtype, np.uint8)
+        self.assertEqual(result.tolist(), [7, 11, 2])
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -0,0 +1,89 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from music_theory.bench import CASES, Result, generate_workload, main, run_case, run_suite
+from music_theory.notes import Note
+
+
+class TestGenerateWorkload(unittest.TestCase):
+    def test_size(self):
+        workload = generate_workload(25)
+
+        for field in workload._fields[2:]:
+            self.assertEqual(len(getattr(workload, field)), 25, field)
+
+    def test_same_seed_same_workload(self):
+        self.assertEqual(generate_workload(50, seed=3), generate_workload(50, seed=3))
+        self.assertNotEqual(generate_workload(50, seed=3), generate_workload(50, seed=4))
+
+    def test_includes_invalid_note_strings(self):
+        parsed = [Note.from_string(s) for s in generate_workload(500).note_strings]
+
+        self.assertIn(None, parsed)
+        self.assertGreater(sum(note is not None for note in parsed), 400)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, generate_workload, 0)
+
+
+class TestRunCase(unittest.TestCase):
+    def setUp(self):
+        self.workload = generate_workload(20)
+
+    def test_every_case_runs(self):
+        for name in CASES:
+            result = run_case(name, self.workload, runs=2, warmup=1)
+
+            self.assertEqual(result.ops, 20, name)
+            self.assertGreater(result.ops_per_sec, 0, name)
+            self.assertLessEqual(result.p50_ns, result.p99_ns, name)
+
+    def test_unknown_case(self):
+        self.assertRaises(ValueError, run_case, "nope", self.workload)
+
+    def test_invalid_runs(self):
+        self.assertRaises(ValueError, run_case, "transpose", self.workload, runs=0)
+
+    def test_run_suite_keeps_order(self):
+        results = run_suite(["Chord", "transpose"], size=5, runs=1, warmup=0)
+
+        self.assertEqual([r.name for r in results], ["Chord", "transpose"])
+
+
+class TestMain(unittest.TestCase):
+    def test_json_to_stdout(self):
+        out = io.StringIO()
+
+        with redirect_stdout(out):
+            self.assertEqual(main(["Scale", "-n", "5", "-r", "2", "--json"]), 0)
+
+        document = json.loads(out.getvalue())
+
+        self.assertEqual(document["workload"], {"size": 5, "runs": 2, "warmup": 3, "seed": 0})
+        self.assertEqual([b["name"] for b in document["benchmarks"]], ["Scale"])
+        self.assertEqual(set(document["benchmarks"][0]), set(Result._fields))
+
+    def test_json_to_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            main(["-n", "5", "-r", "1", "--json", path, "transpose", "Chord"])
+
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(json.load(f)["benchmarks"]), 2)
+
+    def test_table(self):
+        out = io.StringIO()
+
+        with redirect_stdout(out):
+            main(["-n", "5", "-r", "1", "Key.chords"])
+
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+        self.assertIn("Key.chords", out.getvalue())
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
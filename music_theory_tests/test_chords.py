@@ -1,7 +1,9 @@
+import pickle
 import unittest
 
 from music_theory.notes import Note
-from music_theory.chords import Chord, ChordType, unique_notes_in_chords
+from music_theory.chords import Chord, ChordType, ChordMatch, unique_notes_in_chords, identify_chord, chords_from_pitch_classes
+from music_theory.pitch_class_set import PitchClassSet
 
 
 class TestChordValidity(unittest.TestCase):
@@ -27,6 +29,45 @@ class TestChordValidity(unittest.TestCase):
         self.assertIn(chord.root, list(Note))
         self.assertIn(chord.chord_type, list(ChordType))
 
+    def test_chord_invalid_root(self):
+        with self.assertRaises(ValueError):
+            Chord("A", ChordType.Major)
+
+class TestChordFlyweight(unittest.TestCase):
+    def test_same_root_and_type_is_same_instance(self):
+        self.assertIs(Chord(Note.Eb, ChordType.Sus2), Chord(Note.Eb, ChordType.Sus2))
+
+    def test_default_chord_type_is_shared(self):
+        self.assertIs(Chord(Note.Eb), Chord(Note.Eb, ChordType.Major))
+
+    def test_chords_are_hashable(self):
+        chords = {Chord(Note.C), Chord(Note.C), Chord(Note.C, ChordType.Minor)}
+
+        self.assertEqual(len(chords), 2)
+
+    def test_chords_are_immutable(self):
+        chord = Chord(Note.C)
+
+        with self.assertRaises(AttributeError):
+            chord.root = Note.D
+
+        with self.assertRaises(AttributeError):
+            del chord.notes
+
+    def test_chord_notes_are_a_tuple(self):
+        self.assertIsInstance(Chord(Note.C).notes, tuple)
+
+    def test_extensions_do_not_change_notes(self):
+        chord = Chord(Note.A, ChordType.Major)
+        chord.add9().append(Note.C)
+
+        self.assertSequenceEqual(chord.notes, [Note.A, Note.Db, Note.E])
+
+    def test_pickle_returns_shared_chord(self):
+        chord = Chord(Note.Ab, ChordType.Minor7)
+
+        self.assertIs(pickle.loads(pickle.dumps(chord)), chord)
+
 class TestChordEquality(unittest.TestCase):
     def test_chord_equal_A_major(self):
         self.assertEqual(Chord(Note.B, ChordType.Major), Chord(Note.B, ChordType.Major))
@@ -48,47 +89,47 @@ class TestChordNotes(unittest.TestCase):
     def test_chord_notes_A_major(self):
         chord = Chord(Note.A, ChordType.Major)
         expected_notes = [Note.A, Note.Db, Note.E]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
     
     def test_chord_notes_for_A_minor(self):
         chord = Chord(Note.A, ChordType.Minor)
         expected_notes = [Note.A, Note.C, Note.E]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
     def test_chord_notes_for_A_diminished(self):
         chord = Chord(Note.A, ChordType.Diminished)
         expected_notes = [Note.A, Note.C, Note.Eb] 
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
     def test_chord_notes_for_A_dominant_seven(self):
         chord = Chord(Note.A, ChordType.Dominant7)
         expected_notes = [Note.A, Note.Db, Note.E, Note.G]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
     def test_chord_notes_for_A_major_seven(self):
         chord = Chord(Note.A, ChordType.Major7)
         expected_notes = [Note.A, Note.Db, Note.E, Note.Ab]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
     def test_chord_notes_for_A_minor_seven(self):
         chord = Chord(Note.A, ChordType.Minor7)
         expected_notes = [Note.A, Note.C, Note.E, Note.G]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
     def test_chord_notes_for_A_diminished_seven(self):
         chord = Chord(Note.A, ChordType.Diminished7)
         expected_notes = [Note.A, Note.C, Note.Eb, Note.Gb]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
     def test_chord_notes_for_A_sus2(self):
         chord = Chord(Note.A, ChordType.Sus2)
         expected_notes = [Note.A, Note.B, Note.E]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
     def test_chord_notes_for_A_sus4(self):
         chord = Chord(Note.A, ChordType.Sus4)
         expected_notes = [Note.A, Note.D, Note.E]
-        self.assertEqual(chord.notes, expected_notes)
+        self.assertSequenceEqual(chord.notes, expected_notes)
 
 class TestChordExtensions(unittest.TestCase):
     def test_chord_A_major_add9(self):
@@ -198,5 +239,52 @@ class TestUniqueNotesInChord(unittest.TestCase):
         expected = [Note.C, Note.Db, Note.E, Note.A]
         self.assertEqual(result, expected)
 
+class TestIdentifyChord(unittest.TestCase):
+    def test_first_inversion(self):
+        result = identify_chord([Note.E, Note.G, Note.C])
+        self.assertEqual(result, (ChordMatch(Chord(Note.C), 1),))
+
+    def test_root_position(self):
+        result = identify_chord([Note.A, Note.C, Note.E, Note.G])
+        self.assertEqual(result, (ChordMatch(Chord(Note.A, ChordType.Minor7), 0),))
+
+    def test_order_and_duplicates_above_bass_ignored(self):
+        result = identify_chord([Note.G, Note.E, Note.C, Note.E, Note.G])
+        self.assertEqual(result, (ChordMatch(Chord(Note.C), 2),))
+
+    def test_root_position_listed_first(self):
+        result = identify_chord([Note.C, Note.D, Note.G])
+        expected = (ChordMatch(Chord(Note.C, ChordType.Sus2), 0), ChordMatch(Chord(Note.G, ChordType.Sus4), 1))
+
+        self.assertEqual(result, expected)
+
+    def test_every_chord_and_inversion(self):
+        for root in Note:
+            for chord_type in ChordType:
+                chord = Chord(root, chord_type)
+
+                for inversion, notes in enumerate([list(chord.notes), *chord.inversions()]):
+                    self.assertIn(ChordMatch(chord, inversion), identify_chord(notes))
+
+    def test_no_match(self):
+        self.assertEqual(identify_chord([Note.C, Note.Db, Note.D]), ())
+        self.assertEqual(identify_chord([]), ())
+
+    def test_returns_shared_result(self):
+        self.assertIs(identify_chord([Note.E, Note.G, Note.C]), identify_chord([Note.E, Note.C, Note.G]))
+
+
+class TestChordsFromPitchClasses(unittest.TestCase):
+    def test_single_match(self):
+        result = chords_from_pitch_classes(PitchClassSet([Note.G, Note.C, Note.E]))
+        self.assertEqual(result, (Chord(Note.C),))
+
+    def test_symmetric_chord(self):
+        result = chords_from_pitch_classes(Chord(Note.C, ChordType.Diminished7).pitch_classes)
+        self.assertEqual({c.root for c in result}, {Note.C, Note.Eb, Note.Gb, Note.A})
+
+    def test_no_match(self):
+        self.assertEqual(chords_from_pitch_classes(PitchClassSet()), ())
+
 if __name__ == '__main__': # pragma: no cover
     unittest.main()
\ No newline at end of file
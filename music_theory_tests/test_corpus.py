@@ -0,0 +1,164 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from music_theory.corpus import CHUNK_SIZE, Corpus, CorpusWriter, write_corpus
+from music_theory.intervals import Interval
+from music_theory.key_detection import detect_key
+from music_theory.key_type import KeyType
+from music_theory.keys import Key
+from music_theory.note_sequence import NoteSequence
+from music_theory.notes import Note, notes_from_string
+from music_theory.scales import scales_containing
+
+SONGS = ["C E G C D", "A C E A B", "", "F# A# C#"]
+
+
+class CorpusTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "songs.mtc")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+class TestCorpusWriter(CorpusTestCase):
+    def test_write_corpus_returns_song_count(self):
+        self.assertEqual(write_corpus(self.path, SONGS), 4)
+
+    def test_file_size(self):
+        write_corpus(self.path, SONGS)
+
+        # 24 byte header, 13 notes padded to 16, 5 offsets
+        self.assertEqual(os.path.getsize(self.path), 24 + 16 + 5 * 8)
+
+    def test_accepts_every_song_type(self):
+        with CorpusWriter(self.path) as writer:
+            writer.add_song("C D")
+            writer.add_song(notes_from_string("E F"))
+            writer.add_song(iter([Note.G, Note.A]))
+            writer.add_song(NoteSequence([Note.B]))
+
+        with Corpus(self.path) as corpus:
+            self.assertEqual([str(song) for song in corpus], ["C, D", "E, F", "G, A", "B"])
+
+    def test_long_song_is_written_in_chunks(self):
+        write_corpus(self.path, [[Note.Eb] * (CHUNK_SIZE * 2 + 3)])
+
+        with Corpus(self.path) as corpus:
+            self.assertEqual(corpus.song_histogram(0)[Note.Eb.value], CHUNK_SIZE * 2 + 3)
+
+    def test_invalid_song_is_not_written(self):
+        with CorpusWriter(self.path) as writer:
+            writer.add_song("C D")
+            self.assertRaises(ValueError, writer.add_song, "C H")
+            self.assertRaises(ValueError, writer.add_song, ["C"])
+            writer.add_song("E")
+
+        with Corpus(self.path) as corpus:
+            self.assertEqual([str(song) for song in corpus], ["C, D", "E"])
+
+    def test_closed_writer(self):
+        writer = CorpusWriter(self.path)
+        writer.close()
+        writer.close()
+
+        self.assertRaises(ValueError, writer.add_song, "C")
+
+
+class TestCorpusReader(CorpusTestCase):
+    def setUp(self):
+        super().setUp()
+        write_corpus(self.path, SONGS)
+        self.corpus = Corpus(self.path)
+
+    def tearDown(self):
+        self.corpus.close()
+        super().tearDown()
+
+    def test_songs(self):
+        self.assertEqual(len(self.corpus), 4)
+        self.assertEqual(self.corpus.note_count, 13)
+        self.assertEqual(self.corpus[1].to_notes(), notes_from_string("A C E A B"))
+        self.assertEqual(len(self.corpus[2]), 0)
+        self.assertEqual(self.corpus[-1], NoteSequence.from_string("F# A# C#"))
+
+    def test_index_out_of_range(self):
+        self.assertRaises(IndexError, self.corpus.__getitem__, 4)
+        self.assertRaises(IndexError, self.corpus.__getitem__, -5)
+
+    def test_songs_view_the_mapped_file(self):
+        song = self.corpus[0]
+
+        self.assertIs(song.view.obj, self.corpus.notes.obj)
+        del song
+
+    def test_close_with_songs_in_use(self):
+        song = self.corpus[0]
+
+        self.assertRaises(BufferError, self.corpus.close)
+        del song
+
+    def test_transpose_song(self):
+        self.assertEqual(str(self.corpus[3].transpose(Interval.m2)), "G, B, D")
+
+    def test_histograms(self):
+        self.assertEqual(self.corpus.song_histogram(0), [2, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0])
+        self.assertEqual(sum(self.corpus.histogram()), 13)
+
+    def test_detect_keys_match_detect_key(self):
+        expected = [detect_key(notes_from_string(song)) if song else None for song in SONGS]
+
+        self.assertEqual(list(self.corpus.detect_keys()), expected)
+
+    def test_detect_key(self):
+        self.assertEqual(self.corpus.detect_key(1), Key(Note.A, KeyType.Minor))
+        self.assertIsNone(self.corpus.detect_key(2))
+
+    def test_pitch_classes_for_scale_search(self):
+        pcs = self.corpus.pitch_classes(3)
+
+        self.assertEqual(pcs.to_notes(), [Note.Db, Note.Gb, Note.Bb])
+        self.assertEqual(scales_containing(pcs), scales_containing([Note.Gb, Note.Bb, Note.Db]))
+
+
+class TestCorpusValidation(CorpusTestCase):
+    def write(self, data):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def test_empty_file(self):
+        self.write(b"")
+        self.assertRaises(ValueError, Corpus, self.path)
+
+    def test_wrong_magic(self):
+        self.write(b"x" * 40)
+        self.assertRaises(ValueError, Corpus, self.path)
+
+    def test_wrong_version(self):
+        self.write(struct.pack("<4sHHQQ", b"MTCP", 99, 0, 0, 0) + bytes(8))
+        self.assertRaises(ValueError, Corpus, self.path)
+
+    def test_truncated(self):
+        write_corpus(self.path, SONGS)
+
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 8)
+
+        self.assertRaises(ValueError, Corpus, self.path)
+
+    def test_invalid_note_byte(self):
+        write_corpus(self.path, SONGS)
+
+        with open(self.path, "r+b") as f:
+            f.seek(24)
+            f.write(b"\x0c")
+
+        self.assertRaises(ValueError, Corpus, self.path)
+        Corpus(self.path, validate=False).close()
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
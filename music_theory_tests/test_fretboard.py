@@ -0,0 +1,74 @@
+import unittest
+
+from music_theory.notes import Note
+from music_theory.chords import Chord
+from music_theory.fretboard import Fretboard, fretboard_for
+from music_theory.string_instrument import note_at_fret
+
+STANDARD = (Note.E, Note.A, Note.D, Note.G, Note.B, Note.E)
+
+
+class TestFretboardCreation(unittest.TestCase):
+    def test_matrix_shape(self):
+        board = Fretboard(STANDARD, 12)
+
+        self.assertEqual(len(board.notes), 6)
+        self.assertTrue(all(len(row) == 13 for row in board.notes))
+        self.assertEqual(len(board.pitch_classes), 6 * 13)
+
+    def test_matrix_matches_note_at_fret(self):
+        board = Fretboard(STANDARD)
+
+        for string_index, string in enumerate(STANDARD):
+            for fret in range(25):
+                self.assertEqual(board.note_at(string_index, fret), note_at_fret(string, fret))
+                self.assertEqual(board.pitch_classes[string_index * 25 + fret], note_at_fret(string, fret).value)
+
+    def test_negative_frets(self):
+        self.assertRaises(ValueError, Fretboard, STANDARD, -1)
+
+    def test_fretboard_for_is_shared(self):
+        self.assertIs(fretboard_for(STANDARD, 12), fretboard_for(STANDARD, 12))
+        self.assertIsNot(fretboard_for(STANDARD, 12), fretboard_for(STANDARD, 15))
+
+    def test_repr(self):
+        self.assertEqual(repr(Fretboard((Note.E, Note.A), 12)), "Fretboard([E, A], 12)")
+
+
+class TestFretboardPositions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.board = Fretboard(STANDARD, 12)
+
+    def test_positions_of_note(self):
+        expected = ((0, 11), (1, 6), (2, 1), (3, 8), (4, 4), (5, 11))
+        self.assertEqual(self.board.positions_of(Note.Eb), expected)
+
+    def test_positions_of_open_string_note(self):
+        positions = self.board.positions_of(Note.E)
+
+        self.assertIn((0, 0), positions)
+        self.assertIn((0, 12), positions)
+        self.assertIn((5, 0), positions)
+
+    def test_positions_cover_every_fret_once(self):
+        positions = [p for note in Note for p in self.board.positions_of(note)]
+
+        self.assertEqual(len(positions), 6 * 13)
+        self.assertEqual(len(set(positions)), 6 * 13)
+
+    def test_positions_of_pitch_class_set(self):
+        chord = Chord(Note.C).pitch_classes
+        positions = self.board.positions_of(chord)
+        expected = sorted(p for note in chord for p in self.board.positions_of(note))
+
+        self.assertEqual(list(positions), expected)
+        self.assertEqual(positions[:3], ((0, 0), (0, 3), (0, 8)))
+
+    def test_positions_of_pitch_class_set_is_cached(self):
+        chord = Chord(Note.A).pitch_classes
+        self.assertIs(self.board.positions_of(chord), self.board.positions_of(chord))
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
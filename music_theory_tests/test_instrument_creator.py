@@ -1,5 +1,9 @@
+import os
+import subprocess
+import sys
 import unittest
 
+from music_theory import instrument_creator
 from music_theory.notes import Note
 from music_theory.instrument_creator import create_standard_bass, create_drop_bass, create_standard_guitar, create_drop_guitar, create_ukulele
 
@@ -72,5 +76,40 @@ class TestOtherInstruments(unittest.TestCase):
         expected = [Note.G, Note.C, Note.E, Note.A]
         self.assertEqual(ukelele.tuning, expected)
 
+class TestPresets(unittest.TestCase):
+    def test_preset_is_built_once(self):
+        self.assertIs(instrument_creator.DROP_D_GUITAR, instrument_creator.DROP_D_GUITAR)
+        self.assertEqual(instrument_creator.DROP_D_GUITAR.tuning, create_drop_guitar(Note.D).tuning)
+
+    def test_presets_are_lazy(self):
+        code = "import sys; from music_theory import instrument_creator as ic; print('E_STANDARD_BASS' in vars(ic)); ic.E_STANDARD_BASS; print('E_STANDARD_BASS' in vars(ic))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(instrument_creator.__file__)))
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root)
+
+        self.assertEqual(result.stdout.split(), ["False", "True"])
+
+    def test_extended_range(self):
+        self.assertEqual(instrument_creator.FIVE_STRING_BASS.tuning, [Note.B, Note.E, Note.A, Note.D, Note.G])
+        self.assertEqual(instrument_creator.SEVEN_STRING_GUITAR.num_strings, 7)
+
+    def test_presets(self):
+        presets = instrument_creator.presets()
+
+        self.assertEqual(len(presets), 12)
+        self.assertIs(presets["E_STANDARD_GUITAR"], instrument_creator.E_STANDARD_GUITAR)
+        self.assertIn("DOUBLE_DROP_C_GUITAR", dir(instrument_creator))
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from music_theory.instrument_creator import *", namespace)
+
+        self.assertIs(namespace["DROP_D_GUITAR"], instrument_creator.DROP_D_GUITAR)
+        self.assertTrue(set(instrument_creator.presets()) <= set(namespace))
+        self.assertIn("create_standard_guitar", namespace)
+
+    def test_unknown_preset(self):
+        with self.assertRaises(AttributeError):
+            instrument_creator.F_STANDARD_BANJO
+
 if __name__ == '__main__': # pragma: no cover
     unittest.main()
\ No newline at end of file
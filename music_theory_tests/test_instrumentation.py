@@ -0,0 +1,192 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import music_theory
+from music_theory import instrumentation, notes, progressions, scales, string_instrument
+from music_theory.chord_type import ChordType
+from music_theory.chords import Chord
+from music_theory.instrument_creator import create_standard_guitar
+from music_theory.instrumentation import disable, dump, enable, instrumented, is_enabled, reset, snapshot, to_json
+from music_theory.intervals import Interval
+from music_theory.key_type import KeyType
+from music_theory.keys import Key
+from music_theory.notes import Note
+from music_theory.scale_type import ScaleType
+from music_theory.scales import Scale
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def tearDown(self):
+        disable()
+        reset()
+
+
+class TestEnableDisable(InstrumentationTestCase):
+    def test_disabled_by_default(self):
+        self.assertFalse(is_enabled())
+
+    def test_disabled_restores_originals(self):
+        transpose, new = notes.transpose, vars(Scale)["__new__"]
+
+        enable()
+        self.assertIsNot(notes.transpose, transpose)
+        self.assertIsNot(vars(Scale)["__new__"], new)
+
+        disable()
+        self.assertIs(notes.transpose, transpose)
+        self.assertIs(vars(Scale)["__new__"], new)
+
+    def test_nothing_counted_while_disabled(self):
+        notes.transpose(Note.C, Interval.M3)
+        Key(Note.C).chords()
+
+        self.assertTrue(all(stats.calls == 0 for stats in snapshot().values()))
+
+    def test_imported_functions_are_replaced(self):
+        with instrumented():
+            self.assertIs(string_instrument.transpose, notes.transpose)
+            self.assertIs(music_theory.chords_from_progression, progressions.chords_from_progression)
+
+        self.assertIs(string_instrument.transpose, notes.transpose)
+
+    def test_enable_twice(self):
+        enable()
+        enable()
+        disable()
+
+        self.assertFalse(is_enabled())
+        self.assertEqual(notes.transpose.__name__, "transpose")
+
+
+class TestCounters(InstrumentationTestCase):
+    def test_calls_and_time(self):
+        with instrumented():
+            Key(Note.A, KeyType.Minor).chords()
+            Key(Note.A, KeyType.Minor).chords()
+
+        stats = snapshot()["keys.Key.chords"]
+
+        self.assertEqual(stats.calls, 2)
+        self.assertGreater(stats.total_ns, 0)
+
+    def test_results_are_unchanged(self):
+        expected = scales.modes_from_note(Note.D)
+
+        with instrumented():
+            self.assertEqual(scales.modes_from_note(Note.D), expected)
+            self.assertEqual(Note.from_string("f#"), Note.Gb)
+            self.assertEqual(progressions.chords_from_progression(Key(Note.C), ["I", "x"]), [Key(Note.C).chords()["I"], "X"])
+
+    def test_scale_cache_hits_and_misses(self):
+        scales._interned_scales.pop((Scale, Note.Db, ScaleType.Blues), None)
+
+        with instrumented():
+            Scale(Note.Db, ScaleType.Blues)
+            Scale(Note.Db, scale_type=ScaleType.Blues)
+
+        self.assertEqual(snapshot()["scales.Scale"][:3], (2, 1, 1))
+        self.assertEqual(snapshot()["scales.Scale._construct"].calls, 1)
+
+    def test_chord_and_key_hits_and_misses(self):
+        with instrumented():
+            Chord(Note.E, ChordType.Minor7)
+            Chord(Note.E, chord_type=ChordType.Minor7)
+            self.assertRaises(ValueError, Chord, Note.E, "m7")
+            Key(Note.A, KeyType.Minor)
+            self.assertRaises(ValueError, Key, Note.A, "Lydian")
+
+        self.assertEqual(snapshot()["chords.Chord"][:3], (3, 2, 1))
+        self.assertEqual(snapshot()["keys.Key"][:3], (2, 1, 1))
+
+    def test_fretboard_hits_and_misses(self):
+        guitar = create_standard_guitar()
+
+        with instrumented():
+            guitar.fretboard
+            guitar.fretboard
+            guitar.tuning[0] = Note.D
+            guitar.fretboard
+
+        self.assertEqual(snapshot()["string_instrument.StringInstrument.fretboard"][:3], (3, 1, 2))
+
+    def test_instrument_methods_are_counted(self):
+        guitar = create_standard_guitar()
+
+        with instrumented():
+            guitar.note_at_fret(1, 3)
+            guitar.note_at_fret(5, 30)
+            guitar.add_capo(2)
+
+        counts = snapshot()
+        self.assertEqual(counts["string_instrument.StringInstrument.note_at_fret"].calls, 2)
+        self.assertEqual(counts["string_instrument.StringInstrument.add_capo"].calls, 1)
+        self.assertEqual(counts["string_instrument.note_at_fret"].calls, 0)
+
+    def test_errors_are_counted(self):
+        with instrumented():
+            self.assertRaises(ValueError, Key, Note.C, "Lydian")
+
+        self.assertEqual(snapshot()["keys.Key"].calls, 1)
+
+    def test_instrumented_clears_counters(self):
+        with instrumented():
+            notes.transpose(Note.C, Interval.M3)
+
+        with instrumented(clear=False):
+            notes.transpose(Note.C, Interval.M3)
+
+        self.assertEqual(snapshot()["notes.transpose"].calls, 2)
+
+        with instrumented():
+            pass
+
+        self.assertEqual(snapshot()["notes.transpose"].calls, 0)
+
+    def test_nested_instrumented_stays_enabled(self):
+        with instrumented():
+            with instrumented(clear=False):
+                pass
+            self.assertTrue(is_enabled())
+
+        self.assertFalse(is_enabled())
+
+
+class TestReporting(InstrumentationTestCase):
+    def test_json(self):
+        with instrumented():
+            notes.transpose(Note.C, Interval.M3)
+
+        document = json.loads(to_json())
+
+        self.assertFalse(document["enabled"])
+        self.assertEqual(set(document["counters"]), set(snapshot()))
+        self.assertEqual(document["counters"]["notes.transpose"]["calls"], 1)
+
+    def test_dump(self):
+        out = io.StringIO()
+        dump(out)
+
+        self.assertEqual(json.loads(out.getvalue()), json.loads(to_json()))
+
+    def test_env_var(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "counters.json")
+            env = dict(os.environ, **{instrumentation.ENV_VAR: "1", instrumentation.DUMP_ENV_VAR: path})
+            code = "from music_theory import Note, Scale, ScaleType; Scale(Note.C, ScaleType.Major)"
+
+            subprocess.run([sys.executable, "-c", code], env=env, check=True, cwd=os.path.dirname(os.path.dirname(music_theory.__file__)))
+
+            with open(path, encoding="utf-8") as f:
+                document = json.load(f)
+
+        self.assertTrue(document["enabled"])
+        self.assertGreaterEqual(document["counters"]["scales.Scale"]["calls"], 1)
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 
 from music_theory.notes import Note
-from music_theory.intervals import Interval, interval_distance, intervals_to_string
+from music_theory.intervals import Interval, INTERVALS, INTERVAL_TABLE, interval_distance, intervals_to_string
 
 
 class TestIntervalAttributes(unittest.TestCase):
@@ -41,6 +41,9 @@ class TestIntervalCreation(unittest.TestCase):
     def test_interval_from_numeric_02(self):
         self.assertEqual(Interval.from_numeric('b5'), Interval.dim5)
 
+    def test_interval_from_numeric_invalid(self):
+        self.assertRaises(ValueError, Interval.from_numeric, '#4')
+
     def test_random_interval_validity(self):
         interval = Interval.random()
         self.assertIn(interval, list(Interval))
@@ -77,6 +80,15 @@ class TestIntervalDistance(unittest.TestCase):
     def test_interval_distance_value_error(self):
         self.assertRaises(ValueError, interval_distance, Note.C, Note.G, direction='sideways')
 
+    def test_interval_table_matches_interval_distance(self):
+        for first in Note:
+            for second in Note:
+                self.assertEqual(INTERVAL_TABLE[first.value][second.value], interval_distance(first, second, 'u'))
+                self.assertEqual(INTERVAL_TABLE[second.value][first.value], interval_distance(first, second, 'd'))
+
+    def test_intervals_tuple_matches_items(self):
+        self.assertEqual(list(INTERVALS), Interval.items())
+
 class TestIntervalStringRepresentation(unittest.TestCase):
     def test_intervals_to_string_00(self):
         intervals = intervals_to_string(Interval.items())
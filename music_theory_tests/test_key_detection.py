@@ -0,0 +1,170 @@
+import random
+import unittest
+
+from music_theory.notes import Note
+from music_theory.chords import Chord
+from music_theory.chord_type import ChordType
+from music_theory.keys import Key
+from music_theory.key_type import KeyType
+from music_theory.scales import Scale
+from music_theory.scale_type import ScaleType
+from music_theory.key_detection import KEYS, PROFILE_MATRIX, KeyDetector, rank_keys, rank_keys_for_histogram, detect_key, keys_for_chord, rank_keys_for_chords
+from music_theory.progressions import chords_from_progression
+
+
+def pearson(xs, ys):
+    """ A direct correlation, for comparison with the matrix scores. """
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    cov = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    vx = sum((x - mx) ** 2 for x in xs)
+    vy = sum((y - my) ** 2 for y in ys)
+    return cov / (vx * vy) ** 0.5
+
+
+class TestKeyProfiles(unittest.TestCase):
+    def test_matrix_shape(self):
+        self.assertEqual(len(PROFILE_MATRIX), 12)
+        self.assertTrue(all(len(row) == 24 for row in PROFILE_MATRIX))
+        self.assertEqual(len(set(KEYS)), 24)
+
+    def test_scores_are_pearson_correlations(self):
+        from music_theory.key_detection import KEY_PROFILES
+        notes = [Note.C, Note.E, Note.G, Note.C, Note.A, Note.F, Note.D]
+        histogram = [notes.count(n) for n in Note]
+
+        for key, score in rank_keys(notes):
+            profile = KEY_PROFILES[key.type]
+            rotated = [profile[(pc - key.root.value) % 12] for pc in range(12)]
+
+            self.assertAlmostEqual(score, pearson(histogram, rotated))
+
+
+class TestDetectKey(unittest.TestCase):
+    def test_every_key_from_its_scale_and_tonic(self):
+        for key in KEYS:
+            scale_type = ScaleType.Major if key.type == KeyType.Major else ScaleType.Minor
+            chord_type = ChordType.Major if key.type == KeyType.Major else ChordType.Minor
+
+            self.assertEqual(detect_key([Scale(key.root, scale_type), Chord(key.root, chord_type)]), key)
+
+    def test_chord_list(self):
+        chords = [Chord(Note.A, ChordType.Minor), Chord(Note.D, ChordType.Minor), Chord(Note.E)]
+        self.assertEqual(detect_key(chords), Key(Note.A, KeyType.Minor))
+
+    def test_major_scale(self):
+        for root in Note:
+            self.assertEqual(detect_key(Scale(root)), Key(root))
+
+    def test_no_notes(self):
+        self.assertIsNone(detect_key([]))
+
+    def test_ranked_best_first(self):
+        scores = [score for _, score in rank_keys(Scale(Note.D))]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(len(scores), 24)
+
+    def test_histogram_matches_notes(self):
+        notes = [Note.A, Note.C, Note.E, Note.A, Note.B]
+        histogram = [0] * 12
+
+        for note in notes:
+            histogram[note.value] += 1
+
+        self.assertEqual(rank_keys_for_histogram(histogram), rank_keys(notes))
+
+    def test_histogram_wrong_length(self):
+        self.assertRaises(ValueError, rank_keys_for_histogram, [1, 2, 3])
+
+
+class TestKeyDetector(unittest.TestCase):
+    def test_matches_rank_keys(self):
+        notes = [random.Random(1).choice(Note.items()) for _ in range(50)]
+        detector = KeyDetector()
+        detector.extend(notes)
+
+        for (k1, s1), (k2, s2) in zip(detector.scores(), rank_keys(notes)):
+            self.assertAlmostEqual(s1, s2)
+
+    def test_incremental(self):
+        detector = KeyDetector()
+        detector.extend([Note.G, Note.B, Note.D, Note.Gb, Note.A, Note.C])
+
+        self.assertEqual(detector.best(), Key(Note.G))
+        self.assertEqual(detector.count, 6)
+
+    def test_sliding_window_forgets_old_notes(self):
+        detector = KeyDetector(window=8)
+        detector.extend(Scale(Note.Db).notes * 3)
+        detector.extend(Scale(Note.G).notes + (Note.G,))
+
+        self.assertEqual(detector.count, 8)
+        self.assertEqual(detector.best(), Key(Note.G))
+
+    def test_window_matches_recent_notes(self):
+        rng = random.Random(2)
+        notes = [rng.choice(Note.items()) for _ in range(100)]
+        detector = KeyDetector(window=20)
+        detector.extend(notes)
+
+        for (_, s1), (_, s2) in zip(detector.scores(), rank_keys(notes[-20:])):
+            self.assertAlmostEqual(s1, s2)
+
+    def test_reset(self):
+        detector = KeyDetector()
+        detector.extend(Scale(Note.C))
+        detector.reset()
+
+        self.assertEqual(detector.count, 0)
+        self.assertIsNone(detector.best())
+
+    def test_invalid_window(self):
+        self.assertRaises(ValueError, KeyDetector, 0)
+
+    def test_repr(self):
+        self.assertEqual(repr(KeyDetector(window=16)), "KeyDetector(window=16, count=0)")
+
+
+class TestKeysForChord(unittest.TestCase):
+    def test_matches_key_chords(self):
+        for chord in (Chord(root, chord_type) for root in Note for chord_type in ChordType):
+            expected = {k for k in KEYS if chord in k.chords().values()}
+            self.assertEqual(set(keys_for_chord(chord)), expected)
+
+    def test_parallel(self):
+        for chord in (Chord(Note.Bb), Chord(Note.F, ChordType.Minor)):
+            self.assertIn(Key(Note.C), keys_for_chord(chord, parallel=True))
+
+    def test_no_keys(self):
+        self.assertEqual(keys_for_chord(Chord(Note.C, ChordType.Sus2)), ())
+
+
+class TestRankKeysForChords(unittest.TestCase):
+    def test_every_key_from_its_progression(self):
+        for key in KEYS:
+            chords = chords_from_progression(key, ["I", "IV", "V", "I"] if key.type == KeyType.Major else ["i", "iv", "v", "i"])
+            self.assertEqual(rank_keys_for_chords(chords)[0][0], key)
+
+    def test_tonic_separates_relative_keys(self):
+        chords = [Chord(Note.C), Chord(Note.A, ChordType.Minor), Chord(Note.F), Chord(Note.G), Chord(Note.C)]
+        ranked = rank_keys_for_chords(chords)
+
+        self.assertEqual(ranked[:2], [(Key(Note.C), 1.2), (Key(Note.A, KeyType.Minor), 1.1)])
+
+    def test_borrowed_chords(self):
+        key = Key(Note.C)
+        chords = chords_from_progression(key, ["I", "bVII", "iv", "I"])
+
+        self.assertEqual(rank_keys_for_chords(chords)[0][0], key)
+
+    def test_long_progression_matches_short(self):
+        chords = chords_from_progression(Key(Note.E), ["I", "vi", "IV", "V"])
+        self.assertEqual(rank_keys_for_chords(chords * 1000), rank_keys_for_chords(chords))
+
+    def test_no_chords(self):
+        ranked = rank_keys_for_chords([])
+
+        self.assertEqual(len(ranked), 24)
+        self.assertTrue(all(score == 0 for _, score in ranked))
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
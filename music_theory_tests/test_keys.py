@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from io import StringIO
 from unittest.mock import patch
@@ -46,6 +47,55 @@ class TestKeyEquality(unittest.TestCase):
         self.assertNotEqual(a, b)
     
 
+class TestKeyInterning(unittest.TestCase):
+    def test_same_root_and_type_is_same_instance(self):
+        self.assertIs(Key(Note.E, KeyType.Minor), Key(Note.E, KeyType.Minor))
+
+    def test_keys_are_hashable(self):
+        keys = {Key(Note.E), Key(Note.E, KeyType.Major), Key(Note.E, KeyType.Minor)}
+
+        self.assertEqual(len(keys), 2)
+
+    def test_keys_are_immutable(self):
+        key = Key(Note.E)
+
+        with self.assertRaises(AttributeError):
+            key.root = Note.F
+
+    def test_invalid_key_raises_value_error(self):
+        self.assertRaises(ValueError, Key, Note.C, "Major")
+        self.assertRaises(ValueError, Key, "C", KeyType.Major)
+
+    def test_pickle_returns_interned_key(self):
+        key = Key(Note.Bb, KeyType.Minor)
+
+        self.assertIs(pickle.loads(pickle.dumps(key)), key)
+
+    def test_relative_and_parallel_are_interned(self):
+        key = Key(Note.G)
+
+        self.assertIs(key.relative_key.relative_key, key)
+        self.assertIs(key.parallel.parallel, key)
+
+
+class TestKeyReadOnlyChords(unittest.TestCase):
+    def test_chords_are_the_same_mapping_each_call(self):
+        key = Key(Note.D, KeyType.Minor)
+
+        self.assertIs(key.chords(), key.chords())
+        self.assertIs(key.dominant_chords(), key.dominant_chords())
+        self.assertIs(key.parallel_chords(), key.parallel.chords())
+
+    def test_chords_cannot_be_modified(self):
+        chords = Key(Note.D).chords()
+
+        with self.assertRaises(TypeError):
+            chords['I'] = Chord(Note.C)
+
+        with self.assertRaises(TypeError):
+            del chords['I']
+
+
 class TestKeyParallel(unittest.TestCase):
     def test_parallel_key_00(self):
         parallel, expected = Key(Note.C).parallel, Key(Note.C, KeyType.Minor)
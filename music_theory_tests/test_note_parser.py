@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+
+from music_theory.notes import Note, NOTE_STRINGS
+from music_theory.note_parser import NOTE_TOKENS, InvalidNoteToken, NoteParseError, parse_notes, parse_notes_file
+
+
+class TestNoteTokens(unittest.TestCase):
+    def test_ascii_tokens_match_from_string(self):
+        for token, note in NOTE_STRINGS.items():
+            self.assertEqual(NOTE_TOKENS[token], Note.from_string(token))
+
+    def test_unicode_accidentals(self):
+        self.assertEqual(NOTE_TOKENS["F♯"], Note.Gb)
+        self.assertEqual(NOTE_TOKENS["f♯♯"], Note.G)
+        self.assertEqual(NOTE_TOKENS["F𝄪"], Note.G)
+        self.assertEqual(NOTE_TOKENS["C♭"], Note.B)
+        self.assertEqual(NOTE_TOKENS["C♭♭"], Note.Bb)
+        self.assertEqual(NOTE_TOKENS["c𝄫"], Note.Bb)
+
+
+class TestParseNotes(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(list(parse_notes("")), [])
+        self.assertEqual(list(parse_notes("   \n\t ")), [])
+
+    def test_arbitrary_whitespace(self):
+        result = list(parse_notes("C  E♭\nG\tB♭♭ \r\n  a##"))
+        expected = [Note.C, Note.Eb, Note.G, Note.A, Note.B]
+
+        self.assertEqual(result, expected)
+
+    def test_iterable_of_lines(self):
+        result = list(parse_notes(["C c# Ebb", "F♯ G𝄫"]))
+        expected = [Note.C, Note.Db, Note.D, Note.Gb, Note.F]
+
+        self.assertEqual(result, expected)
+
+    def test_is_lazy(self):
+        def lines():
+            yield "C D"
+            raise AssertionError("read too far")
+
+        notes = parse_notes(lines())
+
+        self.assertEqual(next(notes), Note.C)
+        self.assertEqual(next(notes), Note.D)
+
+    def test_matches_notes_from_string_for_valid_input(self):
+        from music_theory.notes import notes_from_string
+        text = "cbb cb c c# c## Ab G#"
+
+        self.assertEqual(list(parse_notes(text)), notes_from_string(text))
+
+    def test_invalid_token_raises_with_position(self):
+        with self.assertRaises(NoteParseError) as cm:
+            list(parse_notes("C D\nE  H# F"))
+
+        self.assertEqual((cm.exception.token, cm.exception.line, cm.exception.column), ("H#", 2, 4))
+        self.assertIsInstance(cm.exception, ValueError)
+
+    def test_invalid_tokens_collected(self):
+        errors = []
+        result = list(parse_notes("C X G\n33, A\nDBB", errors))
+
+        self.assertEqual(result, [Note.C, Note.G, Note.A])
+        self.assertEqual(errors, [
+            InvalidNoteToken("X", 1, 3),
+            InvalidNoteToken("33,", 2, 1),
+            InvalidNoteToken("DBB", 3, 1),
+        ])
+
+
+class TestParseNotesFile(unittest.TestCase):
+    def test_parse_file(self):
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False) as f:
+            f.write("C E G\nB♭ D F\n")
+
+        try:
+            result = list(parse_notes_file(f.name))
+        finally:
+            os.remove(f.name)
+
+        self.assertEqual(result, [Note.C, Note.E, Note.G, Note.Bb, Note.D, Note.F])
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
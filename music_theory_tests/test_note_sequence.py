@@ -0,0 +1,122 @@
+import pickle
+import unittest
+from array import array
+
+from music_theory.intervals import Interval
+from music_theory.notes import Note, notes_to_string, transpose
+from music_theory.note_sequence import NoteSequence
+
+MELODY = [Note.C, Note.E, Note.G, Note.Bb, Note.A, Note.F]
+
+
+class TestNoteSequenceCreation(unittest.TestCase):
+    def test_from_notes_round_trip(self):
+        self.assertEqual(NoteSequence(MELODY).to_notes(), MELODY)
+
+    def test_empty(self):
+        self.assertEqual(len(NoteSequence()), 0)
+        self.assertEqual(NoteSequence().to_notes(), [])
+
+    def test_from_bytes_shares_memory(self):
+        data = bytes([0, 4, 7])
+        self.assertIs(NoteSequence.from_bytes(data).view.obj, data)
+
+    def test_from_mutable_buffer_is_copied(self):
+        data = bytearray([0, 4, 7])
+        sequence = NoteSequence.from_bytes(data)
+        data[0] = 1
+
+        self.assertEqual(sequence[0], Note.C)
+
+    def test_from_array(self):
+        self.assertEqual(NoteSequence.from_bytes(array('B', [0, 11])).to_notes(), [Note.C, Note.B])
+
+    def test_from_bytes_invalid(self):
+        self.assertRaises(ValueError, NoteSequence.from_bytes, bytes([0, 12]))
+
+    def test_from_string(self):
+        self.assertEqual(NoteSequence.from_string("C c# Ebb").to_notes(), [Note.C, Note.Db, Note.D])
+
+    def test_from_string_invalid(self):
+        self.assertRaises(ValueError, NoteSequence.from_string, "C H")
+
+
+class TestNoteSequenceAccess(unittest.TestCase):
+    def setUp(self):
+        self.sequence = NoteSequence(MELODY)
+
+    def test_index(self):
+        self.assertEqual(self.sequence[2], Note.G)
+        self.assertEqual(self.sequence[-1], Note.F)
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            _ = self.sequence[6]
+
+    def test_slice_shares_memory(self):
+        part = self.sequence[1:4]
+
+        self.assertEqual(part.to_notes(), MELODY[1:4])
+        self.assertIs(part.view.obj, self.sequence.view.obj)
+
+    def test_slice_with_step(self):
+        self.assertEqual(self.sequence[::-2].to_notes(), MELODY[::-2])
+
+    def test_iteration(self):
+        self.assertEqual(list(self.sequence), MELODY)
+
+    def test_contains(self):
+        self.assertIn(Note.Bb, self.sequence)
+        self.assertNotIn(Note.D, self.sequence)
+        self.assertNotIn(Note.Bb, self.sequence[:3])
+        self.assertNotIn("C", self.sequence)
+
+    def test_concatenation(self):
+        self.assertEqual((self.sequence[:2] + self.sequence[4:]).to_notes(), MELODY[:2] + MELODY[4:])
+
+    def test_to_array_and_bytes(self):
+        self.assertEqual(self.sequence.to_array(), array('B', [0, 4, 7, 10, 9, 5]))
+        self.assertEqual(bytes(self.sequence[1:3]), bytes([4, 7]))
+
+
+class TestNoteSequenceTranspose(unittest.TestCase):
+    def test_matches_transpose(self):
+        sequence = NoteSequence(MELODY)
+
+        for interval in Interval:
+            for direction in ("u", "d"):
+                expected = [transpose(note, interval, direction) for note in MELODY]
+                self.assertEqual(sequence.transpose(interval, direction).to_notes(), expected)
+
+    def test_transpose_slice(self):
+        result = NoteSequence(MELODY)[::2].transpose(Interval.M2)
+
+        self.assertEqual(result.to_notes(), [Note.D, Note.A, Note.B])
+
+    def test_invalid_direction(self):
+        self.assertRaises(ValueError, NoteSequence(MELODY).transpose, Interval.M2, "sideways")
+
+
+class TestNoteSequenceComparison(unittest.TestCase):
+    def test_equal_slices(self):
+        self.assertEqual(NoteSequence(MELODY)[1:3], NoteSequence([Note.E, Note.G]))
+        self.assertEqual(hash(NoteSequence(MELODY)[1:3]), hash(NoteSequence([Note.E, Note.G])))
+
+    def test_not_equal_to_list(self):
+        self.assertNotEqual(NoteSequence(MELODY), MELODY)
+
+    def test_pickle(self):
+        sequence = NoteSequence(MELODY)[::2]
+        self.assertEqual(pickle.loads(pickle.dumps(sequence)), sequence)
+
+
+class TestNoteSequenceStringRepresentation(unittest.TestCase):
+    def test_str_matches_notes_to_string(self):
+        self.assertEqual(str(NoteSequence(MELODY)), notes_to_string(MELODY))
+
+    def test_repr(self):
+        self.assertEqual(repr(NoteSequence([Note.G, Note.C])), "NoteSequence(G, C)")
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from music_theory.notes import Note, transpose, notes_to_string, notes_from_string, chromatic_notes
+from music_theory.notes import Note, NOTES, TRANSPOSE_TABLE, transpose, notes_to_string, notes_from_string, chromatic_notes
 from music_theory.intervals import Interval, interval_distance, intervals_to_string
 
 
@@ -45,6 +45,25 @@ class TestNoteCreation(unittest.TestCase):
         index = Note.B.value
         self.assertEqual(Note.from_index(index - 27), Note.Ab)
 
+class TestNoteLookupTables(unittest.TestCase):
+    def test_notes_tuple_matches_items(self):
+        self.assertIsInstance(NOTES, tuple)
+        self.assertEqual(list(NOTES), Note.items())
+
+    def test_items_returns_a_new_list(self):
+        items = Note.items()
+        items.clear()
+
+        self.assertEqual(len(Note.items()), 12)
+
+    def test_transpose_table_matches_from_index(self):
+        for note in Note:
+            for semitones in range(12):
+                self.assertEqual(TRANSPOSE_TABLE[note.value][semitones], Note.from_index(note.value + semitones))
+
+    def test_transpose_table_rows_are_chromatic(self):
+        self.assertEqual(list(TRANSPOSE_TABLE[Note.A.value]), chromatic_notes(Note.A))
+
 class TestNoteToSharp(unittest.TestCase):
     def test_to_sharp_00(self):
         sharp = Note.to_sharp(Note.Db)
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import music_theory
+from music_theory.notes import Note, transpose
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(music_theory.__file__)))
+
+
+def run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_loads_no_submodules(self):
+        code = "import sys, music_theory; print(sorted(m for m in sys.modules if m.startswith('music_theory.')))"
+
+        self.assertEqual(run(code).strip(), "[]")
+
+    def test_exported_name_loads_only_its_modules(self):
+        code = "import sys; from music_theory import Note; print('music_theory.keys' in sys.modules, 'music_theory.notes' in sys.modules)"
+
+        self.assertEqual(run(code).split(), ["False", "True"])
+
+    def test_exported_names(self):
+        self.assertIs(music_theory.Note, Note)
+        self.assertIs(music_theory.Key, music_theory.keys.Key)
+        self.assertIs(music_theory.chords_from_progression, music_theory.progressions.chords_from_progression)
+
+    def test_submodules(self):
+        self.assertIs(music_theory.notes.transpose, transpose)
+        self.assertTrue(hasattr(music_theory.batch, "parse_notes"))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            music_theory.Banjo
+
+    def test_dir_and_all(self):
+        self.assertIn("Scale", dir(music_theory))
+        self.assertIn("voicings", dir(music_theory))
+        self.assertIn("StringInstrument", music_theory.__all__)
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from music_theory import *", namespace)
+
+        self.assertIs(namespace["Note"], Note)
+        self.assertIn("rendering", namespace)
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+
+from music_theory.notes import Note
+from music_theory.intervals import Interval
+from music_theory.chords import Chord, ChordType
+from music_theory.scales import Scale, ScaleType
+from music_theory.keys import Key, KeyType
+from music_theory.pitch_class_set import PitchClassSet
+
+
+class TestPitchClassSetCreation(unittest.TestCase):
+    def test_empty(self):
+        pcs = PitchClassSet()
+
+        self.assertEqual(pcs.mask, 0)
+        self.assertEqual(len(pcs), 0)
+
+    def test_from_notes_mask(self):
+        pcs = PitchClassSet([Note.C, Note.E, Note.G])
+        expected = 0b000010010001
+
+        self.assertEqual(pcs.mask, expected)
+
+    def test_duplicates_are_ignored(self):
+        pcs = PitchClassSet([Note.A, Note.A, Note.C])
+
+        self.assertEqual(len(pcs), 2)
+
+    def test_from_mask(self):
+        pcs = PitchClassSet.from_mask(0b000010010001)
+
+        self.assertEqual(pcs, PitchClassSet([Note.G, Note.E, Note.C]))
+
+    def test_from_mask_out_of_range(self):
+        self.assertRaises(ValueError, PitchClassSet.from_mask, -1)
+        self.assertRaises(ValueError, PitchClassSet.from_mask, 4096)
+
+
+class TestPitchClassSetAlgebra(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.c_major = PitchClassSet([Note.C, Note.E, Note.G])
+        cls.a_minor = PitchClassSet([Note.A, Note.C, Note.E])
+
+    def test_union(self):
+        expected = PitchClassSet([Note.C, Note.E, Note.G, Note.A])
+
+        self.assertEqual(self.c_major | self.a_minor, expected)
+        self.assertEqual(self.c_major.union(self.a_minor), expected)
+
+    def test_intersection(self):
+        expected = PitchClassSet([Note.C, Note.E])
+
+        self.assertEqual(self.c_major & self.a_minor, expected)
+
+    def test_difference(self):
+        self.assertEqual(self.c_major - self.a_minor, PitchClassSet([Note.G]))
+
+    def test_subset_and_superset(self):
+        c_major_scale = Scale(Note.C, ScaleType.Major).pitch_classes
+
+        self.assertTrue(self.c_major <= c_major_scale)
+        self.assertTrue(c_major_scale >= self.a_minor)
+        self.assertFalse(c_major_scale.issubset(self.c_major))
+
+    def test_isdisjoint(self):
+        self.assertTrue(self.c_major.isdisjoint(PitchClassSet([Note.Db, Note.Eb])))
+        self.assertFalse(self.c_major.isdisjoint(self.a_minor))
+
+    def test_complement(self):
+        complement = self.c_major.complement()
+
+        self.assertEqual(len(complement), 9)
+        self.assertTrue(complement.isdisjoint(self.c_major))
+
+
+class TestPitchClassSetTransposition(unittest.TestCase):
+    def test_rotate_up_wraps_around(self):
+        result = PitchClassSet([Note.A, Note.B]).rotate(2)
+        expected = PitchClassSet([Note.B, Note.Db])
+
+        self.assertEqual(result, expected)
+
+    def test_rotate_down(self):
+        result = PitchClassSet([Note.C]).rotate(-1)
+
+        self.assertEqual(result, PitchClassSet([Note.B]))
+
+    def test_transpose_matches_chords(self):
+        for chord_type in ChordType:
+            result = Chord(Note.C, chord_type).pitch_classes.transpose(Interval.m3, "d")
+            expected = Chord(Note.A, chord_type).pitch_classes
+
+            self.assertEqual(result, expected)
+
+
+class TestPitchClassSetContainer(unittest.TestCase):
+    def test_iteration_is_ascending(self):
+        result = list(PitchClassSet([Note.B, Note.E, Note.C]))
+        expected = [Note.C, Note.E, Note.B]
+
+        self.assertEqual(result, expected)
+
+    def test_contains(self):
+        pcs = PitchClassSet([Note.Eb])
+
+        self.assertIn(Note.Eb, pcs)
+        self.assertNotIn(Note.E, pcs)
+        self.assertNotIn("Eb", pcs)
+
+    def test_hashable(self):
+        d = {PitchClassSet([Note.C, Note.E]): "third"}
+
+        self.assertEqual(d[PitchClassSet([Note.E, Note.C])], "third")
+
+    def test_not_equal_with_non_set(self):
+        self.assertFalse(PitchClassSet() == 0)
+        self.assertFalse(PitchClassSet() == None)
+
+    def test_str(self):
+        self.assertEqual(str(PitchClassSet([Note.G, Note.C])), "C, G")
+
+    def test_repr(self):
+        self.assertEqual(repr(PitchClassSet([Note.G, Note.C])), "PitchClassSet(C, G)")
+
+
+class TestPitchClassSetProperties(unittest.TestCase):
+    def test_scale_pitch_classes(self):
+        scale = Scale(Note.E, ScaleType.Dorian)
+
+        self.assertEqual(list(scale.pitch_classes), sorted(scale.notes, key=lambda n: n.value))
+
+    def test_chord_pitch_classes(self):
+        chord = Chord(Note.A, ChordType.Dominant7)
+
+        self.assertEqual(chord.pitch_classes, PitchClassSet(chord.notes))
+
+    def test_key_pitch_classes(self):
+        result = Key(Note.A, KeyType.Minor).pitch_classes
+        expected = Key(Note.C, KeyType.Major).pitch_classes
+
+        self.assertEqual(result, expected)
+        self.assertEqual(len(result), 7)
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
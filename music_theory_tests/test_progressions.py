@@ -1,6 +1,6 @@
 import unittest
 
-from music_theory.progressions import chords_from_progression
+from music_theory.progressions import chords_from_progression, Progression, ProgressionCompiler, INVALID_CODE
 from music_theory.keys import Key, KeyType
 from music_theory.notes import Note
 from music_theory.chords import Chord, ChordType
@@ -82,5 +82,76 @@ class TestChordsFromProgressionDiminished(unittest.TestCase):
 
         self.assertListEqual(result, expected)
 
+class TestProgression(unittest.TestCase):
+    def test_chords(self):
+        progression = Progression(Key(Note.C), ["I", "V", "vi", "IV"])
+
+        self.assertEqual(progression.chords, [Chord(Note.C), Chord(Note.G), Chord(Note.A, ChordType.Minor), Chord(Note.F)])
+
+    def test_has_no_instance_dict(self):
+        progression = Progression(Key(Note.C), ["I"])
+
+        self.assertFalse(hasattr(progression, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            progression.extra = 1
+
+
+class TestProgressionCompiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.numerals = [
+            "I", "ii", "iii", "IV", "V", "vi", "vii°",
+            "i", "ii°", "III", "iv", "v", "VI", "VII",
+            "vii", "viidim", "iidim", "VIIDIM", "II", "guitar", "", None, 1,
+        ]
+
+    @staticmethod
+    def _dict_lookup(key, progression, error='X'):
+        shorthand_map = {'viidim': 'vii°', 'vii': 'vii°', 'iidim': 'ii°', 'ii': 'ii'}
+        chord_dict = key.chords() | key.parallel_chords()
+
+        return [
+            chord_dict.get(shorthand_map.get(n.lower(), n) if isinstance(n, str) else n, error)
+            for n in progression
+        ]
+
+    def test_codes(self):
+        compiled = ProgressionCompiler(["I", "i", "VII", "Q"])
+
+        self.assertEqual(compiled.codes, (0, 7, 6, INVALID_CODE))
+        self.assertEqual(len(compiled), 4)
+
+    def test_resolve_matches_dict_lookup_in_every_key(self):
+        compiled = ProgressionCompiler(self.numerals)
+
+        for key_type in KeyType:
+            for note in Note:
+                key = Key(note, key_type)
+                self.assertListEqual(compiled.resolve(key, 'err'), self._dict_lookup(key, self.numerals, 'err'))
+
+    def test_resolve_all(self):
+        compiled = ProgressionCompiler(self.numerals)
+        result = compiled.resolve_all(error=None)
+
+        self.assertEqual(len(result), 24)
+
+        for key, chords in result.items():
+            self.assertListEqual(chords, self._dict_lookup(key, self.numerals, None))
+
+    def test_resolve_all_lists_are_independent(self):
+        result = ProgressionCompiler(["I"]).resolve_all()
+        result[Key(Note.C)].append("extra")
+
+        self.assertEqual(len(result[Key(Note.C, KeyType.Minor)]), 1)
+
+    def test_unhashable_numerals_are_invalid(self):
+        compiled = ProgressionCompiler(["I", ["V"], {}])
+
+        self.assertEqual(compiled.codes, (0, INVALID_CODE, INVALID_CODE))
+
+    def test_empty_progression(self):
+        self.assertEqual(ProgressionCompiler([]).resolve(Key(Note.C)), [])
+
 if __name__ == '__main__': # pragma: no cover
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,145 @@
+import csv
+import json
+import unittest
+from io import StringIO
+
+from music_theory.instrument_creator import create_standard_guitar
+from music_theory.key_type import KeyType
+from music_theory.keys import Key
+from music_theory.notes import Note
+from music_theory.progressions import Progression
+from music_theory.rendering import CSV_HEADER, FORMATS, render, render_all, render_keys, render_string, table_for
+from music_theory.scale_diatonic import DiatonicScale
+from music_theory.scale_type import ScaleType
+
+
+class TestTables(unittest.TestCase):
+    def test_key_sections(self):
+        table = table_for(Key(Note.C), dominant=True, parallel=True)
+
+        self.assertEqual(table.kind, "key")
+        self.assertEqual([s.name for s in table.sections], ["chords", "dominant", "parallel"])
+        self.assertEqual(table.sections[0].values[0], "CM")
+
+    def test_tables_are_cached(self):
+        self.assertIs(table_for(Key(Note.D)), table_for(Key(Note.D)))
+
+    def test_instrument_rows(self):
+        table = table_for(create_standard_guitar(), num_frets=5)
+
+        self.assertEqual(len(table.sections), 6)
+        self.assertEqual(table.sections[1].values, ("A", "Bb", "B", "C", "Db", "D"))
+
+    def test_instrument_negative_frets(self):
+        self.assertRaises(ValueError, table_for, create_standard_guitar(), num_frets=-1)
+
+    def test_unsupported_entity(self):
+        self.assertRaises(ValueError, table_for, Note.C)
+
+
+class TestRenderAscii(unittest.TestCase):
+    def test_key_matches_to_string_array(self):
+        key = Key(Note.Eb, KeyType.Minor)
+        out = StringIO()
+        render(key, out, dominant=True, parallel=True)
+
+        self.assertEqual(out.getvalue().splitlines(), key.to_string_array(dominant=True, parallel=True))
+
+    def test_scale_layout(self):
+        result = render_string(DiatonicScale(Note.A, ScaleType.Minor))
+
+        self.assertEqual(result.splitlines()[:2], ["Scale Degrees of A Minor:", "\ttonic       : A"])
+
+    def test_progression_layout(self):
+        result = render_string(Progression(Key(Note.C), ["I", "V", "zz"]))
+        expected = (
+            "Chords in progression in the key of C Major:\n"
+            "         I         V        zz\n"
+            "        CM        GM         X\n"
+        )
+
+        self.assertEqual(result, expected)
+
+    def test_instrument_highest_string_first(self):
+        lines = render_string(create_standard_guitar(), num_frets=3).splitlines()
+
+        self.assertEqual(lines[1], "       0   1   2   3")
+        self.assertEqual(lines[2], "E      E   F  Gb   G")
+        self.assertEqual(lines[3], "B      B   C  Db   D")
+
+
+class TestRenderFormats(unittest.TestCase):
+    def test_unknown_format(self):
+        self.assertRaises(ValueError, render, Key(Note.C), StringIO(), "html")
+
+    def test_markdown_table(self):
+        lines = render_string(Key(Note.C), "markdown").splitlines()
+
+        self.assertEqual(lines[0], "### Chords of C Major")
+        self.assertEqual(lines[2], "| I | ii | iii | IV | V | vi | vii° |")
+        self.assertEqual(lines[4], "| CM | Dm | Em | FM | GM | Am | B° |")
+
+    def test_markdown_section_headings(self):
+        result = render_string(Key(Note.C), "markdown", dominant=True)
+
+        self.assertIn("#### dominant", result)
+
+    def test_csv_round_trip(self):
+        rows = list(csv.reader(StringIO(render_string(DiatonicScale(Note.C, ScaleType.Major), "csv"))))
+
+        self.assertEqual(tuple(rows[0]), CSV_HEADER)
+        self.assertEqual(rows[1], ["scale", "C Major", "degrees", "tonic", "C"])
+        self.assertEqual(len(rows), 8)
+
+    def test_json_round_trip(self):
+        data = json.loads(render_string(Progression(Key(Note.G), ["I", "IV", "I"]), "json"))
+
+        self.assertEqual(data["kind"], "progression")
+        self.assertEqual(data["sections"][0]["labels"], ["I", "IV", "I"])
+        self.assertEqual(data["sections"][0]["values"], ["GM", "CM", "GM"])
+
+
+class TestRenderMany(unittest.TestCase):
+    def test_render_all_json_is_an_array(self):
+        out = StringIO()
+        render_all([Key(Note.C), DiatonicScale(Note.D, ScaleType.Dorian)], out, "json")
+        data = json.loads(out.getvalue())
+
+        self.assertEqual([d["kind"] for d in data], ["key", "scale"])
+
+    def test_render_all_empty_json(self):
+        out = StringIO()
+        render_all([], out, "json")
+
+        self.assertEqual(json.loads(out.getvalue()), [])
+
+    def test_render_all_csv_single_header(self):
+        out = StringIO()
+        render_all([Key(Note.C), Key(Note.D)], out, "csv")
+        lines = out.getvalue().splitlines()
+
+        self.assertEqual(lines.count(",".join(CSV_HEADER)), 1)
+        self.assertEqual(len(lines), 1 + 14)
+
+    def test_render_all_ascii_separated_by_blank_line(self):
+        out = StringIO()
+        render_all([Key(Note.C), Key(Note.D)], out)
+
+        self.assertEqual(out.getvalue(), render_string(Key(Note.C)) + "\n" + render_string(Key(Note.D)))
+
+    def test_render_keys_every_format(self):
+        for fmt in FORMATS:
+            out = StringIO()
+            render_keys(out, fmt)
+
+            self.assertIn("Bb Minor", out.getvalue())
+
+    def test_render_keys_json_count(self):
+        out = StringIO()
+        render_keys(out, "json")
+
+        self.assertEqual(len(json.loads(out.getvalue())), 24 * 4)
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
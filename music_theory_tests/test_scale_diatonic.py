@@ -32,6 +32,21 @@ class TestDiatonicScaleContains7Notes(unittest.TestCase):
                 _ = DiatonicScale(Note.C, st)
 
 
+class TestDiatonicScaleInterning(unittest.TestCase):
+    def test_diatonic_scale_is_interned(self):
+        self.assertIs(DiatonicScale(Note.Bb, ScaleType.Dorian), DiatonicScale(Note.Bb, ScaleType.Dorian))
+
+    def test_diatonic_scale_is_not_the_interned_scale(self):
+        diatonic, scale = DiatonicScale(Note.Bb, ScaleType.Dorian), Scale(Note.Bb, ScaleType.Dorian)
+
+        self.assertIsNot(diatonic, scale)
+        self.assertIsInstance(diatonic, DiatonicScale)
+        self.assertNotIsInstance(scale, DiatonicScale)
+
+    def test_diatonic_scale_hashes_like_scale(self):
+        self.assertEqual(hash(DiatonicScale(Note.A)), hash(Scale(Note.A)))
+
+
 class TestDiatonicScaleNoteDegrees(unittest.TestCase):
     def test_note_degrees_returns_a_dict_of_str_Note(self):
         result = DiatonicScale(Note.C).note_degrees()
@@ -8,11 +8,13 @@
 # TODO:        
 #-------------------------------------------------------------------------------
 
+import pickle
 import unittest
 
 from music_theory.notes import Note
 from music_theory.intervals import Interval
-from music_theory.scales import Scale, _intervals_from_numerics, _intervals_from_steps, _notes_from_intervals, _notes_from_steps, modes_from_note
+from music_theory.scales import Scale, _interned_scales, _intervals_from_numerics, _intervals_from_steps, _notes_from_intervals, _notes_from_steps, modes_from_note, scales_containing
+from music_theory.pitch_class_set import PitchClassSet
 from music_theory.scale_type import ScaleType
 
 class TestScales(unittest.TestCase):
@@ -59,6 +61,92 @@ class TestScales(unittest.TestCase):
         self.assertFalse(scale == None)
 
 
+class TestScaleInterning(unittest.TestCase):
+    def test_same_root_and_type_is_same_instance(self):
+        self.assertIs(Scale(Note.C, ScaleType.Blues), Scale(Note.C, ScaleType.Blues))
+
+    def test_default_scale_type_is_interned(self):
+        self.assertIs(Scale(Note.D), Scale(Note.D, ScaleType.Major))
+
+    def test_scales_are_hashable(self):
+        d = {Scale(Note.A, ScaleType.Minor): "relative"}
+
+        self.assertEqual(d[Scale(Note.A, ScaleType.Minor)], "relative")
+        self.assertEqual(len({Scale(Note.A), Scale(Note.A), Scale(Note.B)}), 2)
+
+    def test_scales_are_immutable(self):
+        scale = Scale(Note.E, ScaleType.Lydian)
+
+        with self.assertRaises(AttributeError):
+            scale.root = Note.F
+
+        with self.assertRaises(AttributeError):
+            del scale.notes
+
+        with self.assertRaises(AttributeError):
+            scale.extra = 1
+
+    def test_scale_sequences_are_tuples(self):
+        scale = Scale(Note.E, ScaleType.Lydian)
+
+        self.assertIsInstance(scale.notes, tuple)
+        self.assertIsInstance(scale.creation_formula, tuple)
+        self.assertIsInstance(scale.interval_formula, tuple)
+        self.assertIsInstance(scale.numeric_formula, tuple)
+
+    def test_pickle_returns_interned_scale(self):
+        scale = Scale(Note.Gb, ScaleType.HarmonicMinor)
+
+        self.assertIs(pickle.loads(pickle.dumps(scale)), scale)
+
+    def test_invalid_scale_type_is_not_interned(self):
+        with self.assertRaises(ValueError):
+            Scale(Note.C, "Major")
+
+        with self.assertRaises(ValueError):
+            Scale(Note.C, "Major")
+
+
+    def test_invalid_root_is_not_interned(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                Scale("X", ScaleType.Major)
+
+        self.assertNotIn((Scale, "X", ScaleType.Major), _interned_scales)
+
+class TestScaleLazyAttributes(unittest.TestCase):
+    def setUp(self):
+        # Build a fresh (not yet interned) scale
+        self.key = (Scale, Note.Db, ScaleType.Blues)
+        self.previous = _interned_scales.pop(self.key, None)
+        self.scale = Scale(Note.Db, ScaleType.Blues)
+
+    def tearDown(self):
+        _interned_scales.pop(self.key, None)
+
+        if self.previous is not None:
+            _interned_scales[self.key] = self.previous
+
+    def test_notes_are_not_built_on_construction(self):
+        with self.assertRaises(AttributeError):
+            Scale.notes.__get__(self.scale)
+
+        self.assertEqual(self.scale.name, "Db Blues")
+
+    def test_notes_are_kept_after_first_access(self):
+        notes = self.scale.notes
+
+        self.assertIs(Scale.notes.__get__(self.scale), notes)
+        self.assertEqual(notes, (Note.Db, Note.E, Note.Gb, Note.G, Note.Ab, Note.B))
+
+    def test_formulas_are_shared_by_every_root(self):
+        self.assertIs(self.scale.interval_formula, Scale(Note.C, ScaleType.Blues).interval_formula)
+        self.assertIs(self.scale.numeric_formula, Scale(Note.C, ScaleType.Blues).numeric_formula)
+
+    def test_unknown_attribute(self):
+        self.assertFalse(hasattr(self.scale, "steps"))
+
+
 class TestScaleIterator(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -119,53 +207,53 @@ class TestScalesStringRepresentation(unittest.TestCase):
 class TestScalesMajor(unittest.TestCase):
     def test_a_major_scale(self):
         scale = Scale(Note.A, ScaleType.Major)
-        self.assertEqual(scale.notes, [Note.A, Note.B, Note.Db, Note.D, Note.E, Note.Gb, Note.Ab])
+        self.assertSequenceEqual(scale.notes, [Note.A, Note.B, Note.Db, Note.D, Note.E, Note.Gb, Note.Ab])
 
     def test_c_major_scale(self):
         scale = Scale(Note.C, ScaleType.Major)
-        self.assertEqual(scale.notes, [Note.C, Note.D, Note.E, Note.F, Note.G, Note.A, Note.B])
+        self.assertSequenceEqual(scale.notes, [Note.C, Note.D, Note.E, Note.F, Note.G, Note.A, Note.B])
 
     def test_f_major_scale(self):
         scale = Scale(Note.F, ScaleType.Major)
-        self.assertEqual(scale.notes, [Note.F, Note.G, Note.A, Note.Bb, Note.C, Note.D, Note.E])
+        self.assertSequenceEqual(scale.notes, [Note.F, Note.G, Note.A, Note.Bb, Note.C, Note.D, Note.E])
 
 class TestScalesMinor(unittest.TestCase):
     def test_a_minor_scale(self):
         scale = Scale(Note.A, ScaleType.Minor)
-        self.assertEqual(scale.notes, [Note.A, Note.B, Note.C, Note.D, Note.E, Note.F, Note.G])
+        self.assertSequenceEqual(scale.notes, [Note.A, Note.B, Note.C, Note.D, Note.E, Note.F, Note.G])
 
     def test_c_minor_scale(self):
         scale = Scale(Note.C, ScaleType.Minor)
-        self.assertEqual(scale.notes, [Note.C, Note.D, Note.Eb, Note.F, Note.G, Note.Ab, Note.Bb])
+        self.assertSequenceEqual(scale.notes, [Note.C, Note.D, Note.Eb, Note.F, Note.G, Note.Ab, Note.Bb])
 
     def test_f_minor_scale(self):
         scale = Scale(Note.F, ScaleType.Minor)
-        self.assertEqual(scale.notes, [Note.F, Note.G, Note.Ab, Note.Bb, Note.C, Note.Db, Note.Eb])
+        self.assertSequenceEqual(scale.notes, [Note.F, Note.G, Note.Ab, Note.Bb, Note.C, Note.Db, Note.Eb])
 
 class TestScalesPentatonic(unittest.TestCase):
     def test_a_major_pentatonic(self):
         scale = Scale(Note.A, ScaleType.MajorPentatonic)
-        self.assertEqual(scale.notes, [Note.A, Note.B, Note.Db, Note.E, Note.Gb])
+        self.assertSequenceEqual(scale.notes, [Note.A, Note.B, Note.Db, Note.E, Note.Gb])
     
     def test_c_major_pentatonic(self):
         scale = Scale(Note.C, ScaleType.MajorPentatonic)
-        self.assertEqual(scale.notes, [Note.C, Note.D, Note.E, Note.G, Note.A])
+        self.assertSequenceEqual(scale.notes, [Note.C, Note.D, Note.E, Note.G, Note.A])
 
     def test_f_major_pentatonic(self):
         scale = Scale(Note.F, ScaleType.MajorPentatonic)
-        self.assertEqual(scale.notes, [Note.F, Note.G, Note.A, Note.C, Note.D])
+        self.assertSequenceEqual(scale.notes, [Note.F, Note.G, Note.A, Note.C, Note.D])
 
     def test_a_minor_pentatonic(self):
         scale = Scale(Note.A, ScaleType.MinorPentatonic)
-        self.assertEqual(scale.notes, [Note.A, Note.C, Note.D, Note.E, Note.G])
+        self.assertSequenceEqual(scale.notes, [Note.A, Note.C, Note.D, Note.E, Note.G])
 
     def test_c_minor_pentatonic(self):
         scale = Scale(Note.C, ScaleType.MinorPentatonic)
-        self.assertEqual(scale.notes, [Note.C, Note.Eb, Note.F, Note.G, Note.Bb])
+        self.assertSequenceEqual(scale.notes, [Note.C, Note.Eb, Note.F, Note.G, Note.Bb])
 
     def test_f_minor_pentatonic(self):
         scale = Scale(Note.F, ScaleType.MinorPentatonic)
-        self.assertEqual(scale.notes, [Note.F, Note.Ab, Note.Bb, Note.C, Note.Eb])
+        self.assertSequenceEqual(scale.notes, [Note.F, Note.Ab, Note.Bb, Note.C, Note.Eb])
 
 class TestScalesNotesFromSteps(unittest.TestCase):
     def test_c_major_notes_from_steps(self):
@@ -213,5 +301,36 @@ class TestScalesModes(unittest.TestCase):
             Scale(Note.B, ScaleType.Locrian)]
         self.assertEqual(modes, expected)
 
+class TestScalesContaining(unittest.TestCase):
+    def test_matches_full_scan(self):
+        queries = [[Note.C], [Note.C, Note.E], [Note.A, Note.C, Note.E, Note.G], [Note.Db, Note.D, Note.Eb]]
+        all_scales = [Scale(root, scale_type) for scale_type in ScaleType for root in Note]
+
+        for query in queries:
+            expected = {s for s in all_scales if set(query) <= set(s.notes)}
+            self.assertEqual(set(scales_containing(query)), expected)
+
+    def test_ranked_by_fewest_notes(self):
+        sizes = [len(s.pitch_classes) for s in scales_containing([Note.C, Note.G])]
+        self.assertEqual(sizes, sorted(sizes))
+
+    def test_best_fit_first(self):
+        result = scales_containing([Note.C, Note.Eb, Note.G, Note.Bb])
+
+        self.assertEqual(result[:2], (Scale(Note.Eb, ScaleType.MajorPentatonic), Scale(Note.C, ScaleType.MinorPentatonic)))
+
+    def test_empty_query_matches_every_scale(self):
+        self.assertEqual(len(scales_containing([])), 12 * 14)
+
+    def test_no_matches(self):
+        self.assertEqual(scales_containing(Note.items()), ())
+
+    def test_pitch_class_set_query(self):
+        notes = [Note.G, Note.B, Note.D]
+        self.assertEqual(scales_containing(PitchClassSet(notes)), scales_containing(notes))
+
+    def test_results_are_cached(self):
+        self.assertIs(scales_containing([Note.F, Note.A]), scales_containing([Note.A, Note.F, Note.A]))
+
 if __name__ == '__main__': # pragma: no cover
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from music_theory.server import (
+    INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR,
+    Client, RpcError, handle_line, start_server,
+)
+
+def _request(method, params=None, request_id=1) -> bytes:
+    request = {"jsonrpc": "2.0", "id": request_id, "method": method}
+
+    if params is not None:
+        request["params"] = params
+
+    return json.dumps(request).encode()
+
+
+class TestHandleLine(unittest.TestCase):
+    def test_result(self):
+        response = json.loads(handle_line(_request("chord", {"root": "A", "type": "Minor"})))
+        self.assertEqual(response, {"jsonrpc": "2.0", "id": 1, "result": {"name": "Am", "notes": ["A", "C", "E"]}})
+
+    def test_positional_params(self):
+        response = json.loads(handle_line(_request("scale", ["D", "Dorian"])))
+        self.assertEqual(response["result"]["notes"], ["D", "E", "F", "G", "A", "B", "C"])
+
+    def test_methods(self):
+        cases = [
+            ("ping", {}, "pong"),
+            ("transpose", {"notes": "C E G", "interval": "P5"}, ["G", "B", "D"]),
+            ("progression", {"root": "G", "numerals": ["I", "V", "vi", "IV"]}, ["GM", "DM", "Em", "CM"]),
+            ("identify_chord", {"notes": ["E", "G", "C"]}, [{"name": "CM", "inversion": 1}]),
+            ("notes_in_chord", {"chord": "x 3 2 0 1 0"}, ["C", "E", "G", "C", "E"]),
+            ("chord_voicings", {"root": "C", "max_fret": 3, "limit": 1}, [[0, 3, 2, 0, 1, 0]]),
+        ]
+
+        for method, params, expected in cases:
+            self.assertEqual(json.loads(handle_line(_request(method, params)))["result"], expected, method)
+
+        key = json.loads(handle_line(_request("key", {"root": "A", "type": "Minor"})))["result"]
+        self.assertEqual((key["name"], key["relative_key"], key["chords"]["i"]), ("A Minor", "C Major", "Am"))
+
+        detected = json.loads(handle_line(_request("detect_key", {"chords": [{"root": "C"}, {"root": "F"}, {"root": "G", "type": "Dominant7"}]})))
+        self.assertEqual(detected["result"][0][0], "C Major")
+
+    def test_batch(self):
+        line = json.dumps([
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {"jsonrpc": "2.0", "method": "ping"},
+            {"jsonrpc": "2.0", "id": 2, "method": "nope"},
+        ])
+        responses = json.loads(handle_line(line))
+
+        self.assertEqual([r["id"] for r in responses], [1, 2])
+        self.assertEqual(responses[0]["result"], "pong")
+        self.assertEqual(responses[1]["error"]["code"], METHOD_NOT_FOUND)
+
+    def test_notifications(self):
+        self.assertIsNone(handle_line(b'{"jsonrpc": "2.0", "method": "ping"}'))
+        self.assertIsNone(handle_line(b'[{"jsonrpc": "2.0", "method": "ping"}]'))
+        self.assertIsNone(handle_line(b"  \n"))
+
+    def test_errors(self):
+        cases = [
+            (b"{", PARSE_ERROR),
+            (b"[]", INVALID_REQUEST),
+            (b'{"id": 1, "method": "ping"}', INVALID_REQUEST),
+            (b'{"jsonrpc": "2.0", "id": 1, "method": "ping", "params": 3}', INVALID_REQUEST),
+            (_request("nope"), METHOD_NOT_FOUND),
+            (_request("chord", {"root": "H"}), INVALID_PARAMS),
+            (_request("chord", {"root": "C", "type": "Nope"}), INVALID_PARAMS),
+            (_request("chord", {"tonic": "C"}), INVALID_PARAMS),
+            (_request("progression", {"root": "C", "numerals": "I V"}), INVALID_PARAMS),
+            (_request("progression", {"root": "C", "numerals": ["I", 5]}), INVALID_PARAMS),
+            (_request("notes_in_chord", {"chord": 320010}), INVALID_PARAMS),
+            (_request("transpose", {"notes": ["C"], "interval": "P5", "direction": 1}), INVALID_PARAMS),
+            (_request("notes_in_chord", {"chord": ["x", 3, 2, 0, 1, 0]}), INVALID_PARAMS),
+            (_request("chord_voicings", {"root": "C", "tuning": ["E", "A", "D", "G", "B", "E"] * 2}), INVALID_PARAMS),
+            (_request("chord_voicings", {"root": "C", "max_span": 12}), INVALID_PARAMS),
+            (_request("chord_voicings", {"root": "C", "max_fret": 25}), INVALID_PARAMS),
+            (_request("chord_voicings", {"root": "C", "max_fret": 1.5}), INVALID_PARAMS),
+            (_request("chord_voicings", {"root": "C", "limit": -1}), INVALID_PARAMS),
+        ]
+
+        for line, code in cases:
+            self.assertEqual(json.loads(handle_line(line))["error"]["code"], code, line)
+
+    def test_errors_are_not_cached(self):
+        handle_line(_request("chord", {"root": "H"}))
+        self.assertEqual(json.loads(handle_line(_request("chord", {"root": "H"})))["error"]["code"], INVALID_PARAMS)
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = await start_server(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_call(self):
+        async with await Client.connect(port=self.port) as client:
+            self.assertEqual(await client.call("progression", root="A", type="Minor", numerals=["i", "iv", "V"]), ["Am", "Dm", "EM"])
+
+            with self.assertRaises(RpcError) as e:
+                await client.call("scale", root="C", type="Nope")
+
+            self.assertEqual(e.exception.code, INVALID_PARAMS)
+            self.assertEqual(await client.call("ping"), "pong")
+
+    async def test_pipelining(self):
+        roots = ["C", "D", "E", "F", "G", "A", "B"] * 20
+
+        async with await Client.connect(port=self.port) as client:
+            results = await asyncio.gather(*(client.call("chord", root=root) for root in roots))
+
+        self.assertEqual([result["name"] for result in results], [f"{root}M" for root in roots])
+
+    async def test_batch(self):
+        async with await Client.connect(port=self.port) as client:
+            await client.notify("ping")
+            results = await client.batch([("ping", {}), ("chord", {"root": "H"}), ("modes", {"root": "C"})])
+
+        self.assertEqual(results[0], "pong")
+        self.assertIsInstance(results[1], RpcError)
+        self.assertEqual(results[2][:2], ["C Ionian", "D Dorian"])
+
+    async def test_closed_connection(self):
+        client = await Client.connect(port=self.port)
+        await client.close()
+
+        with self.assertRaises(ConnectionError):
+            await client.call("ping")
+
+    @unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "Unix sockets are not available")
+    async def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "theory.sock")
+            server = await start_server(path=path)
+
+            try:
+                async with await Client.connect(path=path) as client:
+                    self.assertEqual(await client.call("ping"), "pong")
+            finally:
+                server.close()
+                await server.wait_closed()
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
@@ -20,6 +20,14 @@ class TestInstrumentCreation(unittest.TestCase):
     def test_custom_instrument_no_strings(self):
         self.assertRaises(ValueError, StringInstrument, [])
 
+    def test_has_no_instance_dict(self):
+        guitar = create_standard_guitar()
+
+        self.assertFalse(hasattr(guitar, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            guitar.extra = 1
+
     def test_tuning_intervals_00(self):
         intervals = [Interval.Unison, Interval.P4, Interval.P4, Interval.P4, Interval.M3, Interval.P4]
         instrument = StringInstrument.from_tuning_intervals(Note.E, intervals)
@@ -116,6 +124,64 @@ class TestInstrumentNoteAtFret(unittest.TestCase):
         self.assertEqual(note, expected)
 
 
+    def test_note_at_fret_beyond_fretboard(self):
+        self.assertEqual(create_standard_guitar().note_at_fret(0, 29), Note.A)
+
+
+class TestInstrumentFretboard(unittest.TestCase):
+    def test_fretboard_is_shared_by_tuning(self):
+        self.assertIs(create_standard_guitar().fretboard, create_standard_guitar().fretboard)
+
+    def test_positions_of(self):
+        positions = create_standard_guitar().positions_of(Note.Eb)
+        self.assertEqual(positions[:2], ((0, 11), (0, 23)))
+
+    def test_add_capo_refreshes_fretboard(self):
+        guitar = create_standard_guitar()
+        _ = guitar.fretboard
+        guitar.add_capo(2)
+
+        self.assertEqual(guitar.note_at_fret(0, 0), Note.Gb)
+        self.assertEqual(guitar.fretboard.tuning, tuple(guitar.tuning))
+
+    def test_detune_refreshes_fretboard(self):
+        guitar = create_standard_guitar()
+        _ = guitar.fretboard
+        guitar.detune(Interval.M2)
+
+        self.assertEqual(guitar.note_at_fret(0, 0), Note.D)
+        self.assertIs(guitar.fretboard, D_STANDARD_GUITAR.fretboard)
+
+    def test_assigning_tuning_refreshes_fretboard(self):
+        guitar = create_standard_guitar()
+        _ = guitar.fretboard
+        guitar.tuning[0] = Note.D
+
+        self.assertEqual(guitar.note_at_fret(0, 0), Note.D)
+        self.assertIn((0, 0), guitar.positions_of(Note.D))
+
+        guitar.tuning = [Note.B] + guitar.tuning
+
+        self.assertEqual(guitar.num_strings, 7)
+        self.assertEqual(guitar.note_at_fret(6, 0), Note.E)
+        self.assertEqual(guitar.fretboard.tuning, tuple(guitar.tuning))
+
+    def test_adjust_string_refreshes_fretboard(self):
+        guitar = create_standard_guitar()
+        _ = guitar.fretboard
+        guitar.adjust_string(0, Interval.M2, "d")
+
+        self.assertIn((0, 0), guitar.positions_of(Note.D))
+
+
+class TestInstrumentChordVoicings(unittest.TestCase):
+    def test_chord_voicings(self):
+        from music_theory.chords import Chord
+        voicings = create_standard_guitar().chord_voicings(Chord(Note.C), max_fret=3)
+
+        self.assertIn((None, 3, 2, 0, 1, 0), voicings)
+
+
 class TestInstrumentNoteInChord(unittest.TestCase):
     def test_notes_in_chord_to_few_strings(self):
         self.assertRaises(ValueError, create_standard_guitar().notes_in_chord, "x x 3 x 6")
@@ -185,7 +251,23 @@ class TestInstrumentIntervalsInChord(unittest.TestCase):
 
 
 class TestInstrumentNotesInRiff(unittest.TestCase):
-    pass
+    def test_notes_in_riff_hammer_on(self):
+        riff = "e|-----|\nB|-----|\nG|-----|\nD|-----|\nA|-3h5-|\nE|-----|"
+        notes = create_standard_guitar().notes_in_riff(riff)
+
+        self.assertEqual(notes, [Note.C, Note.D])
+
+    def test_notes_in_riff_chord_is_lowest_string_first(self):
+        riff = "e|-0-|\nB|-1-|\nG|-0-|\nD|-2-|\nA|-3-|\nE|---|"
+        notes = create_standard_guitar().notes_in_riff(riff)
+
+        self.assertEqual(notes, create_standard_guitar().notes_in_chord("x 3 2 0 1 0"))
+
+    def test_notes_in_riff_skips_muted_notes(self):
+        riff = "e|-x-0-|\nB|-----|\nG|-----|\nD|-----|\nA|-----|\nE|-----|"
+        notes = create_standard_guitar().notes_in_riff(riff)
+
+        self.assertEqual(notes, [Note.E])
 
 
 class TestInstrumentStringRepresentation(unittest.TestCase):
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+
+from music_theory.notes import Note
+from music_theory.string_instrument import StringInstrument
+from music_theory.instrument_creator import create_standard_guitar, create_standard_bass
+from music_theory.tab_parser import TabEvent, parse_tab, parse_tab_file
+
+TAB = """\
+Intro riff
+e|-----0-----|
+B|---1---1---|
+G|-0-------0-|
+D|-----------|
+A|-3-----3h5-|
+E|-----------|
+
+e|-12p10--x--|
+B|-----------|
+G|-----------|
+D|-----------|
+A|-----------|
+E|-0/3-5\\3---|
+"""
+
+
+class TestParseTab(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.events = list(parse_tab(create_standard_guitar(), TAB))
+
+    def test_events_are_time_ordered(self):
+        times = [e.time for e in self.events]
+        self.assertEqual(times, sorted(times))
+
+    def test_first_staff(self):
+        result = [(e.time, e.string_index, e.fret, e.note, e.technique) for e in self.events[:3]]
+        expected = [
+            (1, 1, 3, Note.C, ''),
+            (1, 3, 0, Note.G, ''),
+            (3, 4, 1, Note.C, ''),
+        ]
+
+        self.assertEqual(result, expected)
+
+    def test_hammer_on(self):
+        self.assertIn(TabEvent(9, 1, 5, Note.D, 'h'), self.events)
+
+    def test_second_staff_continues_time(self):
+        second = [e for e in self.events if e.time >= 13]
+
+        self.assertEqual(second[:2], [TabEvent(13, 0, 0, Note.E, ''), TabEvent(13, 5, 12, Note.E, '')])
+
+    def test_multi_digit_pull_off(self):
+        self.assertIn(TabEvent(16, 5, 10, Note.D, 'p'), self.events)
+
+    def test_slides(self):
+        self.assertIn(TabEvent(15, 0, 3, Note.G, '/'), self.events)
+        self.assertIn(TabEvent(19, 0, 3, Note.G, '\\'), self.events)
+
+    def test_muted_note(self):
+        self.assertIn(TabEvent(20, 5, None, None, 'x'), self.events)
+
+    def test_uses_instrument_tuning(self):
+        bass_tab = "G|-----|\nD|-----|\nA|-----|\nE|-0-3-|"
+        notes = [e.note for e in parse_tab(create_standard_bass(), bass_tab)]
+
+        self.assertEqual(notes, [Note.E, Note.G])
+
+    def test_low_string_first(self):
+        tab = "E|-3-|\ne|---|"
+        instrument = StringInstrument([Note.E, Note.E])
+
+        event = next(parse_tab(instrument, tab, high_string_first=False))
+
+        self.assertEqual(event.string_index, 0)
+
+    def test_incomplete_staff_is_ignored(self):
+        tab = "e|-0-|\nB|-1-|\nlyrics go here\n"
+        self.assertEqual(list(parse_tab(create_standard_guitar(), tab)), [])
+
+    def test_headings_are_not_staff_lines(self):
+        headed = TAB.replace("Intro riff", "Intro").replace("\n\ne|", "\nVerse-1\n-----------\ne|")
+        self.assertEqual(list(parse_tab(create_standard_guitar(), headed)), self.events)
+
+    def test_is_lazy(self):
+        def lines():
+            yield from TAB.splitlines()[:7]
+            raise AssertionError("read too far")
+
+        events = parse_tab(create_standard_guitar(), lines())
+
+        self.assertEqual(next(events).note, Note.C)
+
+
+class TestParseTabFile(unittest.TestCase):
+    def test_parse_file(self):
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False) as f:
+            f.write(TAB)
+
+        try:
+            result = list(parse_tab_file(create_standard_guitar(), f.name))
+        finally:
+            os.remove(f.name)
+
+        self.assertEqual(result, list(parse_tab(create_standard_guitar(), TAB)))
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()
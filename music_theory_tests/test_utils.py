@@ -1,6 +1,6 @@
 import unittest
 
-from music_theory.utils import UP_DIRECTIONS, DOWN_DIRECTIONS, index_to_range, list_rotations, is_valid_note_str
+from music_theory.utils import UP_DIRECTIONS, DOWN_DIRECTIONS, index_to_range, direction_sign, list_rotations, is_valid_note_str
 
 class TestUtilsIndexToRange(unittest.TestCase):
     def test_index_to_range_negative_00(self):
@@ -42,6 +42,18 @@ class TestUtilsDirections(unittest.TestCase):
         self.assertNotIn('downy', DOWN_DIRECTIONS)
 
 
+    def test_direction_sign_up(self):
+        for direction in UP_DIRECTIONS + ["U", "Up", "ABOVE"]:
+            self.assertEqual(direction_sign(direction), 1)
+
+    def test_direction_sign_down(self):
+        for direction in DOWN_DIRECTIONS + ["D", "Down", "BELOW"]:
+            self.assertEqual(direction_sign(direction), -1)
+
+    def test_direction_sign_unrecognized(self):
+        self.assertRaises(ValueError, direction_sign, "sideways")
+
+
 class TestUtilsListRotations(unittest.TestCase):
     def test_list_rotations_empty(self):
         l = []
@@ -0,0 +1,115 @@
+import itertools
+import unittest
+
+from music_theory.notes import Note
+from music_theory.chords import Chord
+from music_theory.chord_type import ChordType
+from music_theory.pitch_class_set import PitchClassSet
+from music_theory.instrument_creator import create_standard_guitar, create_ukulele
+from music_theory.voicings import find_voicings, voicing_to_string
+
+
+def brute_force(instrument, notes, max_span, max_fret, bass=None, allow_muted=True):
+    """ Checks every combination of frets, for comparison with the search. """
+    target = set(notes)
+    options = list(range(max_fret + 1)) + ([None] if allow_muted else [])
+    results = []
+
+    for voicing in itertools.product(options, repeat=instrument.num_strings):
+        sounded = [instrument.note_at_fret(s, f) for s, f in enumerate(voicing) if f is not None]
+        fretted = [f for f in voicing if f]
+
+        if set(sounded) != target:
+            continue
+        if fretted and max(fretted) - min(fretted) > max_span:
+            continue
+        if bass is not None and sounded[0] != bass:
+            continue
+
+        results.append(voicing)
+
+    return results
+
+
+class TestFindVoicings(unittest.TestCase):
+    def test_open_chords_found(self):
+        guitar = create_standard_guitar()
+
+        self.assertIn((None, 3, 2, 0, 1, 0), find_voicings(guitar, Chord(Note.C)))
+        self.assertIn((None, None, 0, 2, 3, 2), find_voicings(guitar, Chord(Note.D)))
+        self.assertIn((0, 2, 2, 1, 0, 0), find_voicings(guitar, Chord(Note.E)))
+
+    def test_every_voicing_plays_the_chord(self):
+        guitar = create_standard_guitar()
+        chord = Chord(Note.A, ChordType.Minor7)
+
+        for voicing in find_voicings(guitar, chord):
+            notes = guitar.notes_in_chord(voicing_to_string(voicing))
+            self.assertEqual(set(notes), set(chord.notes))
+
+    def test_matches_brute_force(self):
+        ukulele = create_ukulele()
+
+        for chord, bass in [(Chord(Note.C), None), (Chord(Note.G, ChordType.Dominant7), None), (Chord(Note.F), Note.A)]:
+            result = find_voicings(ukulele, chord, max_span=2, max_fret=7, bass=bass)
+            expected = brute_force(ukulele, chord.notes, 2, 7, bass)
+
+            self.assertEqual(sorted(result, key=str), sorted(expected, key=str))
+
+    def test_max_fret(self):
+        voicings = find_voicings(create_standard_guitar(), Chord(Note.C), max_fret=5)
+        self.assertTrue(all(f <= 5 for v in voicings for f in v if f is not None))
+
+    def test_max_span(self):
+        voicings = find_voicings(create_standard_guitar(), Chord(Note.C), max_span=2)
+
+        for voicing in voicings:
+            fretted = [f for f in voicing if f]
+            self.assertLessEqual(max(fretted, default=0) - min(fretted, default=0), 2)
+
+    def test_bass_note(self):
+        guitar = create_standard_guitar()
+
+        for voicing in find_voicings(guitar, Chord(Note.C), bass=Note.E):
+            self.assertEqual(guitar.notes_in_chord(voicing_to_string(voicing))[0], Note.E)
+
+    def test_no_muted_strings(self):
+        voicings = find_voicings(create_standard_guitar(), Chord(Note.C), allow_muted=False, max_fret=3)
+        self.assertIn((0, 3, 2, 0, 1, 0), voicings)
+        self.assertTrue(all(None not in v for v in voicings))
+
+    def test_note_collections(self):
+        guitar = create_standard_guitar()
+        chord = Chord(Note.G)
+
+        self.assertEqual(find_voicings(guitar, chord), find_voicings(guitar, chord.pitch_classes))
+        self.assertEqual(find_voicings(guitar, chord), find_voicings(guitar, [Note.D, Note.B, Note.G]))
+
+    def test_results_are_cached_per_tuning(self):
+        self.assertIs(find_voicings(create_standard_guitar(), Chord(Note.C)),
+                      find_voicings(create_standard_guitar(), Chord(Note.C)))
+
+    def test_impossible_chord(self):
+        self.assertEqual(find_voicings(create_ukulele(), [Note.C, Note.D, Note.E, Note.F, Note.G]), ())
+
+    def test_invalid_arguments(self):
+        guitar = create_standard_guitar()
+
+        self.assertRaises(ValueError, find_voicings, guitar, Chord(Note.C), max_span=-1)
+        self.assertRaises(ValueError, find_voicings, guitar, Chord(Note.C), max_fret=-1)
+        self.assertRaises(ValueError, find_voicings, guitar, PitchClassSet())
+
+
+class TestVoicingToString(unittest.TestCase):
+    def test_voicing_to_string(self):
+        self.assertEqual(voicing_to_string((None, 3, 2, 0, 1, 0)), "x 3 2 0 1 0")
+
+    def test_round_trip_with_notes_in_chord(self):
+        guitar = create_standard_guitar()
+        notes = guitar.notes_in_chord(voicing_to_string((None, None, 0, 2, 3, 2)))
+
+        self.assertEqual(notes, [Note.D, Note.A, Note.D, Note.Gb])
+
+
+if __name__ == '__main__': # pragma: no cover
+    unittest.main()